@@ -95,6 +95,7 @@ METEORA_API_URL = "https://dlmm-api.meteora.ag"
 # Google News RSS Feed
 GOOGLE_NEWS_RSS_URL_TEMPLATE = "https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
 GOOGLE_NEWS_CACHE_TTL_SECONDS = 1800
+GOOGLE_NEWS_CACHE_MAX_ENTRIES = 1024  # LRU bound on cached validation results
 
 # GoPlusLabs Security API
 GOPLUS_API_URL = "https://api.gopluslabs.io/api/v1/token_security/solana"
@@ -147,6 +148,7 @@ EMA_LONG_PERIOD = 21
 MACD_FAST = 12
 MACD_SLOW = 26
 MACD_SIGNAL = 9
+TECHNICALS_CACHE_MAX_ENTRIES = 256  # LRU bound on cached per-pool signals
 
 # ============================================================================
 # LIQUIDITY ANALYSIS THRESHOLDS
@@ -166,6 +168,7 @@ PUMP_FUN_PROGRAM_ID = "6EF8rQNxjNDoERZkwPost5FDE7vaKc27NSMqRyAZLt4e"
 # ============================================================================
 
 API_TIMEOUT_SECONDS = 10  # Timeout for HTTP requests
+SECURITY_IO_TIMEOUT_SECONDS = 15  # Max wait per parallel shield fetch (HTTP timeout + rate-limit slack)
 MAX_RETRIES = 3  # Maximum retries for API calls
 RETRY_BACKOFF_FACTOR = 2  # Exponential backoff multiplier
 
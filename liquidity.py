@@ -12,12 +12,13 @@ Shapes:
 Reference: system_prompt.md Section 2.2 (Liquidity Shapes as Sentiment Map)
 """
 
+import asyncio
 import logging
 from enum import Enum
-from typing import Any, Dict, List, Optional
-from statistics import variance, mean
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
+import numpy as np
 
 from config import METEORA_API_URL, API_TIMEOUT_SECONDS
 
@@ -37,35 +38,103 @@ class LiquidityShape(Enum):
     BID_ASK = "BID_ASK"
 
 
-async def fetch_dlmm_pool(pair_address: str) -> Optional[Dict[str, Any]]:
+def _bin_amounts(bin_data: Dict[str, Any]) -> Tuple[float, float]:
     """
-    Fetch DLMM pool data from Meteora API.
+    Parse (x_amount, y_amount) for a bin.
+    
+    Args:
+        bin_data: Single bin dict
+        
+    Returns:
+        Amounts as floats, (0.0, 0.0) if either is invalid
+    """
+    try:
+        x_amount = float(bin_data.get("x_amount", 0) or 0)
+        y_amount = float(bin_data.get("y_amount", 0) or 0)
+        return x_amount, y_amount
+    except (ValueError, TypeError):
+        return 0.0, 0.0
+
+
+def _build_bin_arrays(bins: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Convert the bin list into parallel arrays sorted by bin_id.
+    
+    Amounts are float64 rather than int64: on-chain amounts are u64 and
+    can exceed the int64 range.
+    
+    Args:
+        bins: List of bin dicts from Meteora API
+        
+    Returns:
+        Dict with "ids", "x" and "y" arrays of equal length
+    """
+    bins = [bin_data for bin_data in bins if isinstance(bin_data, dict)]
+    ids = np.array([bin_data.get("bin_id", 0) for bin_data in bins], dtype=np.int64)
+    amounts = np.array([_bin_amounts(bin_data) for bin_data in bins], dtype=np.float64).reshape(-1, 2)
+    
+    order = np.argsort(ids, kind="stable")
+    return {
+        "ids": ids[order],
+        "x": amounts[order, 0],
+        "y": amounts[order, 1],
+    }
+
+
+def _index_bins(pool_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Attach precomputed bin lookups to fetched pool data.
+    
+    Built once per fetch:
+    - "_bin_index": bin_id -> bin dict, for O(1) active bin lookups
+    - "bin_arrays": sorted parallel arrays consumed by the shape classifier
+    
+    Args:
+        pool_data: DLMM pool data from Meteora API
+        
+    Returns:
+        The same dict with "_bin_index" and "bin_arrays" entries added
+    """
+    bins = pool_data.get("bins") or []
+    pool_data["_bin_index"] = {
+        bin_data.get("bin_id"): bin_data
+        for bin_data in bins
+        if isinstance(bin_data, dict)
+    }
+    pool_data["bin_arrays"] = _build_bin_arrays(bins)
+    return pool_data
+
+
+async def _fetch_dlmm_pool_with_session(
+    session: aiohttp.ClientSession,
+    pair_address: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a single DLMM pool using an existing HTTP session.
     
     Args:
+        session: Open aiohttp session (shared across batch fetches)
         pair_address: The Meteora DLMM pool address
         
     Returns:
         Pool data dict if found, None if not found or error (fail-open)
-        
-    Note:
-        Implements fail-open pattern - returns None on any error
-        to allow graceful degradation in the pipeline.
     """
     url = f"{METEORA_API_URL}/pair/{pair_address}"
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SECONDS)) as response:
-                if response.status == 404:
-                    logger.debug(f"DLMM pool not found: {pair_address}")
-                    return None
-                    
-                if response.status != 200:
-                    logger.warning(f"Meteora API returned status {response.status} for {pair_address}")
-                    return None
-                    
-                data = await response.json()
-                return data
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SECONDS)) as response:
+            if response.status == 404:
+                logger.debug(f"DLMM pool not found: {pair_address}")
+                return None
+                
+            if response.status != 200:
+                logger.warning(f"Meteora API returned status {response.status} for {pair_address}")
+                return None
+                
+            data = await response.json()
+            if isinstance(data, dict):
+                _index_bins(data)
+            return data
                 
     except aiohttp.ClientError as e:
         logger.warning(f"Network error fetching DLMM pool {pair_address}: {e}")
@@ -75,6 +144,55 @@ async def fetch_dlmm_pool(pair_address: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+async def fetch_dlmm_pool(pair_address: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch DLMM pool data from Meteora API.
+    
+    Args:
+        pair_address: The Meteora DLMM pool address
+        
+    Returns:
+        Pool data dict (with a "_bin_index" lookup table) if found,
+        None if not found or error (fail-open)
+        
+    Note:
+        Implements fail-open pattern - returns None on any error
+        to allow graceful degradation in the pipeline.
+    """
+    try:
+        async with aiohttp.ClientSession() as session:
+            return await _fetch_dlmm_pool_with_session(session, pair_address)
+    except Exception as e:
+        logger.error(f"Unexpected error fetching DLMM pool {pair_address}: {e}")
+        return None
+
+
+async def fetch_dlmm_pools(addresses: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Fetch several DLMM pools concurrently over one shared session.
+    
+    Args:
+        addresses: Meteora DLMM pool addresses
+        
+    Returns:
+        Pool data (or None on failure) for each address, in input order
+    """
+    if not addresses:
+        return []
+    
+    try:
+        async with aiohttp.ClientSession() as session:
+            results = await asyncio.gather(
+                *[_fetch_dlmm_pool_with_session(session, address) for address in addresses],
+                return_exceptions=True,
+            )
+    except Exception as e:
+        logger.error(f"Unexpected error batch-fetching {len(addresses)} DLMM pools: {e}")
+        return [None] * len(addresses)
+    
+    return [None if isinstance(result, BaseException) else result for result in results]
+
+
 def get_active_bin(pool_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     """
     Extract the active bin from pool data.
@@ -94,6 +212,11 @@ def get_active_bin(pool_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, An
     active_id = pool_data.get("active_id")
     if active_id is None:
         return None
+    
+    # Fast path: index built by fetch_dlmm_pool
+    bin_index = pool_data.get("_bin_index")
+    if bin_index is not None:
+        return bin_index.get(active_id)
         
     bins = pool_data.get("bins", [])
     if not bins:
@@ -106,83 +229,57 @@ def get_active_bin(pool_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, An
     return None
 
 
-def _get_bin_liquidity(bin_data: Dict[str, Any]) -> float:
-    """
-    Calculate total liquidity in a bin.
-    
-    Args:
-        bin_data: Single bin dict
-        
-    Returns:
-        Total liquidity as float (x_amount + y_amount)
-    """
-    try:
-        x_amount = float(bin_data.get("x_amount", 0) or 0)
-        y_amount = float(bin_data.get("y_amount", 0) or 0)
-        return x_amount + y_amount
-    except (ValueError, TypeError):
-        return 0.0
-
-
-def _calculate_distribution_metrics(bins: List[Dict[str, Any]], active_id: Optional[int]) -> Dict[str, float]:
+def _calculate_distribution_metrics(liquidities: np.ndarray) -> Dict[str, float]:
     """
     Calculate statistical metrics for liquidity distribution.
     
     Args:
-        bins: List of bin data
-        active_id: The active bin ID
+        liquidities: Per-bin liquidity (x + y), ordered by bin_id
         
     Returns:
         Dict with metrics: center_weight, edge_weight, uniformity_score, max_ratio
     """
-    if not bins:
+    n = len(liquidities)
+    if n == 0:
         return {"center_weight": 0, "edge_weight": 0, "uniformity_score": 0, "max_ratio": 1.0}
-        
-    # Sort bins by bin_id
-    sorted_bins = sorted(bins, key=lambda b: b.get("bin_id", 0))
     
-    # Get liquidity values
-    liquidities = [_get_bin_liquidity(b) for b in sorted_bins]
-    total_liquidity = sum(liquidities)
+    total_liquidity = float(liquidities.sum())
     
     if total_liquidity == 0:
         return {"center_weight": 0, "edge_weight": 0, "uniformity_score": 1.0, "max_ratio": 1.0}
     
-    # Normalize
-    normalized = [liq / total_liquidity for liq in liquidities]
-    n = len(normalized)
-    
     if n < 3:
         # Too few bins to classify meaningfully
         return {"center_weight": 0.5, "edge_weight": 0.5, "uniformity_score": 1.0, "max_ratio": 1.0}
     
+    # Normalize
+    normalized = liquidities / total_liquidity
+    
     # Calculate center vs edge weights
     # For 11 bins: edge_size=2 (bins 0,1 and 9,10), center is bins 2-8
     edge_size = max(1, n // 4)
-    center_start = edge_size
-    center_end = n - edge_size
     
-    left_edge = sum(normalized[:edge_size])
-    right_edge = sum(normalized[-edge_size:])
-    center = sum(normalized[center_start:center_end])
+    left_edge = normalized[:edge_size].sum()
+    right_edge = normalized[-edge_size:].sum()
+    center = normalized[edge_size:n - edge_size].sum()
     
-    edge_weight = left_edge + right_edge
-    center_weight = center
+    edge_weight = float(left_edge + right_edge)
+    center_weight = float(center)
     
     # Max ratio: how much larger is max bin compared to min bin
-    max_liq = max(liquidities)
-    min_liq = min(liquidities) if min(liquidities) > 0 else 1.0
+    max_liq = float(liquidities.max())
+    min_liq = float(liquidities.min())
+    if min_liq <= 0:
+        min_liq = 1.0
     max_ratio = max_liq / min_liq
     
     # Uniformity score based on coefficient of variation
-    if n > 1 and mean(liquidities) > 0:
-        try:
-            std_dev = variance(liquidities) ** 0.5
-            cv = std_dev / mean(liquidities)  # Coefficient of variation
-            # CV < 0.2 is very uniform, CV > 1.0 is highly variable
-            uniformity_score = max(0, 1.0 - cv)
-        except Exception:
-            uniformity_score = 0.5
+    mean_liq = float(liquidities.mean())
+    if mean_liq > 0:
+        std_dev = float(liquidities.std(ddof=1))
+        cv = std_dev / mean_liq  # Coefficient of variation
+        # CV < 0.2 is very uniform, CV > 1.0 is highly variable
+        uniformity_score = max(0.0, 1.0 - cv)
     else:
         uniformity_score = 1.0
     
@@ -212,17 +309,28 @@ def classify_liquidity_shape(pool_data: Optional[Dict[str, Any]]) -> Optional[Li
     if pool_data is None:
         return None
         
-    bins = pool_data.get("bins", [])
-    if not bins:
+    # Degenerate pools are decided before any array work
+    bins = pool_data.get("bins") or []
+    n = len(bins)
+    if n == 0:
         return None
         
-    active_id = pool_data.get("active_id")
-    
     # Single or two bins = default to SPOT
-    if len(bins) <= 2:
+    if n <= 2:
         return LiquidityShape.SPOT
     
-    metrics = _calculate_distribution_metrics(bins, active_id)
+    # Fetched pools carry precomputed arrays; hand-built dicts are converted here
+    bin_arrays = pool_data.get("bin_arrays")
+    if bin_arrays is None:
+        bin_arrays = _build_bin_arrays(bins)
+    
+    liquidities = bin_arrays["x"] + bin_arrays["y"]
+    
+    # No liquidity anywhere = nothing to measure, treat as uniform
+    if not liquidities.any():
+        return LiquidityShape.SPOT
+    
+    metrics = _calculate_distribution_metrics(liquidities)
     
     uniformity = metrics["uniformity_score"]
     center_weight = metrics["center_weight"]
@@ -249,6 +357,26 @@ def classify_liquidity_shape(pool_data: Optional[Dict[str, Any]]) -> Optional[Li
     return LiquidityShape.SPOT
 
 
+def _build_liquidity_result(
+    pair_address: str,
+    pool_data: Optional[Dict[str, Any]],
+) -> Optional[Dict[str, Any]]:
+    """Build the analysis result dict for fetched pool data."""
+    if pool_data is None:
+        return None
+    
+    shape = classify_liquidity_shape(pool_data)
+    active_bin = get_active_bin(pool_data)
+    
+    return {
+        "pool_address": pair_address,
+        "shape": shape,
+        "active_bin": active_bin,
+        "bin_step": pool_data.get("bin_step"),
+        "pool_name": pool_data.get("name"),
+    }
+
+
 async def analyze_liquidity(pair_address: str) -> Optional[Dict[str, Any]]:
     """
     Perform comprehensive liquidity analysis on a DLMM pool.
@@ -271,16 +399,23 @@ async def analyze_liquidity(pair_address: str) -> Optional[Dict[str, Any]]:
     """
     pool_data = await fetch_dlmm_pool(pair_address)
     
-    if pool_data is None:
-        return None
+    return _build_liquidity_result(pair_address, pool_data)
+
+
+async def analyze_liquidity_batch(addresses: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Analyze several DLMM pools, fetching them concurrently.
     
-    shape = classify_liquidity_shape(pool_data)
-    active_bin = get_active_bin(pool_data)
+    Args:
+        addresses: Meteora DLMM pool addresses
+        
+    Returns:
+        Analysis result (same shape as analyze_liquidity) or None for
+        each address, in input order
+    """
+    pools = await fetch_dlmm_pools(addresses)
     
-    return {
-        "pool_address": pair_address,
-        "shape": shape,
-        "active_bin": active_bin,
-        "bin_step": pool_data.get("bin_step"),
-        "pool_name": pool_data.get("name"),
-    }
+    return [
+        _build_liquidity_result(address, pool_data)
+        for address, pool_data in zip(addresses, pools)
+    ]
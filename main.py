@@ -47,11 +47,11 @@ from network_layer import WebSocketManager, TokenEvent
 from polymarket_watcher import fetch_events
 from brain import extract_keywords, analyze_with_llm
 from shield import comprehensive_security_check, _get_token_data_from_dexscreener
-from momentum import classify_pump_phase, check_staleness, calculate_price_velocity, get_buy_sell_ratio, analyze_momentum
+from momentum import get_token_age_hours, classify_pump_phase, check_staleness, calculate_price_velocity, get_buy_sell_ratio, analyze_momentum
 from scoring import calculate_composite_score, should_alert, format_score_telegram_message
 from state import StateManager
 from dex_hunter import format_usd
-from technicals import get_technical_signals
+from technicals import get_technical_signals, close_session as close_technicals_session
 from liquidity import analyze_liquidity
 
 # Initialize colorama
@@ -271,8 +271,9 @@ async def handle_token_event(event: TokenEvent) -> None:
         # =================================================================
         logger.info(f"\n[TIER 1] Momentum Analysis...")
         
+        token_age_hours = get_token_age_hours(token_data)
         pump_phase = classify_pump_phase(token_data)
-        is_stale = check_staleness(token_data)
+        is_stale = check_staleness(token_data, token_age_hours)
         price_velocity = calculate_price_velocity(token_data)
         buy_sell_ratio = get_buy_sell_ratio(token_data)
         
@@ -362,7 +363,7 @@ async def handle_token_event(event: TokenEvent) -> None:
         # Run blocking security check in executor
         shield_result = await loop.run_in_executor(
             _executor,
-            partial(comprehensive_security_check, mint_address, token_data, verbose=False)
+            partial(comprehensive_security_check, mint_address, token_data, verbose=False, fast_fail=True)
         )
         
         is_safe = shield_result.get("is_safe", False)
@@ -416,11 +417,7 @@ async def handle_token_event(event: TokenEvent) -> None:
         logger.info(f"\n[SCORING] Calculating composite score...")
         
         # Use enhanced analyze_momentum which integrates technical signals
-        momentum_result = analyze_momentum(token_data, technical_signals)
-        
-        # Ensure buy_sell_ratio is properly set for backward compatibility
-        if momentum_result.get("buy_sell_ratio") == float('inf'):
-            momentum_result["buy_sell_ratio"] = 1.0
+        momentum_result = analyze_momentum(token_data, technical_signals, token_age_hours)
         
         score_data = calculate_composite_score(
             shield_result=shield_result,
@@ -561,6 +558,7 @@ async def run_orchestrator() -> None:
         logger.info("Orchestrator cancelled")
     finally:
         await manager.stop_monitoring()
+        await close_technicals_session()
         if narrative_task:
             narrative_task.cancel()
         
@@ -9,15 +9,46 @@ Key Functions:
 - classify_pump_phase(): Determine EARLY or LATE pump phase
 - check_staleness(): Identify tokens with no recent price movement
 - get_buy_sell_ratio(): Calculate buying pressure vs selling pressure
+- get_token_age_hours(): Parse token age once so callers can pass it to the checks
 """
 
 import logging
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 
 import config
 
 logger = logging.getLogger(__name__)
 
+# Cap for buy/sell ratio when there are no sells (finite stand-in for infinity)
+MAX_BUY_SELL_RATIO = 1e6
+
+
+def get_token_age_hours(token_data: Dict[str, Any]) -> float:
+    """
+    Get token age in hours from the createdAt ISO timestamp.
+    
+    Compute it once per token and pass it as token_age_hours to
+    check_staleness() and analyze_momentum() to avoid re-parsing.
+    
+    Args:
+        token_data: Token data from DexScreener API response
+        
+    Returns:
+        Age in hours, or 0.0 if createdAt is missing or unparseable
+    """
+    created_at = token_data.get("createdAt")
+    if not created_at:
+        return 0.0
+    
+    try:
+        created_time = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+        now = datetime.now(timezone.utc)
+        return (now - created_time).total_seconds() / 3600
+    except (ValueError, AttributeError, TypeError):
+        logger.warning(f"Could not parse createdAt: {created_at}")
+        return 0.0
+
 
 def calculate_price_velocity(token_data: Dict[str, Any]) -> float:
     """
@@ -64,7 +95,8 @@ def get_buy_sell_ratio(token_data: Dict[str, Any]) -> Optional[float]:
         token_data: Token data from DexScreener API response
         
     Returns:
-        Float representing buys/sells ratio (e.g., 1.5 = 50% more buys than sells)
+        Float representing buys/sells ratio (e.g., 1.5 = 50% more buys than sells),
+        capped at MAX_BUY_SELL_RATIO (returned when there are buys but no sells)
         Returns None if data unavailable
         
     Example:
@@ -95,10 +127,10 @@ def get_buy_sell_ratio(token_data: Dict[str, Any]) -> Optional[float]:
         
         # Avoid division by zero
         if sells == 0:
-            # If no sells and some buys, ratio is very high (infinite buying pressure)
-            return float('inf') if buys > 0 else 1.0
+            # If no sells and some buys, buying pressure is maxed out
+            return MAX_BUY_SELL_RATIO if buys > 0 else 1.0
         
-        return buys / sells
+        return min(buys / sells, MAX_BUY_SELL_RATIO)
         
     except (TypeError, ValueError) as e:
         logger.warning(f"Error calculating buy/sell ratio: {e}")
@@ -170,7 +202,8 @@ def check_staleness(token_data: Dict[str, Any], token_age_hours: Optional[float]
     
     Args:
         token_data: Token data from DexScreener API response
-        token_age_hours: Token age in hours. If None, uses age from token_data.
+        token_age_hours: Token age in hours. If None, uses age from token_data
+            (the createdAt timestamp).
         
     Returns:
         True if token is stale, False otherwise
@@ -190,19 +223,7 @@ def check_staleness(token_data: Dict[str, Any], token_age_hours: Optional[float]
         
         # Use provided age or extract from token_data
         if token_age_hours is None:
-            # Try to get age from token_data (createdAt timestamp)
-            created_at = token_data.get("createdAt")
-            if created_at:
-                from datetime import datetime, timezone
-                try:
-                    created_time = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    now = datetime.now(timezone.utc)
-                    token_age_hours = (now - created_time).total_seconds() / 3600
-                except (ValueError, AttributeError):
-                    logger.warning(f"Could not parse createdAt: {created_at}")
-                    token_age_hours = 0
-            else:
-                token_age_hours = 0
+            token_age_hours = get_token_age_hours(token_data)
         
         # Check staleness conditions
         is_old = token_age_hours > config.MAX_TOKEN_AGE_HOURS
@@ -231,6 +252,7 @@ def check_staleness(token_data: Dict[str, Any], token_age_hours: Optional[float]
 def analyze_momentum(
     token_data: Dict[str, Any],
     technical_signals: Optional[Dict[str, Any]] = None,
+    token_age_hours: Optional[float] = None,
 ) -> Dict[str, Any]:
     """
     Perform comprehensive momentum analysis combining basic metrics with technical signals.
@@ -242,6 +264,7 @@ def analyze_momentum(
     Args:
         token_data: Token data from DexScreener API response
         technical_signals: Optional result from technicals.get_technical_signals()
+        token_age_hours: Token age in hours, passed through to check_staleness()
     
     Returns:
         Dict with comprehensive momentum analysis:
@@ -259,7 +282,7 @@ def analyze_momentum(
     price_velocity = calculate_price_velocity(token_data)
     buy_sell_ratio = get_buy_sell_ratio(token_data)
     pump_phase = classify_pump_phase(token_data)
-    is_stale = check_staleness(token_data)
+    is_stale = check_staleness(token_data, token_age_hours)
     
     result = {
         "price_velocity": price_velocity,
@@ -277,8 +300,9 @@ def analyze_momentum(
     # Base score from pump phase
     base_score = 70 if pump_phase == "EARLY" else 30
     
-    # Adjust for buy/sell ratio
-    if buy_sell_ratio is not None and buy_sell_ratio != float('inf'):
+    # Adjust for buy/sell ratio (a capped ratio means no sells at all, which
+    # is not a buying-pressure signal)
+    if buy_sell_ratio is not None and buy_sell_ratio < MAX_BUY_SELL_RATIO:
         if buy_sell_ratio > 1.5:
             base_score += 10
             signals.append("Strong buying pressure")
@@ -10,59 +10,224 @@ Features:
 - Query-based search with caching
 - Returns structured validation results
 - Respects rate limits and cache TTL
+- Awaitable wrapper for asyncio callers (validate_news_async)
 """
 
-import feedparser
+import asyncio
+import functools
+import io
 import requests
+import threading
 import time
-from typing import Dict, Any, List, Optional
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Union
 from urllib.parse import quote_plus
 from colorama import init, Fore, Style
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 
 from rate_limiter import rate_limit
 import config
 
+# Optional: lxml parses the RSS fast path in libxml2 (stdlib ElementTree otherwise)
+try:
+    from lxml import etree as _rss_etree
+    LXML_AVAILABLE = True
+    _RSSParseError = _rss_etree.XMLSyntaxError
+    _iterparse = functools.partial(_rss_etree.iterparse, resolve_entities=False, no_network=True)
+except ImportError:
+    LXML_AVAILABLE = False
+    _RSSParseError = ET.ParseError
+    _iterparse = ET.iterparse
+
 # Initialize colorama
 init(autoreset=True)
 
 # Constants from config
 RSS_URL_TEMPLATE = config.GOOGLE_NEWS_RSS_URL_TEMPLATE
 CACHE_TTL_SECONDS = config.GOOGLE_NEWS_CACHE_TTL_SECONDS
+CACHE_MAX_ENTRIES = config.GOOGLE_NEWS_CACHE_MAX_ENTRIES
 GOOGLE_NEWS_RPM = config.GOOGLE_NEWS_RPM
 REQUEST_TIMEOUT_SECONDS = config.API_TIMEOUT_SECONDS
 
+# URL template split once so each request is a plain concatenation
+_RSS_URL_PREFIX, _RSS_URL_SUFFIX = RSS_URL_TEMPLATE.split("{query}", 1)
+
+# Pooled session so repeated fetches reuse the TCP/TLS connection to
+# news.google.com; transient 5xx responses are retried with a short backoff.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504)),
+))
+
 # Security check result levels
 LEVEL_DANGER = "DANGER"
 LEVEL_WARNING = "WARNING"
 LEVEL_OK = "OK"
 LEVEL_UNKNOWN = "UNKNOWN"
 
-# Simple cache dictionary {query: (timestamp, result)}
-_cache: Dict[str, tuple[float, Dict[str, Any]]] = {}
+# feedparser is only needed for the non-RSS-2.0 fallback and is slow to
+# import, so it is loaded on first use (see _load_feedparser)
+_feedparser = None
+
+# Cache key: (query, matched_narrative or ""), both stripped and casefolded
+CacheKey = Tuple[str, str]
 
+# LRU cache {(query, narrative): (timestamp, result)}, least recently used first.
+# validate_news runs on main's thread pool, so access goes through _cache_lock.
+_cache: "OrderedDict[CacheKey, tuple[float, Dict[str, Any]]]" = OrderedDict()
+_cache_lock = threading.Lock()
 
-def _is_cache_valid(query: str) -> bool:
+
+def _normalize_cache_key(key: Union[str, CacheKey]) -> CacheKey:
+    """
+    Build a cache key so "TRUMP", "trump" and "Trump " share one entry.
+    
+    Accepts legacy "query|narrative" string keys as well as tuple keys.
+    """
+    if isinstance(key, str):
+        query, _, narrative = key.partition("|")
+    else:
+        query, narrative = key
+    return (query.strip().casefold(), narrative.strip().casefold())
+
+
+def _is_cache_valid(query: Union[str, CacheKey]) -> bool:
     """Check if cached result exists and is still valid."""
-    if query not in _cache:
+    with _cache_lock:
+        entry = _cache.get(_normalize_cache_key(query))
+    if entry is None:
         return False
     
-    timestamp, _ = _cache[query]
+    timestamp, _ = entry
     age_seconds = time.time() - timestamp
     return age_seconds < CACHE_TTL_SECONDS
 
 
-def _get_cached_result(query: str) -> Optional[Dict[str, Any]]:
-    """Retrieve cached result if valid, else None."""
-    if _is_cache_valid(query):
-        _, result = _cache[query]
+def _get_cached_result(query: Union[str, CacheKey]) -> Optional[Dict[str, Any]]:
+    """Retrieve cached result if valid, else None. Expired entries are dropped."""
+    key = _normalize_cache_key(query)
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        
+        timestamp, result = entry
+        if time.time() - timestamp >= CACHE_TTL_SECONDS:
+            del _cache[key]
+            return None
+        
+        _cache.move_to_end(key)
         return result
-    return None
 
 
-def _set_cache(query: str, result: Dict[str, Any]) -> None:
-    """Store result in cache with current timestamp."""
-    _cache[query] = (time.time(), result)
+def _set_cache(query: Union[str, CacheKey], result: Dict[str, Any]) -> None:
+    """Store result in cache with current timestamp, evicting the LRU entry when full."""
+    key = _normalize_cache_key(query)
+    with _cache_lock:
+        _cache[key] = (time.time(), result)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def _load_feedparser():
+    """Import and configure feedparser on first use."""
+    global _feedparser
+    if _feedparser is None:
+        import feedparser
+        
+        # Google News is a trusted feed and we only read plain-text fields
+        # (title, link, pubDate, source), so skip feedparser's HTML sanitizer
+        # and relative-URI rewriting. feedparser is not used anywhere else.
+        feedparser.SANITIZE_HTML = 0
+        feedparser.RESOLVE_RELATIVE_URIS = 0
+        _feedparser = feedparser
+    return _feedparser
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve news_validator.feedparser lazily (e.g. for mock.patch targets)."""
+    if name == "feedparser":
+        return _load_feedparser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _parse_rss_fast(content: bytes) -> Optional[Tuple[Tuple[str, str, str, str], ...]]:
+    """
+    Fast path for plain RSS 2.0 documents (the fixed Google News schema).
+
+    Streams the document with iterparse and clears each <item> once its
+    fields are read, so memory stays flat for large feeds. Every item is
+    read because article_count reports the full feed size.
+
+    Returns None when the document is not rss/channel/item shaped so the
+    caller can fall back to feedparser. Raises _RSSParseError on bad XML.
+    """
+    entries = []
+    depth = 0
+    in_channel = False
+    seen_channel = False
+
+    for event, elem in _iterparse(io.BytesIO(content), events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 1 and elem.tag != "rss":
+                return None
+            if depth == 2 and elem.tag == "channel":
+                in_channel = seen_channel = True
+            continue
+
+        depth -= 1
+        if depth == 1 and elem.tag == "channel":
+            in_channel = False
+        elif in_channel and elem.tag == "item":
+            entries.append((
+                elem.findtext("title", ""),
+                elem.findtext("link", ""),
+                elem.findtext("pubDate", ""),
+                elem.findtext("source", "Unknown"),
+            ))
+            elem.clear()
+
+    return tuple(entries) if seen_channel else None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_rss_bytes(content: bytes) -> Tuple[Tuple[str, str, str, str], ...]:
+    """
+    Parse raw RSS bytes into (title, link, published, source_title) tuples.
+
+    Memoized on the response body so identical feeds (same query within a
+    tick, or unchanged results) skip the full XML parse. The result is an
+    immutable tuple because it is shared between callers via the cache.
+
+    Google News serves plain RSS 2.0, which is streamed with lxml (or
+    ElementTree); anything else (Atom, malformed XML) goes through feedparser.
+    """
+    try:
+        entries = _parse_rss_fast(content)
+    except _RSSParseError:
+        entries = None
+    if entries is not None:
+        return entries
+
+    feed = _load_feedparser().parse(content)
+    entries = feed.entries if hasattr(feed, 'entries') else []
+
+    return tuple(
+        (
+            entry.get("title", ""),
+            entry.get("link", ""),
+            entry.get("published", ""),
+            entry.get("source", {}).get("title", "Unknown"),
+        )
+        for entry in entries
+    )
 
 
 @rate_limit(requests_per_minute=GOOGLE_NEWS_RPM)
@@ -75,46 +240,43 @@ def _fetch_rss_feed(query: str, verbose: bool = True) -> Dict[str, Any]:
         verbose: If True, print status messages
         
     Returns:
-        Dict containing parsed feed data with entries
+        Dict containing parsed entries as (title, link, published, source) tuples
     """
-    encoded_query = quote_plus(query)
-    url = RSS_URL_TEMPLATE.format(query=encoded_query)
+    url = _RSS_URL_PREFIX + quote_plus(query) + _RSS_URL_SUFFIX
     
     if verbose:
         print(f"  {Fore.CYAN}[NEWS] Fetching Google News RSS for: {query}{Style.RESET_ALL}")
     
     try:
-        response = requests.get(url, timeout=REQUEST_TIMEOUT_SECONDS)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT_SECONDS)
         response.raise_for_status()
         
-        # Parse RSS feed using feedparser
-        feed = feedparser.parse(response.content)
+        # Parse RSS feed (memoized on the raw bytes)
+        entries = _parse_rss_bytes(response.content)
         
         if verbose:
-            entry_count = len(feed.entries) if hasattr(feed, 'entries') else 0
-            print(f"  {Fore.GREEN}[OK] Found {entry_count} news articles{Style.RESET_ALL}")
+            print(f"  {Fore.GREEN}[OK] Found {len(entries)} news articles{Style.RESET_ALL}")
         
         return {
             "success": True,
-            "feed": feed,
-            "entries": feed.entries if hasattr(feed, 'entries') else [],
+            "entries": entries,
             "error": None
         }
         
     except requests.exceptions.Timeout:
         if verbose:
             print(f"  {Fore.YELLOW}[WARN] Request timeout{Style.RESET_ALL}")
-        return {"success": False, "feed": None, "entries": [], "error": "Timeout"}
+        return {"success": False, "entries": (), "error": "Timeout"}
         
     except requests.exceptions.RequestException as e:
         if verbose:
             print(f"  {Fore.RED}[ERROR] Request failed: {e}{Style.RESET_ALL}")
-        return {"success": False, "feed": None, "entries": [], "error": str(e)}
+        return {"success": False, "entries": (), "error": str(e)}
         
     except Exception as e:
         if verbose:
             print(f"  {Fore.RED}[ERROR] Parsing error: {e}{Style.RESET_ALL}")
-        return {"success": False, "feed": None, "entries": [], "error": str(e)}
+        return {"success": False, "entries": (), "error": str(e)}
 
 
 def validate_news(
@@ -151,7 +313,7 @@ def validate_news(
         >>> print(result["article_count"])  # 5
     """
     # Check cache first
-    cache_key = f"{query}|{matched_narrative or ''}"
+    cache_key = (query, matched_narrative or "")
     cached = _get_cached_result(cache_key)
     if cached is not None:
         if verbose:
@@ -185,12 +347,12 @@ def validate_news(
     
     # Extract article metadata
     articles = []
-    for entry in entries[:10]:  # Limit to first 10 articles
+    for title, link, published, source in entries[:10]:  # Limit to first 10 articles
         article = {
-            "title": entry.get("title", ""),
-            "link": entry.get("link", ""),
-            "published": entry.get("published", ""),
-            "source": entry.get("source", {}).get("title", "Unknown")
+            "title": title,
+            "link": link,
+            "published": published,
+            "source": source
         }
         articles.append(article)
     
@@ -222,10 +384,43 @@ def validate_news(
     return result
 
 
+async def validate_news_async(
+    query: str,
+    token_name: Optional[str] = None,
+    matched_narrative: Optional[str] = None,
+    verbose: bool = True
+) -> Dict[str, Any]:
+    """
+    Awaitable version of validate_news for code running on the event loop.
+    
+    The RSS fetch is blocking (requests + rate limiter sleep), so it runs
+    in a worker thread; the caller can overlap it with other async work.
+    Shares the cache and rate limiter with validate_news.
+    
+    Args:
+        Same as validate_news
+        
+    Returns:
+        Same structure as validate_news
+    """
+    return await asyncio.to_thread(
+        validate_news,
+        query,
+        token_name=token_name,
+        matched_narrative=matched_narrative,
+        verbose=verbose,
+    )
+
+
 def clear_cache() -> None:
     """Clear the news validation cache. Useful for testing."""
-    global _cache
-    _cache.clear()
+    with _cache_lock:
+        _cache.clear()
+    _parse_rss_bytes.cache_clear()
+
+
+# functools-style alias so callers can reset the memoized results directly
+validate_news.cache_clear = clear_cache
 
 
 def get_cache_stats() -> Dict[str, Any]:
@@ -236,13 +431,16 @@ def get_cache_stats() -> Dict[str, Any]:
         Dict with cache size and entry details
     """
     now = time.time()
-    valid_entries = sum(1 for ts, _ in _cache.values() if now - ts < CACHE_TTL_SECONDS)
+    with _cache_lock:
+        total_entries = len(_cache)
+        valid_entries = sum(1 for ts, _ in _cache.values() if now - ts < CACHE_TTL_SECONDS)
     
     return {
-        "total_entries": len(_cache),
+        "total_entries": total_entries,
         "valid_entries": valid_entries,
-        "expired_entries": len(_cache) - valid_entries,
-        "cache_ttl_seconds": CACHE_TTL_SECONDS
+        "expired_entries": total_entries - valid_entries,
+        "cache_ttl_seconds": CACHE_TTL_SECONDS,
+        "max_entries": CACHE_MAX_ENTRIES
     }
 
 
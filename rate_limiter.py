@@ -14,7 +14,10 @@ Supported rate limits:
 """
 
 import time
+import asyncio
+import inspect
 import logging
+import threading
 from functools import wraps
 from typing import Callable, Any
 
@@ -39,6 +42,22 @@ class RateLimiter:
         self.requests_per_minute = requests_per_minute
         self.min_interval = 60.0 / requests_per_minute
         self.last_call_time = 0
+        # Guards last_call_time: calls may come from several threads at once
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """
+        Claim the next call slot and return how long to wait for it.
+        
+        The slot is recorded (under a lock) before the caller sleeps, so
+        callers waiting at the same time, from any thread, queue up one
+        interval apart instead of all proceeding once the first wait ends.
+        """
+        with self._lock:
+            current_time = time.time()
+            slot = max(current_time, self.last_call_time + self.min_interval)
+            self.last_call_time = slot
+        return slot - current_time
     
     def wait_if_needed(self) -> None:
         """
@@ -47,15 +66,22 @@ class RateLimiter:
         Uses simple time-based throttling: tracks the last API call
         and sleeps for the minimum required interval if needed.
         """
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_call_time
-        
-        if time_since_last_call < self.min_interval:
-            sleep_time = self.min_interval - time_since_last_call
+        sleep_time = self._reserve()
+        if sleep_time > 0:
             logger.debug(f"Rate limiter: sleeping for {sleep_time:.3f}s")
             time.sleep(sleep_time)
+    
+    async def wait_if_needed_async(self) -> None:
+        """
+        Async form of wait_if_needed for coroutine API calls.
         
-        self.last_call_time = time.time()
+        Waits with asyncio.sleep, so other tasks on the event loop keep
+        running while this call is throttled.
+        """
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            logger.debug(f"Rate limiter: sleeping for {sleep_time:.3f}s")
+            await asyncio.sleep(sleep_time)
 
 
 # Global rate limiters for each API
@@ -122,12 +148,22 @@ def rate_limit_geckoterminal(func: Callable) -> Callable:
     """
     Decorator to rate-limit GeckoTerminal API calls (30 rpm).
     
+    Coroutine functions are throttled with asyncio.sleep inside the
+    coroutine, so a throttled call never blocks the event loop.
+    
     Usage:
         @rate_limit_geckoterminal
         async def fetch_ohlcv(pool_address):
              # API call here
              pass
     """
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs) -> Any:
+            await _geckoterminal_limiter.wait_if_needed_async()
+            return await func(*args, **kwargs)
+        return async_wrapper
+    
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
         _geckoterminal_limiter.wait_if_needed()
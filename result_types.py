@@ -0,0 +1,64 @@
+"""
+Result Types - Shared Helpers for Check Results
+================================================
+Checks return lightweight NamedTuples instead of dicts. The decorator
+here keeps them readable like the dicts they replaced, so existing
+callers using result["level"], result.get("level"), "level" in result
+or result.items() keep working.
+"""
+
+
+def dict_compatible(cls):
+    """
+    Let a result NamedTuple also be read like the dict it replaced.
+
+    result["level"], result.get("level"), "level" in result, items(),
+    values(), dict(result) and == against a dict keep working for existing
+    callers; integer indexing, iteration and unpacking still behave like a
+    tuple. Properties named in a `_derived_keys` class attribute are
+    readable by key too, after the fields. json.dumps sees a tuple, so
+    serialize dict(result) instead.
+    """
+    names = tuple(cls._fields) + tuple(getattr(cls, "_derived_keys", ()))
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key in names:
+                return getattr(self, key)
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in names else default
+
+    def keys(self):
+        return names
+
+    def values(self):
+        return [getattr(self, key) for key in names]
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in names]
+
+    def __contains__(self, key):
+        return key in names
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            return dict(self.items()) == other
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = __eq__(self, other)
+        return result if result is NotImplemented else not result
+
+    cls.__getitem__ = __getitem__
+    cls.get = get
+    cls.keys = keys
+    cls.values = values
+    cls.items = items
+    cls.__contains__ = __contains__
+    cls.__eq__ = __eq__
+    cls.__ne__ = __ne__
+    cls.__hash__ = tuple.__hash__
+    return cls
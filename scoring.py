@@ -12,13 +12,131 @@ Scoring dimensions:
 - Relevance (20%): LLM relevance and authenticity analysis
 """
 
+import functools
 import logging
-from typing import Dict, Any, Optional
+import math
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
 
 import config
 
 logger = logging.getLogger(__name__)
 
+# Optional JIT for the numeric scoring core (pure-Python fallback below)
+try:
+    from numba import njit, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+    types = None
+
+
+# =============================================================================
+# NUMERIC SCORING CORE
+# =============================================================================
+
+# Pump phase -> integer code passed to the scoring core.
+# Unknown phases are scored like LATE (conservative).
+_PHASE_CODES = {"EARLY": 0, "MID": 1, "LATE": 2}
+_PHASE_CODE_LATE = _PHASE_CODES["LATE"]
+
+# Dimension weights resolved once at import, in core argument order
+_WEIGHTS = config.SCORE_WEIGHTS
+_WEIGHT_ARGS = (
+    float(_WEIGHTS["safety"]),
+    float(_WEIGHTS["timing"]),
+    float(_WEIGHTS["momentum"]),
+    float(_WEIGHTS["relevance"]),
+)
+_WEIGHTS_VEC = np.array(_WEIGHT_ARGS)
+
+
+def _composite_core_py(
+    safety: float,
+    relevance: float,
+    phase_code: int,
+    momentum: float,
+    price_velocity: float,
+    buy_sell_ratio: float,
+    max_price_change: float,
+    w_safety: float,
+    w_timing: float,
+    w_momentum: float,
+    w_relevance: float,
+) -> Tuple[float, float, float, float, float]:
+    """
+    Numeric core of calculate_composite_score.
+    
+    NaN marks a missing value: momentum=NaN derives momentum from
+    price_velocity/buy_sell_ratio, buy_sell_ratio=NaN means unknown ratio.
+    
+    Returns:
+        (composite, safety, timing, momentum, relevance), each clamped to 0-100
+    """
+    # Timing score: EARLY phase = good (80), MID = neutral (50), LATE = bad (20)
+    if phase_code == 0:
+        timing = 80.0
+    elif phase_code == 1:
+        timing = 50.0
+    else:
+        timing = 20.0
+    
+    if math.isnan(momentum):
+        # Normalize price velocity (0-50% = 20-80 score, >50% = 20 score)
+        if price_velocity < 0:
+            momentum_from_velocity = 50.0  # Negative is neutral (decline but no rug)
+        elif price_velocity < max_price_change:
+            # Scale linearly: 0% = 20, 50% = 80
+            momentum_from_velocity = 20.0 + (price_velocity / max_price_change) * 60.0
+        else:
+            momentum_from_velocity = 20.0  # Over 50% = weak momentum signal
+        
+        # Buy/sell ratio factor (1.0 = balanced, higher = more bullish)
+        if math.isnan(buy_sell_ratio):
+            ratio_score = 50.0
+        elif buy_sell_ratio < 1.0:
+            ratio_score = 20.0 + buy_sell_ratio * 80.0  # 0.0 = 20, 1.0 = 100
+        else:
+            ratio_score = min(80.0 + (buy_sell_ratio - 1.0) * 20.0, 100.0)  # 1.0 = 80, 2.0 = 100
+        
+        # Average the two momentum factors
+        momentum = (momentum_from_velocity + ratio_score) / 2.0
+    
+    composite = (
+        safety * w_safety
+        + timing * w_timing
+        + momentum * w_momentum
+        + relevance * w_relevance
+    )
+    
+    # Cap scores at 0-100 range
+    return (
+        max(0.0, min(100.0, composite)),
+        max(0.0, min(100.0, safety)),
+        max(0.0, min(100.0, timing)),
+        max(0.0, min(100.0, momentum)),
+        max(0.0, min(100.0, relevance)),
+    )
+
+
+_composite_core = _composite_core_py
+
+if NUMBA_AVAILABLE:
+    try:
+        # Explicit signature compiles eagerly at import (cached on disk)
+        _composite_core = njit(
+            types.UniTuple(types.float64, 5)(
+                types.float64, types.float64, types.int64, types.float64,
+                types.float64, types.float64, types.float64,
+                types.float64, types.float64, types.float64, types.float64,
+            ),
+            cache=True,
+        )(_composite_core_py)
+    except Exception as e:
+        logger.warning(f"Numba compilation of scoring core failed, using Python: {e}")
+
 
 # =============================================================================
 # LIQUIDITY SHAPE SCORE ADJUSTMENT
@@ -95,6 +213,7 @@ def calculate_composite_score(
         brain_result: From brain.analyze_with_llm()
                      Must contain: relevance_score (0-100), confidence (0-100)
         pump_phase: "EARLY" or "LATE" from momentum.classify_pump_phase()
+                    ("MID" scores as neutral; unknown phases score as LATE)
         liquidity_result: Optional result from liquidity.analyze_liquidity()
                          Used to adjust safety score based on liquidity shape.
     
@@ -112,7 +231,7 @@ def calculate_composite_score(
                 "momentum": ...,
                 "relevance": ...
             },
-            "weights": config.SCORE_WEIGHTS,
+            "weights": _WEIGHTS,
             "liquidity_adjustment": str,
             "timestamp": ISO8601 string
         }
@@ -127,55 +246,27 @@ def calculate_composite_score(
         safety_score, liquidity_result
     )
     
-    # Timing score: EARLY phase = good (80), LATE phase = bad (20)
-    timing_score = 80 if pump_phase == "EARLY" else 20
-    
-    # Momentum score: use enhanced score if available, otherwise calculate from basics
-    if "enhanced_momentum_score" in momentum_result and momentum_result["enhanced_momentum_score"] is not None:
-        momentum_score = momentum_result["enhanced_momentum_score"]
-    else:
-        # Fallback: calculate from price velocity and buy/sell ratio
-        # Normalize price velocity (0-50% = 20-80 score, >50% = 20 score)
-        price_velocity = momentum_result.get("price_velocity", 0)
-        if price_velocity < 0:
-            momentum_from_velocity = 50  # Negative is neutral (decline but no rug)
-        elif price_velocity < config.MAX_1H_PRICE_CHANGE_PERCENT:
-            # Scale linearly: 0% = 20, 50% = 80
-            momentum_from_velocity = 20 + (price_velocity / config.MAX_1H_PRICE_CHANGE_PERCENT) * 60
-        else:
-            momentum_from_velocity = 20  # Over 50% = weak momentum signal
-        
-        # Buy/sell ratio factor (1.0 = balanced, higher = more bullish)
-        ratio = momentum_result.get("buy_sell_ratio", 1.0)
-        if ratio is None:
-            ratio_score = 50
-        elif ratio < 1.0:
-            ratio_score = 20 + (ratio * 80)  # 0.0 = 20, 1.0 = 100
-        else:
-            ratio_score = min(80 + (ratio - 1.0) * 20, 100)  # 1.0 = 80, 2.0 = 100
-        
-        # Average the two momentum factors
-        momentum_score = (momentum_from_velocity + ratio_score) / 2
-    
-    # Relevance score: from LLM analysis
-    relevance_score = brain_result.get("relevance_score", 50)
-    
-    # Calculate composite using configured weights
-    weights = config.SCORE_WEIGHTS
-    composite_score = (
-        safety_score * weights["safety"]
-        + timing_score * weights["timing"]
-        + momentum_score * weights["momentum"]
-        + relevance_score * weights["relevance"]
+    # Momentum: use enhanced score if available, otherwise derived in the core
+    enhanced_momentum = momentum_result.get("enhanced_momentum_score")
+    buy_sell_ratio = momentum_result.get("buy_sell_ratio", 1.0)
+    
+    (
+        composite_score,
+        safety_score,
+        timing_score,
+        momentum_score,
+        relevance_score,
+    ) = _composite_core(
+        float(safety_score),
+        float(brain_result.get("relevance_score", 50)),
+        _PHASE_CODES.get(pump_phase, _PHASE_CODE_LATE),
+        math.nan if enhanced_momentum is None else float(enhanced_momentum),
+        float(momentum_result.get("price_velocity", 0)),
+        math.nan if buy_sell_ratio is None else float(buy_sell_ratio),
+        float(config.MAX_1H_PRICE_CHANGE_PERCENT),
+        *_WEIGHT_ARGS,
     )
     
-    # Cap scores at 0-100 range
-    composite_score = max(0, min(100, composite_score))
-    safety_score = max(0, min(100, safety_score))
-    timing_score = max(0, min(100, timing_score))
-    momentum_score = max(0, min(100, momentum_score))
-    relevance_score = max(0, min(100, relevance_score))
-    
     logger.debug(
         f"Composite score breakdown: safety={safety_score:.1f}, "
         f"timing={timing_score:.1f}, momentum={momentum_score:.1f}, "
@@ -194,12 +285,99 @@ def calculate_composite_score(
             "momentum": round(momentum_score, 1),
             "relevance": round(relevance_score, 1),
         },
-        "weights": config.SCORE_WEIGHTS,
+        "weights": _WEIGHTS,
         "liquidity_adjustment": liquidity_adjustment,
         "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
     }
 
 
+def _momentum_from_velocity_ratio(price_velocity: np.ndarray, buy_sell_ratio: np.ndarray) -> np.ndarray:
+    """
+    Vectorized fallback momentum score (same rules as the scalar core).
+    
+    Args:
+        price_velocity: 1h price change percentages
+        buy_sell_ratio: Buy/sell ratios, NaN where unknown
+    
+    Returns:
+        Momentum scores (unclamped)
+    """
+    max_price_change = float(config.MAX_1H_PRICE_CHANGE_PERCENT)
+    
+    velocity_score = np.where(
+        price_velocity < 0,
+        50.0,
+        np.where(
+            price_velocity < max_price_change,
+            20.0 + (price_velocity / max_price_change) * 60.0,
+            20.0,
+        ),
+    )
+    ratio_score = np.where(
+        np.isnan(buy_sell_ratio),
+        50.0,
+        np.where(
+            buy_sell_ratio < 1.0,
+            20.0 + buy_sell_ratio * 80.0,
+            np.minimum(80.0 + (buy_sell_ratio - 1.0) * 20.0, 100.0),
+        ),
+    )
+    return (velocity_score + ratio_score) / 2.0
+
+
+def calculate_composite_scores_batch(
+    safety: np.ndarray,
+    price_velocity: np.ndarray,
+    buy_sell_ratio: np.ndarray,
+    relevance: np.ndarray,
+    phase_codes: np.ndarray,
+    momentum: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Score many tokens at once from parallel arrays.
+    
+    Vectorized equivalent of calculate_composite_score for watchlist-sized
+    batches. Liquidity adjustment is not applied here; pass the adjusted
+    safety scores.
+    
+    Args:
+        safety: Safety scores (0-100)
+        price_velocity: 1h price change percentages
+        buy_sell_ratio: Buy/sell ratios, NaN where unknown
+        relevance: LLM relevance scores (0-100)
+        phase_codes: Pump phase codes (see _PHASE_CODES; other values score as LATE)
+        momentum: Optional enhanced momentum scores, NaN where unavailable
+    
+    Returns:
+        (N, 5) float array with columns
+        composite, safety, timing, momentum, relevance (clamped, unrounded)
+    """
+    safety = np.asarray(safety, dtype=np.float64)
+    price_velocity = np.asarray(price_velocity, dtype=np.float64)
+    buy_sell_ratio = np.asarray(buy_sell_ratio, dtype=np.float64)
+    relevance = np.asarray(relevance, dtype=np.float64)
+    phase_codes = np.asarray(phase_codes)
+    
+    timing = np.where(
+        phase_codes == _PHASE_CODES["EARLY"],
+        80.0,
+        np.where(phase_codes == _PHASE_CODES["MID"], 50.0, 20.0),
+    )
+    
+    derived_momentum = _momentum_from_velocity_ratio(price_velocity, buy_sell_ratio)
+    if momentum is None:
+        momentum = derived_momentum
+    else:
+        momentum = np.asarray(momentum, dtype=np.float64)
+        momentum = np.where(np.isnan(momentum), derived_momentum, momentum)
+    
+    scores = np.column_stack((safety, timing, momentum, relevance))
+    result = np.column_stack((scores @ _WEIGHTS_VEC, scores))
+    
+    # Cap scores at 0-100 range
+    return np.clip(result, 0.0, 100.0, out=result)
+
+
 def should_alert(score_data: Dict[str, Any]) -> bool:
     """
     Determine if composite score warrants an alert.
@@ -241,6 +419,59 @@ def should_alert(score_data: Dict[str, Any]) -> bool:
     return True
 
 
+def should_alert_batch(composites: np.ndarray, individuals: np.ndarray) -> np.ndarray:
+    """
+    Vectorized should_alert for many tokens at once.
+    
+    Same criteria as should_alert: composite > MIN_COMPOSITE_SCORE and
+    every individual score > MIN_INDIVIDUAL_SCORE. Pairs directly with
+    calculate_composite_scores_batch:
+    
+        scores = calculate_composite_scores_batch(...)
+        mask = should_alert_batch(scores[:, 0], scores[:, 1:])
+    
+    Batch scores are unrounded, so values within 0.05 of a threshold can
+    differ from should_alert on the rounded scalar result.
+    
+    Args:
+        composites: (N,) composite scores
+        individuals: (N, K) individual dimension scores, K >= 1
+    
+    Returns:
+        (N,) boolean mask of tokens that warrant an alert
+    """
+    composites = np.asarray(composites, dtype=np.float64)
+    individuals = np.asarray(individuals, dtype=np.float64)
+    
+    return (composites > config.MIN_COMPOSITE_SCORE) & (
+        individuals.min(axis=1) > config.MIN_INDIVIDUAL_SCORE
+    )
+
+
+# =============================================================================
+# OUTPUT FORMATTING
+# =============================================================================
+
+# Star rating per 20 points (0-100 -> 0-5 stars)
+_STARS = ("", "⭐", "⭐⭐", "⭐⭐⭐", "⭐⭐⭐⭐", "⭐⭐⭐⭐⭐")
+
+# Dimension display order with labels pre-padded to the column width
+_DIMENSION_LABELS = (
+    ("safety", f"{'Safety':12}"),
+    ("timing", f"{'Timing':12}"),
+    ("momentum", f"{'Momentum':12}"),
+    ("relevance", f"{'Relevance':12}"),
+)
+
+_COMPOSITE_LINE_TEMPLATE = "{} {:.0f}/100"
+_SCORE_LINE_TEMPLATE = "{} {} {:.0f}/100"
+
+
+def _score_to_stars(score: float) -> str:
+    """Convert a 0-100 score to a 0-5 star rating."""
+    return _STARS[max(0, min(5, int(score) // 20))]
+
+
 def format_score_output(score_data: Dict[str, Any]) -> str:
     """
     Format score data for Telegram output.
@@ -262,34 +493,37 @@ def format_score_output(score_data: Dict[str, Any]) -> str:
     composite = score_data.get("composite_score", 0)
     individual = score_data.get("individual_scores", {})
     
-    def score_to_stars(score: float, max_score: int = 100, max_stars: int = 5) -> str:
-        """Convert numeric score to star rating."""
-        num_stars = max(0, min(max_stars, int((score / max_score) * max_stars)))
-        return "⭐" * num_stars
-    
-    # Build output
-    lines = []
-    
-    # Composite score with stars (main header)
-    composite_stars = score_to_stars(composite, max_stars=5)
-    lines.append(f"{composite_stars} {composite:.0f}/100")
-    lines.append("")
-    
-    # Individual dimensions
-    dimension_order = ["safety", "timing", "momentum", "relevance"]
-    dimension_labels = {
-        "safety": "Safety",
-        "timing": "Timing",
-        "momentum": "Momentum",
-        "relevance": "Relevance",
-    }
+    # Composite score with stars (main header), then individual dimensions
+    lines = [_COMPOSITE_LINE_TEMPLATE.format(_score_to_stars(composite), composite), ""]
     
-    for dim in dimension_order:
+    for dim, label in _DIMENSION_LABELS:
         if dim in individual:
             score = individual[dim]
-            stars = score_to_stars(score, max_stars=5)
-            label = dimension_labels[dim]
-            lines.append(f"{label:12} {stars} {score:.0f}/100")
+            lines.append(_SCORE_LINE_TEMPLATE.format(label, _score_to_stars(score), score))
+    
+    return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=8)
+def _choose_template(has_alert: bool, has_address: bool, has_needs: bool) -> str:
+    """
+    Build the Telegram message template for one message shape.
+    
+    Only a handful of shapes exist, so each is assembled once and reused;
+    the formatter then fills it with a single format_map call.
+    """
+    lines = ["{emoji} {token_name} ({token_symbol})"]
+    if has_address:
+        lines.append("Address: {short_address}...")
+    
+    lines += ["", "Score Analysis:", "{score_output}", ""]
+    
+    if has_alert:
+        lines.append("✅ ALERT THRESHOLD MET - Ready to send")
+    else:
+        lines.append("❌ Below alert threshold")
+        if has_needs:
+            lines.append("Needs: {needs}")
     
     return "\n".join(lines)
 
@@ -312,8 +546,6 @@ def format_score_telegram_message(
     Returns:
         Formatted Telegram message
     """
-    lines = []
-    
     # Header
     composite = score_data.get("composite_score", 0)
     if composite >= 80:
@@ -323,34 +555,26 @@ def format_score_telegram_message(
     else:
         emoji = "📊"
     
-    lines.append(f"{emoji} {token_name} ({token_symbol})")
-    if token_address:
-        # Show short address hash
-        lines.append(f"Address: {token_address[:16]}...")
-    
-    lines.append("")
-    
-    # Scores
-    lines.append("Score Analysis:")
-    lines.append(format_score_output(score_data))
-    
-    lines.append("")
-    
     # Alert decision
-    if should_alert(score_data):
-        lines.append("✅ ALERT THRESHOLD MET - Ready to send")
-    else:
-        lines.append("❌ Below alert threshold")
-        missing = []
+    has_alert = should_alert(score_data)
+    missing = []
+    if not has_alert:
         if score_data.get("composite_score", 0) <= config.MIN_COMPOSITE_SCORE:
             missing.append(f"composite: {score_data.get('composite_score', 0):.1f}/{config.MIN_COMPOSITE_SCORE}")
         for dim, score in score_data.get("individual_scores", {}).items():
             if score <= config.MIN_INDIVIDUAL_SCORE:
                 missing.append(f"{dim}: {score:.1f}/{config.MIN_INDIVIDUAL_SCORE}")
-        if missing:
-            lines.append(f"Needs: {', '.join(missing)}")
     
-    return "\n".join(lines)
+    template = _choose_template(has_alert, bool(token_address), bool(missing))
+    return template.format_map({
+        "emoji": emoji,
+        "token_name": token_name,
+        "token_symbol": token_symbol,
+        # Show short address hash
+        "short_address": token_address[:16] if token_address else "",
+        "score_output": format_score_output(score_data),
+        "needs": ", ".join(missing),
+    })
 
 
 # ============================================================================
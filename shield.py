@@ -11,19 +11,28 @@ Enhanced with:
 - Comprehensive security check aggregator
 """
 
+import numpy as np
 import requests
-from typing import Optional, Tuple, Dict, Any, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, Tuple, Dict, Any, List, NamedTuple
 from colorama import init, Fore, Style
-from datetime import datetime
 import time
 
 from rate_limiter import rate_limit_rugcheck, rate_limit, rate_limit_dexscreener
+from result_types import dict_compatible
 import config
 from state import StateManager
 
+# Optional: orjson decodes the holder payloads faster than stdlib json
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # New module imports for Tiers 6-9
 from clone_detector import check_clone_token
-from social_checker import check_social_presence
+from social_checker import check_social_presence, SocialCheckResult
 from news_validator import validate_news
 import goplus_security
 import asyncio
@@ -36,6 +45,7 @@ RUGCHECK_API_URL = "https://api.rugcheck.xyz/v1/tokens/{mint_address}/report/sum
 RUGCHECK_FULL_URL = "https://api.rugcheck.xyz/v1/tokens/{mint_address}/report"
 DEXSCREENER_TOKEN_URL = "https://api.dexscreener.com/tokens/v1/solana/{mint_address}"
 REQUEST_TIMEOUT_SECONDS = config.API_TIMEOUT_SECONDS
+SECURITY_IO_TIMEOUT_SECONDS = config.SECURITY_IO_TIMEOUT_SECONDS
 
 # Risk levels that should be rejected
 DANGER_LEVELS = {"danger", "high", "critical", "honeypot", "scam", "rug"}
@@ -49,6 +59,46 @@ LEVEL_OK = "OK"
 LEVEL_UNKNOWN = "UNKNOWN"
 
 
+# =============================================================================
+# CHECK RESULT TYPES
+# =============================================================================
+
+@dict_compatible
+class HolderCheck(NamedTuple):
+    """Result of check_holder_concentration."""
+    level: str
+    top10_percent: Optional[float]
+    reason: str
+    source: str
+
+
+@dict_compatible
+class HoneypotCheck(NamedTuple):
+    """Result of check_honeypot."""
+    level: str
+    h1_buys: Optional[int]
+    h1_sells: Optional[int]
+    reason: str
+
+
+@dict_compatible
+class BundledTxCheck(NamedTuple):
+    """Result of check_bundled_transactions."""
+    level: str
+    token_age_hours: Optional[float]
+    holder_count: Optional[int]
+    reason: str
+
+
+# Shared results for the common no-data paths (immutable, safe to reuse)
+_HOLDER_EMPTY_ADDRESS = HolderCheck(LEVEL_UNKNOWN, None, "Empty address", "failed")
+_HOLDER_NO_DATA = HolderCheck(
+    LEVEL_UNKNOWN, None, "Could not fetch holder data from RPC or RugCheck", "failed"
+)
+_HONEYPOT_NO_DATA = HoneypotCheck(LEVEL_UNKNOWN, None, None, "Could not fetch DexScreener data")
+_BUNDLED_NO_DATA = BundledTxCheck(LEVEL_UNKNOWN, None, None, "Could not fetch token data")
+
+
 @rate_limit_rugcheck
 def check_security(mint_address: str, verbose: bool = True) -> Tuple[bool, str]:
     """
@@ -185,7 +235,7 @@ def _get_holders_from_rpc(mint_address: str, verbose: bool = True) -> Optional[L
             timeout=REQUEST_TIMEOUT_SECONDS
         )
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         
         if "error" in data:
             if verbose:
@@ -236,7 +286,7 @@ def _get_holders_from_rugcheck(mint_address: str, verbose: bool = True) -> Optio
             return None
         
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         
         # RugCheck returns topHolders in the response
         top_holders = data.get("topHolders", [])
@@ -260,11 +310,35 @@ def _get_holders_from_rugcheck(mint_address: str, verbose: bool = True) -> Optio
         return None
 
 
+def _holder_stats(holders: List[Dict]) -> Tuple[np.ndarray, float]:
+    """
+    Parse RPC holder amounts once for the concentration checks.
+    
+    getTokenLargestAccounts returns at most 20 accounts, largest first, so
+    the array is already in rank order and top-N shares are plain slices
+    (amounts[:N].sum() / total). Raw u64 amounts can exceed int64, hence
+    float64.
+    
+    Args:
+        holders: RPC holder dicts with string "amount" fields.
+        
+    Returns:
+        Tuple of (amounts in API order, total amount)
+    """
+    amounts = np.fromiter(
+        (float(h.get("amount", "0") or 0) for h in holders),
+        dtype=np.float64,
+        count=len(holders),
+    )
+    return amounts, float(amounts.sum())
+
+
 def check_holder_concentration(
     mint_address: str,
     token_supply: Optional[float] = None,
-    verbose: bool = True
-) -> Dict[str, Any]:
+    verbose: bool = True,
+    holders: Optional[List[Dict]] = None
+) -> HolderCheck:
     """
     Check if top 10 holders control more than threshold % of supply.
     
@@ -276,47 +350,31 @@ def check_holder_concentration(
         mint_address: The token's mint address.
         token_supply: Total token supply (for RPC calculation). Optional.
         verbose: If True, print status messages.
+        holders: RPC holder list already fetched by the caller. Optional;
+            pass [] to skip the RPC call and go straight to RugCheck.
         
     Returns:
-        Dict with keys:
+        HolderCheck (also readable as a dict) with fields:
         - level: DANGER, WARNING, OK, or UNKNOWN
         - top10_percent: Percentage held by top 10 (if calculable)
         - reason: Human-readable explanation
         - source: "rpc" or "rugcheck" or "failed"
     """
     if not mint_address:
-        return {
-            "level": LEVEL_UNKNOWN,
-            "top10_percent": None,
-            "reason": "Empty address",
-            "source": "failed"
-        }
+        return _HOLDER_EMPTY_ADDRESS
     
-    # Try RPC first
-    rpc_holders = _get_holders_from_rpc(mint_address, verbose=verbose)
+    # Try RPC first (unless the caller already fetched it)
+    rpc_holders = holders if holders is not None else _get_holders_from_rpc(mint_address, verbose=verbose)
     
     if rpc_holders and len(rpc_holders) > 0:
         # Calculate top 10 concentration from RPC response
         # RPC returns amounts, need to calculate percentages
         try:
-            # Get total supply from sum of all returned holders (approximation)
-            # or use provided token_supply
-            total_amount = 0
-            top10_amounts = []
-            
-            for i, holder in enumerate(rpc_holders[:10]):
-                amount_str = holder.get("amount", "0")
-                amount = float(amount_str) if amount_str else 0
-                top10_amounts.append(amount)
-                if i < 20:  # Sum all returned (up to 20)
-                    total_amount += float(holder.get("amount", "0") or 0)
-            
-            # Sum all holders for total approximation
-            all_amounts = sum(float(h.get("amount", "0") or 0) for h in rpc_holders)
+            # Total supply approximated by the sum of all returned holders
+            amounts, all_amounts = _holder_stats(rpc_holders)
             
             if all_amounts > 0:
-                top10_sum = sum(top10_amounts)
-                top10_percent = (top10_sum / all_amounts) * 100
+                top10_percent = float(amounts[:10].sum() / all_amounts * 100)
                 
                 if verbose:
                     print(f"  {Fore.WHITE}📊 Top 10 holders: {top10_percent:.1f}% of supply{Style.RESET_ALL}")
@@ -332,12 +390,7 @@ def check_holder_concentration(
                     if verbose:
                         print(f"  {Fore.GREEN}✅ {reason}{Style.RESET_ALL}")
                 
-                return {
-                    "level": level,
-                    "top10_percent": round(top10_percent, 2),
-                    "reason": reason,
-                    "source": "rpc"
-                }
+                return HolderCheck(level, round(top10_percent, 2), reason, "rpc")
         except Exception as e:
             if verbose:
                 print(f"  {Fore.YELLOW}⚠️  Error calculating RPC holders: {e}{Style.RESET_ALL}")
@@ -370,23 +423,13 @@ def check_holder_concentration(
                 if verbose:
                     print(f"  {Fore.GREEN}✅ {reason}{Style.RESET_ALL}")
             
-            return {
-                "level": level,
-                "top10_percent": round(top10_percent, 2),
-                "reason": reason,
-                "source": "rugcheck"
-            }
+            return HolderCheck(level, round(top10_percent, 2), reason, "rugcheck")
         except Exception as e:
             if verbose:
                 print(f"  {Fore.YELLOW}⚠️  Error calculating RugCheck holders: {e}{Style.RESET_ALL}")
     
     # Both sources failed
-    return {
-        "level": LEVEL_UNKNOWN,
-        "top10_percent": None,
-        "reason": "Could not fetch holder data from RPC or RugCheck",
-        "source": "failed"
-    }
+    return _HOLDER_NO_DATA
 
 
 # =============================================================================
@@ -438,7 +481,7 @@ def _get_token_data_from_dexscreener(mint_address: str, verbose: bool = True) ->
         return None
 
 
-def check_honeypot(token_data: Optional[Dict] = None, mint_address: Optional[str] = None, verbose: bool = True) -> Dict[str, Any]:
+def check_honeypot(token_data: Optional[Dict] = None, mint_address: Optional[str] = None, verbose: bool = True) -> HoneypotCheck:
     """
     Check if token is a honeypot using DexScreener txns data.
     
@@ -451,7 +494,7 @@ def check_honeypot(token_data: Optional[Dict] = None, mint_address: Optional[str
         verbose: If True, print status messages.
         
     Returns:
-        Dict with keys:
+        HoneypotCheck (also readable as a dict) with fields:
         - level: DANGER, WARNING, OK, or UNKNOWN
         - h1_buys: Number of buys in 1h
         - h1_sells: Number of sells in 1h
@@ -462,12 +505,7 @@ def check_honeypot(token_data: Optional[Dict] = None, mint_address: Optional[str
         token_data = _get_token_data_from_dexscreener(mint_address, verbose=verbose)
     
     if not token_data:
-        return {
-            "level": LEVEL_UNKNOWN,
-            "h1_buys": None,
-            "h1_sells": None,
-            "reason": "Could not fetch DexScreener data"
-        }
+        return _HONEYPOT_NO_DATA
     
     try:
         txns = token_data.get("txns", {})
@@ -502,22 +540,12 @@ def check_honeypot(token_data: Optional[Dict] = None, mint_address: Optional[str
             if verbose:
                 print(f"  {Fore.GREEN}✅ {reason}{Style.RESET_ALL}")
         
-        return {
-            "level": level,
-            "h1_buys": h1_buys,
-            "h1_sells": h1_sells,
-            "reason": reason
-        }
+        return HoneypotCheck(level, h1_buys, h1_sells, reason)
         
     except Exception as e:
         if verbose:
             print(f"  {Fore.YELLOW}⚠️  Error checking honeypot: {e}{Style.RESET_ALL}")
-        return {
-            "level": LEVEL_UNKNOWN,
-            "h1_buys": None,
-            "h1_sells": None,
-            "reason": f"Error: {str(e)[:50]}"
-        }
+        return HoneypotCheck(LEVEL_UNKNOWN, None, None, f"Error: {str(e)[:50]}")
 
 
 # =============================================================================
@@ -527,8 +555,10 @@ def check_honeypot(token_data: Optional[Dict] = None, mint_address: Optional[str
 def check_bundled_transactions(
     token_data: Optional[Dict] = None,
     mint_address: Optional[str] = None,
-    verbose: bool = True
-) -> Dict[str, Any]:
+    verbose: bool = True,
+    *,
+    now_ms: Optional[int] = None
+) -> BundledTxCheck:
     """
     Heuristic check for bundled/cabal transactions.
     
@@ -541,9 +571,11 @@ def check_bundled_transactions(
         token_data: Pre-fetched DexScreener token data (optional).
         mint_address: Token mint address (used if token_data not provided).
         verbose: If True, print status messages.
+        now_ms: Current Unix time in milliseconds (defaults to time.time()).
+            Lets callers share one clock reading and tests pin the age.
         
     Returns:
-        Dict with keys:
+        BundledTxCheck (also readable as a dict) with fields:
         - level: DANGER, WARNING, OK, or UNKNOWN
         - token_age_hours: Age of token in hours (if available)
         - holder_count: Number of holders (if available, from txns)
@@ -554,12 +586,7 @@ def check_bundled_transactions(
         token_data = _get_token_data_from_dexscreener(mint_address, verbose=verbose)
     
     if not token_data:
-        return {
-            "level": LEVEL_UNKNOWN,
-            "token_age_hours": None,
-            "holder_count": None,
-            "reason": "Could not fetch token data"
-        }
+        return _BUNDLED_NO_DATA
     
     try:
         # Get token creation time
@@ -568,10 +595,9 @@ def check_bundled_transactions(
         token_age_hours = None
         if pair_created_at:
             # pairCreatedAt is Unix timestamp in milliseconds
-            created_time = datetime.fromtimestamp(pair_created_at / 1000)
-            now = datetime.now()
-            age_delta = now - created_time
-            token_age_hours = age_delta.total_seconds() / 3600
+            if now_ms is None:
+                now_ms = int(time.time() * 1000)
+            token_age_hours = (now_ms - pair_created_at) / 3_600_000
         
         # Estimate holder count from transactions (heuristic)
         # A rough estimate: unique buyers in 24h as proxy for holders
@@ -615,22 +641,17 @@ def check_bundled_transactions(
             if verbose:
                 print(f"  {Fore.GREEN}✅ {reason}{Style.RESET_ALL}")
         
-        return {
-            "level": level,
-            "token_age_hours": round(token_age_hours, 2) if token_age_hours else None,
-            "holder_count": h1_buys,  # Using h1 buys as proxy
-            "reason": reason
-        }
+        return BundledTxCheck(
+            level,
+            round(token_age_hours, 2) if token_age_hours else None,
+            h1_buys,  # Using h1 buys as proxy
+            reason,
+        )
         
     except Exception as e:
         if verbose:
             print(f"  {Fore.YELLOW}⚠️  Error checking bundled tx: {e}{Style.RESET_ALL}")
-        return {
-            "level": LEVEL_UNKNOWN,
-            "token_age_hours": None,
-            "holder_count": None,
-            "reason": f"Error: {str(e)[:50]}"
-        }
+        return BundledTxCheck(LEVEL_UNKNOWN, None, None, f"Error: {str(e)[:50]}")
 
 
 # =============================================================================
@@ -968,145 +989,248 @@ def check_cabal_topology(
 # COMPREHENSIVE SECURITY CHECK
 # =============================================================================
 
-def comprehensive_security_check(
+# Shared pool for the independent network fetches of comprehensive_security_check.
+# main runs up to 4 checks at once with up to 3 fetches each.
+_SECURITY_POOL = ThreadPoolExecutor(max_workers=12, thread_name_prefix="shield")
+
+_SKIPPED_REASON = "Skipped - earlier check returned DANGER"
+
+
+def _skipped_security_results() -> Dict[str, Any]:
+    """
+    UNKNOWN placeholder for every check, in the shape that check returns.
+    
+    Filled in for checks a fast-fail exit never ran, so callers reading
+    per-check fields (e.g. social_presence["has_twitter"]) still work.
+    """
+    return {
+        "rugcheck": {"is_safe": True, "level": LEVEL_UNKNOWN, "reason": _SKIPPED_REASON},
+        "holder_concentration": HolderCheck(LEVEL_UNKNOWN, None, _SKIPPED_REASON, "skipped"),
+        "honeypot": HoneypotCheck(LEVEL_UNKNOWN, None, None, _SKIPPED_REASON),
+        "bundled_tx": BundledTxCheck(LEVEL_UNKNOWN, None, None, _SKIPPED_REASON),
+        "cabal_topology": {
+            "is_cabal": False,
+            "level": LEVEL_UNKNOWN,
+            "common_funders": [],
+            "reason": _SKIPPED_REASON
+        },
+        "clone_detection": {
+            "level": LEVEL_UNKNOWN,
+            "reason": _SKIPPED_REASON,
+            "is_clone": False,
+            "clone_of": None,
+            "similarity_score": 0,
+            "matches": []
+        },
+        "social_presence": SocialCheckResult(LEVEL_UNKNOWN, _SKIPPED_REASON, 0),
+        "news_validation": {
+            "level": LEVEL_UNKNOWN,
+            "reason": _SKIPPED_REASON,
+            "has_news": False,
+            "article_count": 0,
+            "articles": []
+        },
+        "goplus_security": {
+            "level": LEVEL_UNKNOWN,
+            "reason": _SKIPPED_REASON,
+            "checks": {}
+        },
+    }
+
+
+def _submit_security_io(
     mint_address: str,
-    token_data: Optional[Dict] = None,
-    symbol: Optional[str] = None,
-    name: Optional[str] = None,
-    matched_narrative: Optional[str] = None,
+    fetch_dexscreener: bool,
     verbose: bool = True
+) -> Dict[str, Future]:
+    """Start the RugCheck, holder RPC and (optionally) DexScreener fetches concurrently."""
+    futures = {
+        "rugcheck": _SECURITY_POOL.submit(check_security, mint_address, verbose=verbose),
+        "rpc_holders": _SECURITY_POOL.submit(_get_holders_from_rpc, mint_address, verbose=verbose),
+    }
+    if fetch_dexscreener:
+        futures["dexscreener"] = _SECURITY_POOL.submit(
+            _get_token_data_from_dexscreener, mint_address, verbose=verbose
+        )
+    return futures
+
+
+def _cancel_security_io(futures: Dict[str, Future]) -> None:
+    """Cancel prefetches that have not started yet (running ones finish on their own)."""
+    for future in futures.values():
+        future.cancel()
+
+
+def _security_io_result(future: Future, default: Any, verbose: bool = True) -> Any:
+    """Wait for a prefetch; fail open with default on timeout or error."""
+    try:
+        return future.result(timeout=SECURITY_IO_TIMEOUT_SECONDS)
+    except Exception as e:
+        if verbose:
+            print(f"  {Fore.YELLOW}⚠️  Security fetch failed or timed out: {e!r}{Style.RESET_ALL}")
+        return default
+
+
+def _finalize_security_results(
+    results: Dict[str, Any],
+    verbose: bool = True,
+    skipped: bool = False
 ) -> Dict[str, Any]:
     """
-    Run all security checks and aggregate results.
-    
-    Tiered validation order:
-    1. RugCheck basic check (existing check_security)
-    2. Holder concentration check (RPC or RugCheck topHolders)
-    3. Honeypot detection (DexScreener txns)
-    4. Bundled transaction detection (heuristic)
-    5. Cabal topology detection (star pattern funding)
-    6. Clone detection (fuzzy name matching via DexScreener)
-    7. Social presence check (Twitter, Telegram, Discord, Website)
-    8. News validation (Google News RSS feed)
-    9. GoPlus security check (honeypot, mintable, hidden owner)
+    Derive overall level, clamp the safety score and print the summary.
     
-    Args:
-        mint_address: The token's mint address.
-        token_data: Pre-fetched DexScreener data (optional, will fetch if needed).
-        symbol: Token symbol (e.g., "TRUMP") for clone detection.
-        name: Token full name (e.g., "Trump Victory Token") for clone detection.
-        matched_narrative: Narrative from Polymarket for news validation.
-        verbose: If True, print status messages.
-        
-    Returns:
-        Dict with keys:
-        - is_safe: Boolean overall assessment
-        - overall_level: DANGER, WARNING, or OK
-        - safety_score: 0-100 score (higher = safer)
-        - rugcheck: Result from check_security
-        - holder_concentration: Result from check_holder_concentration
-        - honeypot: Result from check_honeypot
-        - bundled_tx: Result from check_bundled_transactions
-        - cabal_topology: Result from check_cabal_topology
-        - clone_detection: Result from check_clone_token
-        - social_presence: Result from check_social_presence
-        - news_validation: Result from validate_news
-        - goplus_security: Result from check_goplus_security
-        - danger_flags: List of danger-level issues
-        - warning_flags: List of warning-level issues
+    With skipped=True (fast-fail exit), every check that has not run yet
+    is filled with an UNKNOWN result so the dict keeps its full shape.
     """
+    if skipped:
+        for key, placeholder in _skipped_security_results().items():
+            if not results[key]:
+                results[key] = placeholder
+    
+    # Calculate overall level
+    if len(results["danger_flags"]) > 0:
+        results["overall_level"] = LEVEL_DANGER
+        results["is_safe"] = False
+    elif len(results["warning_flags"]) > 0:
+        results["overall_level"] = LEVEL_WARNING
+        # Still safe but with caution
+        results["is_safe"] = True
+    else:
+        results["overall_level"] = LEVEL_OK
+        results["is_safe"] = True
+    
+    # Clamp safety score
+    results["safety_score"] = max(0, min(100, results["safety_score"]))
+    
+    # Print summary
     if verbose:
         print(f"\n{Fore.CYAN}{'─'*50}")
-        print(f"🛡️  COMPREHENSIVE SECURITY CHECK")
+        print(f"📊 SECURITY SUMMARY")
         print(f"{'─'*50}{Style.RESET_ALL}")
-        print(f"Token: {Fore.YELLOW}{mint_address[:30]}...{Style.RESET_ALL}\n")
-    
-    results = {
-        "is_safe": True,
-        "overall_level": LEVEL_OK,
-        "safety_score": 100,
-        "rugcheck": {},
-        "holder_concentration": {},
-        "honeypot": {},
-        "bundled_tx": {},
-        "cabal_topology": {},
-        "clone_detection": {},
-        "social_presence": {},
-        "news_validation": {},
-        "goplus_security": {},
-        "danger_flags": [],
-        "warning_flags": []
-    }
+        
+        level_color = Fore.GREEN if results["overall_level"] == LEVEL_OK else (
+            Fore.YELLOW if results["overall_level"] == LEVEL_WARNING else Fore.RED
+        )
+        print(f"Overall: {level_color}{results['overall_level']}{Style.RESET_ALL}")
+        print(f"Safety Score: {results['safety_score']}/100")
+        
+        if results["danger_flags"]:
+            print(f"\n{Fore.RED}🚨 DANGER FLAGS:{Style.RESET_ALL}")
+            for flag in results["danger_flags"]:
+                print(f"  • {flag}")
+        
+        if results["warning_flags"]:
+            print(f"\n{Fore.YELLOW}⚠️  WARNING FLAGS:{Style.RESET_ALL}")
+            for flag in results["warning_flags"]:
+                print(f"  • {flag}")
+        
+        print(f"\n{Fore.CYAN}{'─'*50}{Style.RESET_ALL}\n")
     
-    # Store holder addresses for cabal check (will be populated by holder_concentration check)
-    holder_addresses = []
+    return results
+
+
+@dataclass
+class _SecurityScan:
+    """Inputs and running state shared by the tiers of one security check."""
+    mint_address: str
+    token_data: Optional[Dict]
+    symbol: Optional[str]
+    name: Optional[str]
+    matched_narrative: Optional[str]
+    verbose: bool
+    results: Dict[str, Any]
+    io_futures: Dict[str, Future]
+    # One clock reading shared by the time-based checks
+    now_ms: int
+    # Holder addresses for the cabal check (populated by the holder tier)
+    holder_addresses: List[str] = field(default_factory=list)
+
+
+def _tier_honeypot(scan: _SecurityScan) -> None:
+    """Tier 1: Honeypot detection (no I/O, uses token_data)."""
+    results = scan.results
+    if scan.verbose:
+        print(f"\n{Fore.WHITE}[1/9] Honeypot Detection{Style.RESET_ALL}")
+    honeypot_result = check_honeypot(token_data=scan.token_data, verbose=scan.verbose)
+    results["honeypot"] = honeypot_result
     
-    # Fetch DexScreener data once for reuse
-    if token_data is None:
-        if verbose:
-            print(f"{Fore.WHITE}📡 Fetching DexScreener data...{Style.RESET_ALL}")
-        token_data = _get_token_data_from_dexscreener(mint_address, verbose=verbose)
+    if honeypot_result.level == LEVEL_DANGER:
+        results["danger_flags"].append(honeypot_result.reason)
+        results["safety_score"] -= 40  # Honeypot is very serious
+    elif honeypot_result.level == LEVEL_WARNING:
+        results["warning_flags"].append(honeypot_result.reason)
+        results["safety_score"] -= 15
+
+
+def _tier_bundled_tx(scan: _SecurityScan) -> None:
+    """Tier 2: Bundled transaction detection (no I/O, uses token_data)."""
+    results = scan.results
+    if scan.verbose:
+        print(f"\n{Fore.WHITE}[2/9] Bundled Transaction Check{Style.RESET_ALL}")
+    bundled_result = check_bundled_transactions(
+        token_data=scan.token_data, verbose=scan.verbose, now_ms=scan.now_ms
+    )
+    results["bundled_tx"] = bundled_result
     
-    # Tier 1: RugCheck basic check
-    if verbose:
-        print(f"\n{Fore.WHITE}[1/9] RugCheck Security Scan{Style.RESET_ALL}")
-    is_safe_rc, reason_rc = check_security(mint_address, verbose=verbose)
+    if bundled_result.level == LEVEL_DANGER:
+        results["danger_flags"].append(bundled_result.reason)
+        results["safety_score"] -= 25
+    elif bundled_result.level == LEVEL_WARNING:
+        results["warning_flags"].append(bundled_result.reason)
+        results["safety_score"] -= 10
+
+
+def _tier_rugcheck(scan: _SecurityScan) -> None:
+    """Tier 3: RugCheck basic check (starts the network fetches if not yet running)."""
+    results = scan.results
+    if not scan.io_futures:
+        scan.io_futures = _submit_security_io(scan.mint_address, fetch_dexscreener=False, verbose=scan.verbose)
+    
+    if scan.verbose:
+        print(f"\n{Fore.WHITE}[3/9] RugCheck Security Scan{Style.RESET_ALL}")
+    is_safe_rc, reason_rc = _security_io_result(
+        scan.io_futures["rugcheck"], (True, "Security check timed out"), verbose=scan.verbose
+    )
     results["rugcheck"] = {"is_safe": is_safe_rc, "reason": reason_rc}
     
     if not is_safe_rc:
         results["danger_flags"].append(f"RugCheck: {reason_rc}")
         results["safety_score"] -= 35
-    
-    # Tier 2: Holder concentration check
-    if verbose:
-        print(f"\n{Fore.WHITE}[2/9] Holder Concentration Analysis{Style.RESET_ALL}")
+
+
+def _tier_holder_concentration(scan: _SecurityScan) -> None:
+    """Tier 4: Holder concentration check."""
+    results = scan.results
+    if scan.verbose:
+        print(f"\n{Fore.WHITE}[4/9] Holder Concentration Analysis{Style.RESET_ALL}")
     
     # Get holders via RPC first to capture addresses for cabal check
-    rpc_holders = _get_holders_from_rpc(mint_address, verbose=verbose)
+    rpc_holders = _security_io_result(scan.io_futures["rpc_holders"], None, verbose=scan.verbose)
     if rpc_holders:
-        holder_addresses = [h.get("address", "") for h in rpc_holders if h.get("address")]
+        scan.holder_addresses = [h.get("address", "") for h in rpc_holders if h.get("address")]
     
-    holder_result = check_holder_concentration(mint_address, verbose=verbose)
+    # Reuse the fetched list (or [] if it failed) instead of a second RPC call
+    holder_result = check_holder_concentration(
+        scan.mint_address, verbose=scan.verbose, holders=rpc_holders or []
+    )
     results["holder_concentration"] = holder_result
     
-    if holder_result["level"] == LEVEL_DANGER:
-        results["danger_flags"].append(holder_result["reason"])
+    if holder_result.level == LEVEL_DANGER:
+        results["danger_flags"].append(holder_result.reason)
         results["safety_score"] -= 30
-    elif holder_result["level"] == LEVEL_WARNING:
-        results["warning_flags"].append(holder_result["reason"])
-        results["safety_score"] -= 10
-    
-    # Tier 3: Honeypot detection
-    if verbose:
-        print(f"\n{Fore.WHITE}[3/9] Honeypot Detection{Style.RESET_ALL}")
-    honeypot_result = check_honeypot(token_data=token_data, verbose=verbose)
-    results["honeypot"] = honeypot_result
-    
-    if honeypot_result["level"] == LEVEL_DANGER:
-        results["danger_flags"].append(honeypot_result["reason"])
-        results["safety_score"] -= 40  # Honeypot is very serious
-    elif honeypot_result["level"] == LEVEL_WARNING:
-        results["warning_flags"].append(honeypot_result["reason"])
-        results["safety_score"] -= 15
-    
-    # Tier 4: Bundled transaction detection
-    if verbose:
-        print(f"\n{Fore.WHITE}[4/9] Bundled Transaction Check{Style.RESET_ALL}")
-    bundled_result = check_bundled_transactions(token_data=token_data, verbose=verbose)
-    results["bundled_tx"] = bundled_result
-    
-    if bundled_result["level"] == LEVEL_DANGER:
-        results["danger_flags"].append(bundled_result["reason"])
-        results["safety_score"] -= 25
-    elif bundled_result["level"] == LEVEL_WARNING:
-        results["warning_flags"].append(bundled_result["reason"])
+    elif holder_result.level == LEVEL_WARNING:
+        results["warning_flags"].append(holder_result.reason)
         results["safety_score"] -= 10
+
+
+def _tier_cabal_topology(scan: _SecurityScan) -> None:
+    """Tier 5: Cabal topology detection (if enabled)."""
+    results = scan.results
+    verbose = scan.verbose
+    mint_address = scan.mint_address
     
-    # Tier 5: Cabal topology detection (if enabled)
     # Check cache first to save Helius credits (only if tracing is enabled)
-    cabal_cached = False
     if config.ENABLE_CABAL_TRACING and config.ENABLE_CABAL_CACHING and StateManager.was_cabal_traced(mint_address):
-        cabal_cached = True
         if verbose:
             print(f"\n{Fore.WHITE}[5/9] Cabal Topology Detection: CACHED (previously traced){Style.RESET_ALL}")
         results["cabal_topology"] = {
@@ -1115,11 +1239,11 @@ def comprehensive_security_check(
             "common_funders": [],
             "reason": "Cached - previously traced as safe"
         }
-    elif config.ENABLE_CABAL_TRACING and holder_addresses:
+    elif config.ENABLE_CABAL_TRACING and scan.holder_addresses:
         if verbose:
             print(f"\n{Fore.WHITE}[5/9] Cabal Topology Detection{Style.RESET_ALL}")
         
-        cabal_result = check_cabal_topology(holder_addresses, verbose=verbose)
+        cabal_result = check_cabal_topology(scan.holder_addresses, verbose=verbose)
         results["cabal_topology"] = cabal_result
         
         # Record that we've traced this token (only if trace completed successfully)
@@ -1136,7 +1260,7 @@ def comprehensive_security_check(
         # Cabal check skipped
         if verbose and not config.ENABLE_CABAL_TRACING:
             print(f"\n{Fore.WHITE}[5/9] Cabal Detection: SKIPPED (disabled){Style.RESET_ALL}")
-        elif verbose and not holder_addresses:
+        elif verbose and not scan.holder_addresses:
             print(f"\n{Fore.WHITE}[5/9] Cabal Detection: SKIPPED (no holder addresses){Style.RESET_ALL}")
         results["cabal_topology"] = {
             "is_cabal": False,
@@ -1144,16 +1268,19 @@ def comprehensive_security_check(
             "common_funders": [],
             "reason": "Cabal check skipped"
         }
-    
-    # Tier 6: Clone Detection
-    if symbol and name:
-        if verbose:
+
+
+def _tier_clone_detection(scan: _SecurityScan) -> None:
+    """Tier 6: Clone detection."""
+    results = scan.results
+    if scan.symbol and scan.name:
+        if scan.verbose:
             print(f"\n{Fore.WHITE}[6/9] Clone Detection{Style.RESET_ALL}")
         clone_result = check_clone_token(
-            symbol=symbol,
-            name=name,
-            mint_address=mint_address,
-            verbose=verbose
+            symbol=scan.symbol,
+            name=scan.name,
+            mint_address=scan.mint_address,
+            verbose=scan.verbose
         )
         results["clone_detection"] = clone_result
         
@@ -1164,7 +1291,7 @@ def comprehensive_security_check(
             results["warning_flags"].append(clone_result["reason"])
             results["safety_score"] -= 10
     else:
-        if verbose:
+        if scan.verbose:
             print(f"\n{Fore.WHITE}[6/9] Clone Detection: SKIPPED (no symbol/name){Style.RESET_ALL}")
         results["clone_detection"] = {
             "level": LEVEL_UNKNOWN,
@@ -1174,44 +1301,44 @@ def comprehensive_security_check(
             "similarity_score": 0,
             "matches": []
         }
-    
-    # Tier 7: Social Presence Check
-    if token_data:
-        if verbose:
+
+
+def _tier_social_presence(scan: _SecurityScan) -> None:
+    """Tier 7: Social presence check."""
+    results = scan.results
+    if scan.token_data:
+        if scan.verbose:
             print(f"\n{Fore.WHITE}[7/9] Social Presence Check{Style.RESET_ALL}")
-        social_result = check_social_presence(token_data=token_data, verbose=verbose)
+        social_result = check_social_presence(token_data=scan.token_data, verbose=scan.verbose)
         results["social_presence"] = social_result
         
-        if social_result["level"] == LEVEL_DANGER:
-            results["danger_flags"].append(f"Social: {social_result['reason']}")
+        if social_result.level == LEVEL_DANGER:
+            results["danger_flags"].append(f"Social: {social_result.reason}")
             results["safety_score"] -= 20
-        elif social_result["level"] == LEVEL_WARNING:
-            results["warning_flags"].append(social_result["reason"])
+        elif social_result.level == LEVEL_WARNING:
+            results["warning_flags"].append(social_result.reason)
             results["safety_score"] -= 10
     else:
-        if verbose:
+        if scan.verbose:
             print(f"\n{Fore.WHITE}[7/9] Social Presence: SKIPPED (no token data){Style.RESET_ALL}")
-        results["social_presence"] = {
-            "level": LEVEL_UNKNOWN,
-            "reason": "Social check skipped - no token data",
-            "has_twitter": False,
-            "has_telegram": False,
-            "has_discord": False,
-            "has_website": False,
-            "social_count": 0
-        }
-    
-    # Tier 8: News Validation
+        results["social_presence"] = SocialCheckResult(
+            LEVEL_UNKNOWN, "Social check skipped - no token data", 0
+        )
+
+
+def _tier_news_validation(scan: _SecurityScan) -> None:
+    """Tier 8: News validation."""
+    results = scan.results
     # Build query from symbol/name, use matched_narrative for better results
-    news_query = name or symbol or ""
+    news_query = scan.name or scan.symbol or ""
     if news_query:
-        if verbose:
+        if scan.verbose:
             print(f"\n{Fore.WHITE}[8/9] News Validation{Style.RESET_ALL}")
         news_result = validate_news(
             query=news_query,
-            token_name=name,
-            matched_narrative=matched_narrative,
-            verbose=verbose
+            token_name=scan.name,
+            matched_narrative=scan.matched_narrative,
+            verbose=scan.verbose
         )
         results["news_validation"] = news_result
         
@@ -1222,7 +1349,7 @@ def comprehensive_security_check(
             results["warning_flags"].append(news_result["reason"])
             results["safety_score"] -= 10
     else:
-        if verbose:
+        if scan.verbose:
             print(f"\n{Fore.WHITE}[8/9] News Validation: SKIPPED (no query){Style.RESET_ALL}")
         results["news_validation"] = {
             "level": LEVEL_UNKNOWN,
@@ -1231,13 +1358,16 @@ def comprehensive_security_check(
             "article_count": 0,
             "articles": []
         }
-    
-    # Tier 9: GoPlus Security Check
-    if verbose:
+
+
+def _tier_goplus_security(scan: _SecurityScan) -> None:
+    """Tier 9: GoPlus security check."""
+    results = scan.results
+    if scan.verbose:
         print(f"\n{Fore.WHITE}[9/9] GoPlus Security Check{Style.RESET_ALL}")
     try:
         # GoPlus check is async, run it synchronously
-        goplus_result = asyncio.run(goplus_security.check_goplus_security(mint_address))
+        goplus_result = asyncio.run(goplus_security.check_goplus_security(scan.mint_address))
         results["goplus_security"] = goplus_result
         
         if goplus_result["level"] == LEVEL_DANGER:
@@ -1247,54 +1377,136 @@ def comprehensive_security_check(
             results["warning_flags"].append(goplus_result["reason"])
             results["safety_score"] -= 10
     except Exception as e:
-        if verbose:
+        if scan.verbose:
             print(f"  {Fore.YELLOW}⚠️  GoPlus check failed: {e}{Style.RESET_ALL}")
         results["goplus_security"] = {
             "level": LEVEL_UNKNOWN,
             "reason": f"GoPlus check failed: {str(e)[:50]}",
             "checks": {}
         }
+
+
+# Tiers in run order: cheap in-memory checks first, then network checks
+_SECURITY_TIERS = (
+    _tier_honeypot,
+    _tier_bundled_tx,
+    _tier_rugcheck,
+    _tier_holder_concentration,
+    _tier_cabal_topology,
+    _tier_clone_detection,
+    _tier_social_presence,
+    _tier_news_validation,
+    _tier_goplus_security,
+)
+
+
+def comprehensive_security_check(
+    mint_address: str,
+    token_data: Optional[Dict] = None,
+    symbol: Optional[str] = None,
+    name: Optional[str] = None,
+    matched_narrative: Optional[str] = None,
+    verbose: bool = True,
+    fast_fail: bool = False
+) -> Dict[str, Any]:
+    """
+    Run all security checks and aggregate results.
     
-    # Calculate overall level
-    if len(results["danger_flags"]) > 0:
-        results["overall_level"] = LEVEL_DANGER
-        results["is_safe"] = False
-    elif len(results["warning_flags"]) > 0:
-        results["overall_level"] = LEVEL_WARNING
-        # Still safe but with caution
-        results["is_safe"] = True
-    else:
-        results["overall_level"] = LEVEL_OK
-        results["is_safe"] = True
-    
-    # Clamp safety score
-    results["safety_score"] = max(0, min(100, results["safety_score"]))
+    Tiered validation order (cheap in-memory checks first):
+    1. Honeypot detection (DexScreener txns)
+    2. Bundled transaction detection (heuristic)
+    3. RugCheck basic check (existing check_security)
+    4. Holder concentration check (RPC or RugCheck topHolders)
+    5. Cabal topology detection (star pattern funding)
+    6. Clone detection (fuzzy name matching via DexScreener)
+    7. Social presence check (Twitter, Telegram, Discord, Website)
+    8. News validation (Google News RSS feed)
+    9. GoPlus security check (honeypot, mintable, hidden owner)
     
-    # Print summary
+    Args:
+        mint_address: The token's mint address.
+        token_data: Pre-fetched DexScreener data (optional, will fetch if needed).
+        symbol: Token symbol (e.g., "TRUMP") for clone detection.
+        name: Token full name (e.g., "Trump Victory Token") for clone detection.
+        matched_narrative: Narrative from Polymarket for news validation.
+        verbose: If True, print status messages.
+        fast_fail: If True, stop at the first tier that raises a DANGER flag
+            and mark the remaining checks UNKNOWN (skips their network calls).
+        
+    Returns:
+        Dict with keys:
+        - is_safe: Boolean overall assessment
+        - overall_level: DANGER, WARNING, or OK
+        - safety_score: 0-100 score (higher = safer)
+        - rugcheck: Result from check_security
+        - holder_concentration: Result from check_holder_concentration
+        - honeypot: Result from check_honeypot
+        - bundled_tx: Result from check_bundled_transactions
+        - cabal_topology: Result from check_cabal_topology
+        - clone_detection: Result from check_clone_token
+        - social_presence: Result from check_social_presence
+        - news_validation: Result from validate_news
+        - goplus_security: Result from check_goplus_security
+        - danger_flags: List of danger-level issues
+        - warning_flags: List of warning-level issues
+    """
     if verbose:
         print(f"\n{Fore.CYAN}{'─'*50}")
-        print(f"📊 SECURITY SUMMARY")
+        print(f"🛡️  COMPREHENSIVE SECURITY CHECK")
         print(f"{'─'*50}{Style.RESET_ALL}")
-        
-        level_color = Fore.GREEN if results["overall_level"] == LEVEL_OK else (
-            Fore.YELLOW if results["overall_level"] == LEVEL_WARNING else Fore.RED
-        )
-        print(f"Overall: {level_color}{results['overall_level']}{Style.RESET_ALL}")
-        print(f"Safety Score: {results['safety_score']}/100")
-        
-        if results["danger_flags"]:
-            print(f"\n{Fore.RED}🚨 DANGER FLAGS:{Style.RESET_ALL}")
-            for flag in results["danger_flags"]:
-                print(f"  • {flag}")
-        
-        if results["warning_flags"]:
-            print(f"\n{Fore.YELLOW}⚠️  WARNING FLAGS:{Style.RESET_ALL}")
-            for flag in results["warning_flags"]:
-                print(f"  • {flag}")
-        
-        print(f"\n{Fore.CYAN}{'─'*50}{Style.RESET_ALL}\n")
+        print(f"Token: {Fore.YELLOW}{mint_address[:30]}...{Style.RESET_ALL}\n")
     
-    return results
+    results = {
+        "is_safe": True,
+        "overall_level": LEVEL_OK,
+        "safety_score": 100,
+        "rugcheck": {},
+        "holder_concentration": {},
+        "honeypot": {},
+        "bundled_tx": {},
+        "cabal_topology": {},
+        "clone_detection": {},
+        "social_presence": {},
+        "news_validation": {},
+        "goplus_security": {},
+        "danger_flags": [],
+        "warning_flags": []
+    }
+    
+    scan = _SecurityScan(
+        mint_address=mint_address,
+        token_data=token_data,
+        symbol=symbol,
+        name=name,
+        matched_narrative=matched_narrative,
+        verbose=verbose,
+        results=results,
+        io_futures={},
+        now_ms=int(time.time() * 1000),
+    )
+    
+    # Network fetches run concurrently on _SECURITY_POOL. With fast_fail they
+    # start only after the in-memory checks pass, so a DANGER there costs no I/O.
+    if not fast_fail:
+        scan.io_futures = _submit_security_io(mint_address, fetch_dexscreener=token_data is None, verbose=verbose)
+    
+    # Fetch DexScreener data once for reuse
+    if token_data is None:
+        if verbose:
+            print(f"{Fore.WHITE}📡 Fetching DexScreener data...{Style.RESET_ALL}")
+        if "dexscreener" in scan.io_futures:
+            scan.token_data = _security_io_result(scan.io_futures["dexscreener"], None, verbose=verbose)
+        else:
+            scan.token_data = _get_token_data_from_dexscreener(mint_address, verbose=verbose)
+    
+    for tier in _SECURITY_TIERS:
+        tier(scan)
+        if fast_fail and results["danger_flags"]:
+            # Don't spend RPC/RugCheck quota on results nobody will read
+            _cancel_security_io(scan.io_futures)
+            return _finalize_security_results(results, verbose=verbose, skipped=True)
+    
+    return _finalize_security_results(results, verbose=verbose)
 
 
 # =============================================================================
@@ -10,9 +10,13 @@ Key Function:
 - check_social_presence(token_data): Evaluate social media presence
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, NamedTuple
+
+import numpy as np
 from colorama import init, Fore, Style
 
+from result_types import dict_compatible
+
 # Initialize colorama
 init(autoreset=True)
 
@@ -22,8 +26,95 @@ LEVEL_WARNING = "WARNING"
 LEVEL_OK = "OK"
 LEVEL_UNKNOWN = "UNKNOWN"
 
+# Presence bits, one per tracked social platform (SocialCheckResult.flags)
+TWITTER = 1
+TELEGRAM = 2
+DISCORD = 4
+WEBSITE = 8
+
+# DexScreener social type -> presence bit ("x" is Twitter). The lower, upper
+# and capitalized spellings are all keys, so the usual casings match with one
+# lookup and no .lower() copy; any other casing falls back to .lower().
+_SOCIAL_TYPE_BITS = {
+    variant: bit
+    for social_type, bit in (
+        ("twitter", TWITTER),
+        ("x", TWITTER),
+        ("telegram", TELEGRAM),
+        ("discord", DISCORD),
+        ("website", WEBSITE),
+    )
+    for variant in (social_type, social_type.upper(), social_type.capitalize())
+}
+
+# Display order for the reason string
+_SOCIAL_LABELS = (
+    (TWITTER, "Twitter"),
+    (TELEGRAM, "Telegram"),
+    (DISCORD, "Discord"),
+    (WEBSITE, "Website"),
+)
+
+
+@dict_compatible
+class SocialCheckResult(NamedTuple):
+    """
+    Result of check_social_presence.
+    
+    Presence is packed into `flags` (TWITTER | TELEGRAM | DISCORD | WEBSITE);
+    has_* and social_count are derived from it.
+    """
+    level: str
+    reason: str
+    flags: int
+    
+    _derived_keys = ("has_twitter", "has_telegram", "has_discord", "has_website", "social_count")
+    
+    @property
+    def has_twitter(self) -> bool:
+        return bool(self.flags & TWITTER)
+    
+    @property
+    def has_telegram(self) -> bool:
+        return bool(self.flags & TELEGRAM)
+    
+    @property
+    def has_discord(self) -> bool:
+        return bool(self.flags & DISCORD)
+    
+    @property
+    def has_website(self) -> bool:
+        return bool(self.flags & WEBSITE)
+    
+    @property
+    def social_count(self) -> int:
+        return bin(self.flags).count("1")
+
+
+# Shared result for malformed socials (immutable, safe to reuse)
+_SOCIALS_UNAVAILABLE = SocialCheckResult(LEVEL_UNKNOWN, "Socials data unavailable", 0)
 
-def check_social_presence(token_data: Dict[str, Any], verbose: bool = True) -> Dict[str, Any]:
+
+def count_social_flags(results: Iterable[SocialCheckResult]) -> Dict[str, int]:
+    """
+    Count how many results have each social platform.
+    
+    Args:
+        results: SocialCheckResults (e.g. one per scanned token)
+        
+    Returns:
+        Dict with keys twitter, telegram, discord, website -> token count
+    """
+    flags = np.fromiter((result.flags for result in results), dtype=np.uint8)
+    return {
+        "twitter": int(np.count_nonzero(flags & TWITTER)),
+        "telegram": int(np.count_nonzero(flags & TELEGRAM)),
+        "discord": int(np.count_nonzero(flags & DISCORD)),
+        "website": int(np.count_nonzero(flags & WEBSITE)),
+    }
+
+
+def check_social_presence(token_data: Dict[str, Any], verbose: bool = True) -> SocialCheckResult:
     """
     Check social media presence of a token.
     
@@ -41,9 +132,10 @@ def check_social_presence(token_data: Dict[str, Any], verbose: bool = True) -> D
         verbose: If True, print status messages using colorama
         
     Returns:
-        Dict with keys:
+        SocialCheckResult (also readable like a dict) with fields:
         - level: LEVEL_WARNING if social_count == 0, LEVEL_OK if social_count >= 1
         - reason: Human-readable explanation
+        - flags: Presence bitmask (TWITTER | TELEGRAM | DISCORD | WEBSITE)
         - has_twitter: Boolean indicating Twitter presence
         - has_telegram: Boolean indicating Telegram presence
         - has_discord: Boolean indicating Discord presence
@@ -73,90 +165,47 @@ def check_social_presence(token_data: Dict[str, Any], verbose: bool = True) -> D
         if not isinstance(socials, list):
             if verbose:
                 print(f"  {Fore.YELLOW}[WARNING] Socials not in expected format{Style.RESET_ALL}")
-            return {
-                "level": LEVEL_UNKNOWN,
-                "reason": "Socials data unavailable",
-                "has_twitter": False,
-                "has_telegram": False,
-                "has_discord": False,
-                "has_website": False,
-                "social_count": 0
-            }
-        
-        # Check for each social type
-        has_twitter = False
-        has_telegram = False
-        has_discord = False
-        has_website = False
+            return _SOCIALS_UNAVAILABLE
         
+        # Single pass: OR together the presence bit of each usable link
+        flags = 0
         for social in socials:
-            if not isinstance(social, dict):
-                continue
-            
-            social_type = social.get("type", "").lower()
-            url = social.get("url", "")
-            
-            # Only count if URL is present and non-empty
-            if not url:
+            # Well-formed entries take the fast path; anything that is not a
+            # dict, or lacks a string type or a url, is skipped
+            try:
+                social_type = social["type"]
+                url = social["url"]
+                bit = _SOCIAL_TYPE_BITS.get(social_type)
+                if bit is None:
+                    bit = _SOCIAL_TYPE_BITS.get(social_type.lower(), 0)
+            except (TypeError, KeyError, AttributeError):
                 continue
             
-            if social_type == "twitter" or social_type == "x":
-                has_twitter = True
-            elif social_type == "telegram":
-                has_telegram = True
-            elif social_type == "discord":
-                has_discord = True
-            elif social_type == "website":
-                has_website = True
+            # Only count if the URL is non-empty
+            if url:
+                flags |= bit
         
-        # Calculate total social count
-        social_count = sum([has_twitter, has_telegram, has_discord, has_website])
+        socials_found = [label for bit, label in _SOCIAL_LABELS if flags & bit]
         
         # Determine risk level
-        if social_count == 0:
+        if not socials_found:
             level = LEVEL_WARNING
             reason = "No social media presence detected - higher risk"
             if verbose:
                 print(f"  {Fore.YELLOW}[WARNING] {reason}{Style.RESET_ALL}")
         else:
             level = LEVEL_OK
-            socials_found = []
-            if has_twitter:
-                socials_found.append("Twitter")
-            if has_telegram:
-                socials_found.append("Telegram")
-            if has_discord:
-                socials_found.append("Discord")
-            if has_website:
-                socials_found.append("Website")
-            
             reason = f"Social presence confirmed: {', '.join(socials_found)}"
             if verbose:
                 print(f"  {Fore.GREEN}[OK] {reason}{Style.RESET_ALL}")
         
-        return {
-            "level": level,
-            "reason": reason,
-            "has_twitter": has_twitter,
-            "has_telegram": has_telegram,
-            "has_discord": has_discord,
-            "has_website": has_website,
-            "social_count": social_count
-        }
+        return SocialCheckResult(level, reason, flags)
         
     except Exception as e:
         if verbose:
             print(f"  {Fore.YELLOW}[ERROR] Error checking social presence: {e}{Style.RESET_ALL}")
         
-        return {
-            "level": LEVEL_UNKNOWN,
-            "reason": f"Error: {str(e)[:50]}",
-            "has_twitter": False,
-            "has_telegram": False,
-            "has_discord": False,
-            "has_website": False,
-            "social_count": 0
-        }
+        return SocialCheckResult(LEVEL_UNKNOWN, f"Error: {str(e)[:50]}", 0)
 
 
 # =============================================================================
@@ -10,9 +10,12 @@ Indicators are implemented manually (no ta-lib dependency).
 
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
 
 import aiohttp
+import numpy as np
 
 from config import (
     GECKOTERMINAL_API_URL,
@@ -26,17 +29,275 @@ from config import (
     MACD_FAST,
     MACD_SLOW,
     MACD_SIGNAL,
+    TECHNICALS_CACHE_MAX_ENTRIES,
 )
 from rate_limiter import rate_limit_geckoterminal
 
 logger = logging.getLogger(__name__)
 
+# Optional: orjson decodes the OHLCV payloads faster than stdlib json
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Optional JIT for the indicator kernels (NumPy closed forms below)
+try:
+    from numba import njit, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+    types = None
+
+
+# =============================================================================
+# INDICATOR KERNELS
+# =============================================================================
+
+def _ema_last(seed: Any, values: np.ndarray, multiplier: float) -> Any:
+    """
+    Final value of an EMA seeded with `seed` and fed `values` in order.
+
+    Closed form of the recurrence as a single dot product:
+        EMA_n = seed * (1 - m)^n + sum(m * (1 - m)^(n - 1 - j) * x_j)
+    
+    Works along the last axis, so a (K, T) matrix gives K results.
+    """
+    size = values.shape[-1]
+    decay = 1.0 - multiplier
+    weights = multiplier * decay ** np.arange(size - 1, -1, -1, dtype=np.float64)
+    return seed * decay ** size + values @ weights
+
+
+def _ema_path(seed: Any, values: np.ndarray, multiplier: float) -> np.ndarray:
+    """
+    EMA value after each element of `values` (same recurrence as `_ema_last`).
+
+    The input term is a causal convolution with the decay kernel, so every
+    power stays <= 1 (no cumulative-sum rescaling that underflows). Rows of
+    a (K, T) matrix share one lower-triangular decay matrix.
+    """
+    size = values.shape[-1]
+    decay = 1.0 - multiplier
+    powers = decay ** np.arange(size + 1, dtype=np.float64)
+    if values.ndim == 1:
+        return np.convolve(values, multiplier * powers[:-1])[:size] + seed * powers[1:]
+    
+    index = np.arange(size)
+    kernel = np.tril(multiplier * powers[np.abs(index[:, None] - index[None, :])])
+    return values @ kernel.T + np.multiply.outer(seed, powers[1:])
+
+
+def _ema_core_np(closes: np.ndarray, period: int) -> Any:
+    """SMA-seeded EMA of `closes` (NumPy closed form; needs len >= period)."""
+    return _ema_last(closes[..., :period].mean(axis=-1), closes[..., period:], 2 / (period + 1))
+
+
+def _wilder_averages_np(closes: np.ndarray, period: int) -> Tuple[Any, Any]:
+    """(avg_gain, avg_loss) of `closes` after Wilder's smoothing."""
+    changes = np.diff(closes)
+    gains = np.where(changes > 0, changes, 0.0)
+    losses = np.where(changes > 0, 0.0, -changes)
+    
+    # Wilder's smoothing is an EMA with multiplier 1/period
+    avg_gain = _ema_last(gains[..., :period].mean(axis=-1), gains[..., period:], 1 / period)
+    avg_loss = _ema_last(losses[..., :period].mean(axis=-1), losses[..., period:], 1 / period)
+    return avg_gain, avg_loss
+
+
+def _rsi_core_np(closes: np.ndarray, period: int) -> Any:
+    """Wilder RSI of `closes` (NumPy closed form; needs len >= period + 1)."""
+    avg_gain, avg_loss = _wilder_averages_np(closes, period)
+    
+    # No losses = max RSI
+    no_losses = avg_loss == 0
+    rs = avg_gain / np.where(no_losses, 1.0, avg_loss)
+    return np.where(no_losses, 100.0, 100 - (100 / (1 + rs)))
+
+
+def _macd_core_np(
+    closes: np.ndarray,
+    fast_period: int,
+    slow_period: int,
+    signal_period: int
+) -> Tuple[Any, Any, Any]:
+    """(macd_line, signal_line, histogram) of `closes` (NumPy closed form)."""
+    ema_fast, _, ema_slow, signal_line = _macd_emas_np(closes, fast_period, slow_period, signal_period)
+    macd_line = ema_fast - ema_slow
+    return (macd_line, signal_line, macd_line - signal_line)
+
+
+def _macd_emas_np(
+    closes: np.ndarray,
+    fast_period: int,
+    slow_period: int,
+    signal_period: int
+) -> Tuple[Any, Any, Any, Any]:
+    """
+    Final EMAs behind the MACD of `closes`.
+    
+    Returns (ema_fast, ema_fast_path, ema_slow, signal_line): ema_fast runs
+    over every close and gives the MACD line; ema_fast_path is the fast EMA
+    that feeds the signal line, which skips the closes before slow_period.
+    """
+    seed_fast = closes[..., :fast_period].mean(axis=-1)
+    
+    # MACD line values for signal line computation, starting from slow_period;
+    # the slow path's last value is EMA(slow) itself
+    tail = closes[..., slow_period:]
+    path_slow = _ema_path(closes[..., :slow_period].mean(axis=-1), tail, 2 / (slow_period + 1))
+    path_fast = _ema_path(seed_fast, tail, 2 / (fast_period + 1))
+    signal_line = _ema_core_np(path_fast - path_slow, signal_period)
+    
+    ema_fast = _ema_last(seed_fast, closes[..., fast_period:], 2 / (fast_period + 1))
+    return (ema_fast, path_fast[..., -1], path_slow[..., -1], signal_line)
+
+
+def _ema_core_loop(closes: np.ndarray, period: int) -> float:
+    """Single-pass loop form of `_ema_core_np` (compiled with Numba)."""
+    multiplier = 2.0 / (period + 1)
+    ema = 0.0
+    for i in range(period):
+        ema += closes[i]
+    ema /= period
+    for i in range(period, closes.size):
+        ema = (closes[i] * multiplier) + (ema * (1.0 - multiplier))
+    return ema
+
+
+def _rsi_core_loop(closes: np.ndarray, period: int) -> float:
+    """Single-pass loop form of `_rsi_core_np` (compiled with Numba)."""
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, closes.size):
+        change = closes[i] - closes[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = 0.0 if change > 0 else -change
+        if i <= period:
+            avg_gain += gain
+            avg_loss += loss
+            if i == period:
+                avg_gain /= period
+                avg_loss /= period
+        else:
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+    
+    if avg_loss == 0:
+        return 100.0
+    return 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+
+
+def _macd_core_loop(
+    closes: np.ndarray,
+    fast_period: int,
+    slow_period: int,
+    signal_period: int
+) -> Tuple[float, float, float]:
+    """
+    Loop form of `_macd_core_np` (compiled with Numba).
+    
+    One pass over `closes`: the EMAs advance side by side and each MACD
+    value is folded straight into the signal EMA, so no intermediate
+    series is materialized.
+    """
+    multiplier_fast = 2.0 / (fast_period + 1)
+    multiplier_slow = 2.0 / (slow_period + 1)
+    multiplier_signal = 2.0 / (signal_period + 1)
+    
+    ema_fast = 0.0  # EMA(fast) over every close
+    ema_f = 0.0  # EMA(fast) fed from slow_period on, for the MACD series
+    ema_slow = 0.0
+    signal_line = 0.0
+    for i in range(closes.size):
+        close = closes[i]
+        
+        # SMA seed over the first `period` closes, then the EMA recurrence
+        if i < fast_period:
+            ema_fast += close
+            if i == fast_period - 1:
+                ema_fast /= fast_period
+                ema_f = ema_fast
+        else:
+            ema_fast = (close * multiplier_fast) + (ema_fast * (1.0 - multiplier_fast))
+        if i < slow_period:
+            ema_slow += close
+            if i == slow_period - 1:
+                ema_slow /= slow_period
+            continue
+        ema_slow = (close * multiplier_slow) + (ema_slow * (1.0 - multiplier_slow))
+        ema_f = (close * multiplier_fast) + (ema_f * (1.0 - multiplier_fast))
+        
+        k = i - slow_period
+        if k < signal_period:
+            signal_line += ema_f - ema_slow
+            if k == signal_period - 1:
+                signal_line /= signal_period
+        else:
+            signal_line = ((ema_f - ema_slow) * multiplier_signal) + (signal_line * (1.0 - multiplier_signal))
+    
+    macd_line = ema_fast - ema_slow
+    return (macd_line, signal_line, macd_line - signal_line)
+
+
+_ema_core = _ema_core_np
+_rsi_core = _rsi_core_np
+_macd_core = _macd_core_np
+
+if NUMBA_AVAILABLE:
+    try:
+        # Explicit signatures compile eagerly at import (cached on disk)
+        _ema_core = njit(types.float64(types.float64[:], types.int64), cache=True)(_ema_core_loop)
+        _rsi_core = njit(types.float64(types.float64[:], types.int64), cache=True)(_rsi_core_loop)
+        _macd_core = njit(
+            types.UniTuple(types.float64, 3)(
+                types.float64[:], types.int64, types.int64, types.int64,
+            ),
+            cache=True,
+        )(_macd_core_loop)
+    except Exception as e:
+        logger.warning(f"Numba compilation of indicator kernels failed, using NumPy: {e}")
+
+
+# Indicator results for recently seen windows, keyed on (kernel, periods, raw
+# close bytes); re-scanning an unchanged window is a hash lookup. Only used
+# with the NumPy kernels: a compiled kernel recomputes a window faster than
+# its cache key can be built.
+INDICATOR_CACHE_MAX_ENTRIES = 1024
+_indicator_cache: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+_KERNELS_COMPILED = _ema_core is not _ema_core_np
+
+
+def _cached_indicator(core: Any, closes: np.ndarray, *periods: int) -> Any:
+    """Return core(closes, *periods) as float(s), memoized in a bounded LRU."""
+    key = None
+    if not _KERNELS_COMPILED:
+        key = (core, periods, closes.tobytes())
+        if key in _indicator_cache:
+            _indicator_cache.move_to_end(key)
+            return _indicator_cache[key]
+    
+    result = core(closes, *periods)
+    result = tuple(map(float, result)) if isinstance(result, tuple) else float(result)
+    
+    if key is not None:
+        _indicator_cache[key] = result
+        while len(_indicator_cache) > INDICATOR_CACHE_MAX_ENTRIES:
+            _indicator_cache.popitem(last=False)
+    return result
+
+
+# Closing prices, oldest first. Prefer a float64 ndarray (e.g. OHLCV.close):
+# it is used as-is, while a list is converted on every call.
+Closes = Union[np.ndarray, Sequence[float]]
+
 
 # =============================================================================
 # EMA (Exponential Moving Average)
 # =============================================================================
 
-def calculate_ema(closes: List[float], period: int) -> Optional[float]:
+def calculate_ema(closes: Closes, period: int) -> Optional[float]:
     """
     Calculate Exponential Moving Average.
     
@@ -45,31 +306,27 @@ def calculate_ema(closes: List[float], period: int) -> Optional[float]:
         multiplier = 2 / (period + 1)
     
     Args:
-        closes: List of closing prices (oldest first).
+        closes: Closing prices (oldest first); ndarray preferred,
+            a list is accepted but converted.
         period: EMA period (e.g., 9, 21).
     
     Returns:
         Current EMA value, or None if insufficient data.
     """
-    if not closes or len(closes) < period:
+    # Length check first: short input returns before any array is built
+    if closes is None or len(closes) < period:
         return None
+    closes = np.asarray(closes, dtype=np.float64)
     
-    # Start with SMA for initial EMA value
-    multiplier = 2 / (period + 1)
-    ema = sum(closes[:period]) / period
-    
-    # Calculate EMA for remaining values
-    for close in closes[period:]:
-        ema = (close * multiplier) + (ema * (1 - multiplier))
-    
-    return ema
+    # SMA seed, then the EMA recurrence over the remaining closes
+    return _cached_indicator(_ema_core, closes, period)
 
 
 # =============================================================================
 # RSI (Relative Strength Index)
 # =============================================================================
 
-def calculate_rsi(closes: List[float], period: int = RSI_PERIOD) -> Optional[float]:
+def calculate_rsi(closes: Closes, period: int = RSI_PERIOD) -> Optional[float]:
     """
     Calculate Relative Strength Index.
     
@@ -80,48 +337,19 @@ def calculate_rsi(closes: List[float], period: int = RSI_PERIOD) -> Optional[flo
     Uses Wilder's smoothing method.
     
     Args:
-        closes: List of closing prices (oldest first).
+        closes: Closing prices (oldest first); ndarray preferred,
+            a list is accepted but converted.
         period: RSI period (default 14).
     
     Returns:
         RSI value (0-100), or None if insufficient data.
     """
-    if not closes or len(closes) < period + 1:
-        return None
-    
-    # Calculate price changes
-    gains = []
-    losses = []
-    
-    for i in range(1, len(closes)):
-        change = closes[i] - closes[i - 1]
-        if change > 0:
-            gains.append(change)
-            losses.append(0)
-        else:
-            gains.append(0)
-            losses.append(abs(change))
-    
-    if len(gains) < period:
+    if closes is None or len(closes) < period + 1:
         return None
+    closes = np.asarray(closes, dtype=np.float64)
     
-    # Initial averages (SMA)
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
-    
-    # Wilder's smoothing for remaining values
-    for i in range(period, len(gains)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-    
-    # Calculate RSI
-    if avg_loss == 0:
-        return 100.0  # No losses = max RSI
-    
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-    
-    return rsi
+    # avg_loss == 0 (no losses) gives the max RSI of 100
+    return _cached_indicator(_rsi_core, closes, period)
 
 
 # =============================================================================
@@ -129,7 +357,7 @@ def calculate_rsi(closes: List[float], period: int = RSI_PERIOD) -> Optional[flo
 # =============================================================================
 
 def calculate_macd(
-    closes: List[float],
+    closes: Closes,
     fast_period: int = MACD_FAST,
     slow_period: int = MACD_SLOW,
     signal_period: int = MACD_SIGNAL
@@ -143,7 +371,8 @@ def calculate_macd(
         Histogram = MACD Line - Signal Line
     
     Args:
-        closes: List of closing prices (oldest first).
+        closes: Closing prices (oldest first); ndarray preferred,
+            a list is accepted but converted.
         fast_period: Fast EMA period (default 12).
         slow_period: Slow EMA period (default 26).
         signal_period: Signal line EMA period (default 9).
@@ -151,65 +380,114 @@ def calculate_macd(
     Returns:
         Tuple of (macd_line, signal_line, histogram), or None if insufficient data.
     """
-    if not closes or len(closes) < slow_period + signal_period:
+    if closes is None or len(closes) < max(slow_period + signal_period, fast_period):
         return None
+    closes = np.asarray(closes, dtype=np.float64)
     
-    # Calculate fast and slow EMAs
-    ema_fast = calculate_ema(closes, fast_period)
-    ema_slow = calculate_ema(closes, slow_period)
-    
-    if ema_fast is None or ema_slow is None:
-        return None
+    return _cached_indicator(_macd_core, closes, fast_period, slow_period, signal_period)
+
+
+# =============================================================================
+# OHLCV Data Fetching (GeckoTerminal)
+# =============================================================================
+
+# Candle fields in GeckoTerminal's ohlcv_list row order
+_OHLCV_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+
+
+@dataclass
+class OHLCV:
+    """
+    OHLCV candles stored column-wise (oldest first).
     
-    # Calculate MACD line values for signal line computation
-    macd_values = []
-    multiplier_fast = 2 / (fast_period + 1)
-    multiplier_slow = 2 / (slow_period + 1)
-    
-    # Initialize EMAs
-    ema_f = sum(closes[:fast_period]) / fast_period
-    ema_s = sum(closes[:slow_period]) / slow_period
-    
-    # Calculate MACD values starting from slow_period
-    for i in range(slow_period, len(closes)):
-        # Update EMAs
-        if i >= fast_period:
-            idx = i
-            ema_f = (closes[idx] * multiplier_fast) + (ema_f * (1 - multiplier_fast))
-        if i >= slow_period:
-            idx = i
-            ema_s = (closes[idx] * multiplier_slow) + (ema_s * (1 - multiplier_slow))
-        
-        macd_values.append(ema_f - ema_s)
+    Each field is a contiguous NumPy array, so indicators can take
+    `ohlcv.close` directly. Indexing with an int still returns the
+    candle as a dict (the format fetch_ohlcv used to return).
     
-    if len(macd_values) < signal_period:
-        return None
+    Attributes:
+        timestamp: Candle open times (unix seconds, int64)
+        open, high, low, close, volume: Candle values (float64)
+    """
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
     
-    # Calculate signal line (EMA of MACD values)
-    signal_line = calculate_ema(macd_values, signal_period)
+    @classmethod
+    def from_rows(cls, rows: Any) -> "OHLCV":
+        """Build from [timestamp, open, high, low, close, volume] rows, sorting by time."""
+        table = np.asarray(rows, dtype=np.float64).reshape(-1, len(_OHLCV_FIELDS))
+        table = table[np.argsort(table[:, 0], kind="stable")]
+        columns = np.ascontiguousarray(table.T)
+        return cls(columns[0].astype(np.int64), *columns[1:])
     
-    if signal_line is None:
-        return None
+    @classmethod
+    def from_candles(cls, candles: List[Dict[str, Any]]) -> "OHLCV":
+        """Build from a list of candle dicts (the legacy fetch_ohlcv format)."""
+        return cls.from_rows([[candle[field] for field in _OHLCV_FIELDS] for candle in candles])
     
-    # Current MACD line
-    macd_line = ema_fast - ema_slow
+    def __len__(self) -> int:
+        return self.close.size
     
-    # Histogram
-    histogram = macd_line - signal_line
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return {
+            "timestamp": int(self.timestamp[index]),
+            "open": float(self.open[index]),
+            "high": float(self.high[index]),
+            "low": float(self.low[index]),
+            "close": float(self.close[index]),
+            "volume": float(self.volume[index]),
+        }
+
+
+# Shared GeckoTerminal session (keep-alive connections reused across fetches).
+# A session is bound to the loop it was created on, so it is recreated if
+# the running loop changes.
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session, creating it on first use.
     
-    return (macd_line, signal_line, histogram)
+    A session belongs to the event loop that created it; when called from a
+    new loop (e.g. a second asyncio.run), the old session is closed before
+    it is replaced so its connector and sockets are not leaked.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        if _session is not None and not _session.closed:
+            try:
+                await _session.close()
+            except Exception as e:
+                logger.debug(f"Closing previous GeckoTerminal session failed: {e}")
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SECONDS),
+        )
+        _session_loop = loop
+    return _session
 
 
-# =============================================================================
-# OHLCV Data Fetching (GeckoTerminal)
-# =============================================================================
+async def close_session() -> None:
+    """Close the shared GeckoTerminal session (call on shutdown)."""
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
 
 @rate_limit_geckoterminal
 async def fetch_ohlcv(
     pool_address: str,
     timeframe: str = "minute",
     limit: int = 100
-) -> Optional[List[Dict[str, Any]]]:
+) -> Optional[OHLCV]:
     """
     Fetch OHLCV candle data from GeckoTerminal API.
     
@@ -219,7 +497,7 @@ async def fetch_ohlcv(
         limit: Number of candles to fetch (max 1000).
     
     Returns:
-        List of OHLCV dicts with keys: timestamp, open, high, low, close, volume.
+        OHLCV columns (timestamp, open, high, low, close, volume), oldest first.
         Returns None on error.
     """
     url = f"{GECKOTERMINAL_API_URL}/networks/solana/pools/{pool_address}/ohlcv/{timeframe}"
@@ -229,47 +507,30 @@ async def fetch_ohlcv(
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=API_TIMEOUT_SECONDS)
-            ) as response:
-                if response.status != 200:
-                    logger.warning(
-                        f"GeckoTerminal OHLCV fetch failed: {response.status} for pool {pool_address}"
-                    )
-                    return None
-                
-                data = await response.json()
-                
-                # Parse GeckoTerminal response format
-                ohlcv_list = data.get("data", {}).get("attributes", {}).get("ohlcv_list", [])
-                
-                if not ohlcv_list:
-                    logger.warning(f"No OHLCV data returned for pool {pool_address}")
-                    return None
-                
-                # Convert to standardized format
-                # GeckoTerminal format: [timestamp, open, high, low, close, volume]
-                candles = []
-                for candle in ohlcv_list:
-                    if len(candle) >= 6:
-                        candles.append({
-                            "timestamp": int(candle[0]),
-                            "open": float(candle[1]),
-                            "high": float(candle[2]),
-                            "low": float(candle[3]),
-                            "close": float(candle[4]),
-                            "volume": float(candle[5])
-                        })
-                
-                # Sort by timestamp ascending (oldest first)
-                candles.sort(key=lambda x: x["timestamp"])
-                
-                logger.debug(f"Fetched {len(candles)} OHLCV candles for pool {pool_address}")
-                return candles
-                
+        session = await _get_session()
+        async with session.get(url, params=params) as response:
+            if response.status != 200:
+                logger.warning(
+                    f"GeckoTerminal OHLCV fetch failed: {response.status} for pool {pool_address}"
+                )
+                return None
+            
+            data = _json_loads(await response.read())
+            
+            # Parse GeckoTerminal response format
+            ohlcv_list = data.get("data", {}).get("attributes", {}).get("ohlcv_list", [])
+            
+            if not ohlcv_list:
+                logger.warning(f"No OHLCV data returned for pool {pool_address}")
+                return None
+            
+            # GeckoTerminal format: [timestamp, open, high, low, close, volume]
+            # (numeric strings are parsed by NumPy; rows sorted oldest first)
+            candles = OHLCV.from_rows([candle[:6] for candle in ohlcv_list if len(candle) >= 6])
+            
+            logger.debug(f"Fetched {len(candles)} OHLCV candles for pool {pool_address}")
+            return candles
+            
     except asyncio.TimeoutError:
         logger.warning(f"GeckoTerminal OHLCV fetch timeout for pool {pool_address}")
         return None
@@ -282,6 +543,278 @@ async def fetch_ohlcv(
 # Combined Technical Signals
 # =============================================================================
 
+@dataclass
+class IndicatorState:
+    """
+    Running indicator values for one pool, as of its latest closed candle.
+    
+    Every field but the first two is the final value of the matching EMA
+    (or Wilder average) over all closes up to and including `last_close`,
+    so one more close advances each in O(1).
+    """
+    last_timestamp: int
+    last_close: float
+    ema_short: float
+    ema_long: float
+    macd_fast: float
+    macd_fast_path: float  # Fast EMA feeding the signal line (see _macd_emas_np)
+    macd_slow: float
+    macd_signal: float
+    avg_gain: float
+    avg_loss: float
+
+
+class TechnicalsCalculator:
+    """
+    Indicator set with fixed periods, built once and reused for every pool.
+    
+    Periods and the minimum window length are resolved at construction, so
+    compute() converts the closes once and calls each kernel directly
+    instead of re-validating the input per indicator.
+    """
+    
+    def __init__(
+        self,
+        rsi_period: int = RSI_PERIOD,
+        ema_short_period: int = EMA_SHORT_PERIOD,
+        ema_long_period: int = EMA_LONG_PERIOD,
+        macd_fast: int = MACD_FAST,
+        macd_slow: int = MACD_SLOW,
+        macd_signal: int = MACD_SIGNAL,
+    ):
+        self.rsi_period = rsi_period
+        self.ema_short_period = ema_short_period
+        self.ema_long_period = ema_long_period
+        self.macd_fast = macd_fast
+        self.macd_slow = macd_slow
+        self.macd_signal = macd_signal
+        
+        # Shortest window every indicator can be calculated from
+        self.min_candles = max(
+            rsi_period + 1,
+            ema_short_period,
+            ema_long_period,
+            macd_fast,
+            macd_slow + macd_signal,
+        )
+        
+        self._mult_short = 2.0 / (ema_short_period + 1)
+        self._mult_long = 2.0 / (ema_long_period + 1)
+        self._mult_fast = 2.0 / (macd_fast + 1)
+        self._mult_slow = 2.0 / (macd_slow + 1)
+        self._mult_signal = 2.0 / (macd_signal + 1)
+    
+    def compute(self, closes: Closes) -> Optional[Dict[str, Any]]:
+        """
+        Calculate all indicators for one series of closes.
+        
+        Args:
+            closes: Closing prices (list or array, oldest first).
+        
+        Returns:
+            Signals dict (see get_technical_signals), or None if the series
+            is shorter than min_candles.
+        """
+        if closes is None or len(closes) < self.min_candles:
+            return None
+        closes = np.asarray(closes, dtype=np.float64)
+        
+        macd_line, signal_line, histogram = _macd_core(
+            closes, self.macd_fast, self.macd_slow, self.macd_signal
+        )
+        return _signals_dict(
+            float(_rsi_core(closes, self.rsi_period)),
+            float(_ema_core(closes, self.ema_short_period)),
+            float(_ema_core(closes, self.ema_long_period)),
+            float(macd_line),
+            float(signal_line),
+            float(histogram),
+        )
+    
+    def seed(self, ohlcv_data: OHLCV) -> Optional[IndicatorState]:
+        """
+        Build the running state from a candle window.
+        
+        The last candle is treated as still forming and left out (apply it
+        with snapshot()); the state covers every candle before it.
+        
+        Args:
+            ohlcv_data: OHLCV candles, oldest first.
+        
+        Returns:
+            IndicatorState, or None if fewer than min_candles closed candles.
+        """
+        closes = ohlcv_data.close[:-1]
+        if closes.size < self.min_candles:
+            return None
+        
+        avg_gain, avg_loss = _wilder_averages_np(closes, self.rsi_period)
+        macd_fast, macd_fast_path, macd_slow, macd_signal = _macd_emas_np(
+            closes, self.macd_fast, self.macd_slow, self.macd_signal
+        )
+        return IndicatorState(
+            last_timestamp=int(ohlcv_data.timestamp[-2]),
+            last_close=float(closes[-1]),
+            ema_short=float(_ema_core_np(closes, self.ema_short_period)),
+            ema_long=float(_ema_core_np(closes, self.ema_long_period)),
+            macd_fast=float(macd_fast),
+            macd_fast_path=float(macd_fast_path),
+            macd_slow=float(macd_slow),
+            macd_signal=float(macd_signal),
+            avg_gain=float(avg_gain),
+            avg_loss=float(avg_loss),
+        )
+    
+    def advance(self, state: IndicatorState, ohlcv_data: OHLCV) -> bool:
+        """
+        Fold the candles closed since `state` was last updated into it.
+        
+        The window must still contain the state's last candle with the same
+        close; otherwise candles were missed (a gap) or revised, and the
+        state is left untouched.
+        
+        Args:
+            state: Running state to update in place.
+            ohlcv_data: Newer OHLCV window, oldest first.
+        
+        Returns:
+            True if the state now covers the window, False if it must be reseeded.
+        """
+        timestamps = ohlcv_data.timestamp[:-1]
+        closes = ohlcv_data.close[:-1]
+        
+        i = int(np.searchsorted(timestamps, state.last_timestamp))
+        if i >= timestamps.size or timestamps[i] != state.last_timestamp or closes[i] != state.last_close:
+            return False
+        
+        for close in closes[i + 1:].tolist():
+            self._step(state, close)
+        state.last_timestamp = int(timestamps[-1])
+        return True
+    
+    def snapshot(self, state: IndicatorState, close: float) -> Dict[str, Any]:
+        """
+        Signals for `state` plus one more (still forming) close.
+        
+        Equals compute() over every close the state has seen plus `close`;
+        the state itself is not modified.
+        """
+        current = replace(state)
+        self._step(current, float(close))
+        
+        if current.avg_loss == 0:
+            rsi = 100.0
+        else:
+            rsi = 100.0 - (100.0 / (1.0 + current.avg_gain / current.avg_loss))
+        macd_line = current.macd_fast - current.macd_slow
+        return _signals_dict(
+            rsi,
+            current.ema_short,
+            current.ema_long,
+            macd_line,
+            current.macd_signal,
+            macd_line - current.macd_signal,
+        )
+    
+    def _step(self, state: IndicatorState, close: float) -> None:
+        """Advance every running value by one close (same recurrences as the kernels)."""
+        change = close - state.last_close
+        gain = change if change > 0 else 0.0
+        loss = 0.0 if change > 0 else -change
+        period = self.rsi_period
+        state.avg_gain = (state.avg_gain * (period - 1) + gain) / period
+        state.avg_loss = (state.avg_loss * (period - 1) + loss) / period
+        
+        state.ema_short = (close * self._mult_short) + (state.ema_short * (1.0 - self._mult_short))
+        state.ema_long = (close * self._mult_long) + (state.ema_long * (1.0 - self._mult_long))
+        state.macd_fast = (close * self._mult_fast) + (state.macd_fast * (1.0 - self._mult_fast))
+        state.macd_fast_path = (close * self._mult_fast) + (state.macd_fast_path * (1.0 - self._mult_fast))
+        state.macd_slow = (close * self._mult_slow) + (state.macd_slow * (1.0 - self._mult_slow))
+        state.macd_signal = (
+            ((state.macd_fast_path - state.macd_slow) * self._mult_signal)
+            + (state.macd_signal * (1.0 - self._mult_signal))
+        )
+        state.last_close = close
+    
+    def compute_batch(self, closes_list: List[Closes]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Calculate all indicators for many series at once.
+        
+        Series of equal length are stacked into one (K, T) matrix and every
+        indicator is computed for all K rows in a single NumPy pass.
+        
+        Args:
+            closes_list: Closing prices per pool (lists or arrays, oldest first).
+        
+        Returns:
+            One signals dict per input (same order), None where the series
+            is None or shorter than min_candles.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(closes_list)
+        
+        # Group by length instead of padding: padding would shift the SMA seeds
+        groups: Dict[int, List[int]] = {}
+        for i, closes in enumerate(closes_list):
+            if closes is None or len(closes) < self.min_candles:
+                continue
+            groups.setdefault(len(closes), []).append(i)
+        
+        for rows in groups.values():
+            matrix = np.array([closes_list[i] for i in rows], dtype=np.float64)
+            rsi = _rsi_core_np(matrix, self.rsi_period)
+            ema_short = _ema_core_np(matrix, self.ema_short_period)
+            ema_long = _ema_core_np(matrix, self.ema_long_period)
+            macd_line, signal_line, histogram = _macd_core_np(
+                matrix, self.macd_fast, self.macd_slow, self.macd_signal
+            )
+            
+            for k, i in enumerate(rows):
+                results[i] = _signals_dict(
+                    float(rsi[k]),
+                    float(ema_short[k]),
+                    float(ema_long[k]),
+                    float(macd_line[k]),
+                    float(signal_line[k]),
+                    float(histogram[k]),
+                )
+        
+        return results
+
+
+# Calculator for the configured periods, shared by the signal functions below
+_default = TechnicalsCalculator()
+
+
+# Computed signals per pool, keyed on the candles they were computed from
+# pool_address -> (fingerprint, signals); bounded LRU like the news cache
+_signals_cache: "OrderedDict[str, Tuple[Tuple[Any, ...], Dict[str, Any]]]" = OrderedDict()
+
+# Fetch in progress per pool; concurrent callers await its result instead
+# of fetching again. Removed as soon as the round finishes, success or not.
+_signals_inflight: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+
+# Running indicator state per pool (evicted together with _signals_cache)
+_indicator_states: Dict[str, IndicatorState] = {}
+
+
+def _ohlcv_fingerprint(ohlcv_data: OHLCV) -> Tuple[Any, ...]:
+    """
+    Identify a candle window by its size and latest candle.
+    
+    The latest candle's close is included because GeckoTerminal returns the
+    still-forming candle, whose close moves until its timestamp rolls over.
+    """
+    return (len(ohlcv_data), int(ohlcv_data.timestamp[-1]), float(ohlcv_data.close[-1]))
+
+
+def clear_signals_cache() -> None:
+    """Clear cached technical signals, in-flight rounds, states and indicator results."""
+    _signals_cache.clear()
+    _signals_inflight.clear()
+    _indicator_states.clear()
+    _indicator_cache.clear()
+
+
 async def get_technical_signals(pool_address: str) -> Optional[Dict[str, Any]]:
     """
     Fetch OHLCV data and calculate all technical indicators.
@@ -292,12 +825,41 @@ async def get_technical_signals(pool_address: str) -> Optional[Dict[str, Any]]:
         - EMA long (21 period)
         - MACD (12, 26, 9)
     
+    Indicators are only recomputed when the candle window changes, and then
+    incrementally: each pool keeps an IndicatorState that newly closed
+    candles are folded into, so the indicators run over every candle seen
+    since the state was seeded rather than just the current window. A gap
+    (the previous last candle fell out of the window) or a revised candle
+    reseeds the state from the window. Concurrent callers for the same pool
+    share one fetch and all get that fetch's result, including None when it
+    fails.
+    
     Args:
         pool_address: Solana pool address.
     
     Returns:
         Dict with indicator values and trend assessment, or None on failure.
     """
+    inflight = _signals_inflight.get(pool_address)
+    if inflight is not None:
+        # Shielded: a cancelled waiter must not cancel the round for the others
+        return await asyncio.shield(inflight)
+    
+    round_result = asyncio.get_running_loop().create_future()
+    _signals_inflight[pool_address] = round_result
+    signals = None
+    try:
+        signals = await _refresh_signals(pool_address)
+        return signals
+    finally:
+        # Waiters get exactly this round's outcome (None if it failed or raised)
+        round_result.set_result(signals)
+        if _signals_inflight.get(pool_address) is round_result:
+            del _signals_inflight[pool_address]
+
+
+async def _refresh_signals(pool_address: str) -> Optional[Dict[str, Any]]:
+    """One fetch round for get_technical_signals: fetch, then recompute if changed."""
     # Fetch OHLCV data
     ohlcv_data = await fetch_ohlcv(pool_address)
     
@@ -309,22 +871,111 @@ async def get_technical_signals(pool_address: str) -> Optional[Dict[str, Any]]:
         )
         return None
     
-    # Extract closing prices
-    closes = [candle["close"] for candle in ohlcv_data]
+    if not isinstance(ohlcv_data, OHLCV):
+        ohlcv_data = OHLCV.from_candles(ohlcv_data)
     
-    # Calculate indicators
-    rsi = calculate_rsi(closes, RSI_PERIOD)
-    ema_short = calculate_ema(closes, EMA_SHORT_PERIOD)
-    ema_long = calculate_ema(closes, EMA_LONG_PERIOD)
-    macd_result = calculate_macd(closes, MACD_FAST, MACD_SLOW, MACD_SIGNAL)
+    cached = _signals_cache.get(pool_address)
+    fingerprint = _ohlcv_fingerprint(ohlcv_data)
+    if cached is not None and cached[0] == fingerprint:
+        _signals_cache.move_to_end(pool_address)
+        return cached[1]
     
-    # Validate all indicators calculated successfully
-    if rsi is None or ema_short is None or ema_long is None or macd_result is None:
-        logger.warning(f"Failed to calculate one or more indicators for pool {pool_address}")
+    signals = _calculate_signals(pool_address, ohlcv_data)
+    if signals is None:
         return None
     
-    macd_line, signal_line, histogram = macd_result
+    _signals_cache[pool_address] = (fingerprint, signals)
+    _signals_cache.move_to_end(pool_address)
+    while len(_signals_cache) > TECHNICALS_CACHE_MAX_ENTRIES:
+        evicted, _ = _signals_cache.popitem(last=False)
+        _indicator_states.pop(evicted, None)
+    
+    return signals
+
+
+async def get_technical_signals_many(
+    pool_addresses: List[str],
+    max_concurrency: int = 20
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Fetch and calculate technical signals for several pools concurrently.
+    
+    At most `max_concurrency` OHLCV fetches are in flight at once; they
+    share the module's aiohttp session (and its connection pool). Inside
+    that bound, fetch_ohlcv's GeckoTerminal limiter spaces the requests
+    with asyncio.sleep, so throttled pools never block the event loop.
+    
+    Args:
+        pool_addresses: Solana pool addresses.
+        max_concurrency: Upper bound on simultaneous fetches.
+    
+    Returns:
+        Signals dict (same shape as get_technical_signals) or None for
+        each pool, in input order.
+    """
+    if not pool_addresses:
+        return []
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _one(pool_address: str) -> Optional[Dict[str, Any]]:
+        async with semaphore:
+            return await get_technical_signals(pool_address)
+    
+    results = await asyncio.gather(
+        *[_one(pool_address) for pool_address in pool_addresses],
+        return_exceptions=True,
+    )
+    
+    return [None if isinstance(result, BaseException) else result for result in results]
+
+
+def _calculate_signals(
+    pool_address: str,
+    ohlcv_data: OHLCV
+) -> Optional[Dict[str, Any]]:
+    """
+    Calculate all technical indicators from a candle window.
     
+    Advances the pool's IndicatorState by the newly closed candles, seeding
+    it from the window when there is none yet or it no longer lines up.
+    
+    Args:
+        pool_address: Solana pool address (state key and logging).
+        ohlcv_data: OHLCV candles, oldest first.
+    
+    Returns:
+        Dict with indicator values and trend assessment, or None on failure.
+    """
+    state = _indicator_states.get(pool_address)
+    if state is None or not _default.advance(state, ohlcv_data):
+        state = _default.seed(ohlcv_data)
+        if state is not None:
+            _indicator_states[pool_address] = state
+        else:
+            _indicator_states.pop(pool_address, None)
+    
+    if state is not None:
+        signals = _default.snapshot(state, ohlcv_data.close[-1])
+    else:
+        # Too short to hold back the forming candle: plain full compute
+        signals = _default.compute(ohlcv_data.close)
+    
+    if signals is None:
+        logger.warning(f"Failed to calculate one or more indicators for pool {pool_address}")
+    
+    return signals
+
+
+def _signals_dict(
+    rsi: float,
+    ema_short: float,
+    ema_long: float,
+    macd_line: float,
+    signal_line: float,
+    histogram: float
+) -> Dict[str, Any]:
+    """Assemble the signals dict (with trend assessment) from indicator values."""
     # Determine trend
     trend = _determine_trend(rsi, ema_short, ema_long, histogram)
     
@@ -343,6 +994,23 @@ async def get_technical_signals(pool_address: str) -> Optional[Dict[str, Any]]:
     }
 
 
+def calculate_signals_batch(closes_list: List[Closes]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Calculate technical signals for many pools at once.
+    
+    Vectorized equivalent of the indicator step of get_technical_signals
+    (see TechnicalsCalculator.compute_batch).
+    
+    Args:
+        closes_list: Closing prices per pool (lists or arrays, oldest first).
+    
+    Returns:
+        One signals dict per input (same order), None where the series is
+        too short for MACD.
+    """
+    return _default.compute_batch(closes_list)
+
+
 def _determine_trend(
     rsi: float,
     ema_short: float,
@@ -5,9 +5,49 @@ This module provides shared test fixtures for mocking API responses
 and creating high-quality/low-quality token test data.
 """
 
+import json
 import pytest
 from datetime import datetime, timezone
-from typing import Dict, Any
+from types import SimpleNamespace
+from typing import Dict, Any, List, Optional
+from unittest.mock import Mock
+
+
+# =============================================================================
+# SESSION-WIDE TEST SETUP
+# =============================================================================
+
+# Real RateLimiter wait methods, saved while the session fixture disables them
+_REAL_RATE_LIMITER_WAITS: Dict[str, Any] = {}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def disable_rate_limiter():
+    """Disable rate limiter sleeps once for the whole test session."""
+    import rate_limiter
+    
+    async def _no_wait(self) -> None:
+        return None
+    
+    limiter_cls = rate_limiter.RateLimiter
+    _REAL_RATE_LIMITER_WAITS.update(
+        wait_if_needed=limiter_cls.wait_if_needed,
+        wait_if_needed_async=limiter_cls.wait_if_needed_async,
+    )
+    limiter_cls.wait_if_needed = lambda self: None
+    limiter_cls.wait_if_needed_async = _no_wait
+    yield
+    for name, method in _REAL_RATE_LIMITER_WAITS.items():
+        setattr(limiter_cls, name, method)
+
+
+@pytest.fixture
+def real_rate_limiter(monkeypatch):
+    """Re-enable real rate limiter waits for one test."""
+    import rate_limiter
+    
+    for name, method in _REAL_RATE_LIMITER_WAITS.items():
+        monkeypatch.setattr(rate_limiter.RateLimiter, name, method)
 
 
 # =============================================================================
@@ -310,3 +350,104 @@ def token_age_hours():
         created = created_at / 1000
         return (now - created) / 3600
     return _token_age
+
+
+@pytest.fixture
+def fake_response():
+    """
+    Helper to build a plain successful requests-style response.
+    
+    Use instead of Mock() when nothing asserts on the response's calls;
+    a SimpleNamespace is much cheaper to build.
+    """
+    def _response(content: bytes = b"", json_data: Optional[Any] = None) -> SimpleNamespace:
+        return SimpleNamespace(
+            content=content,
+            status_code=200,
+            raise_for_status=lambda: None,
+            json=lambda: json_data,
+        )
+    return _response
+
+
+class _FakeAiohttpResponse:
+    """Minimal stand-in for aiohttp.ClientResponse (json() or raw read())."""
+    
+    def __init__(self, status: int = 200, payload: Any = None):
+        self.status = status
+        self._payload = payload
+    
+    async def json(self) -> Any:
+        return self._payload
+    
+    async def read(self) -> bytes:
+        if isinstance(self._payload, bytes):
+            return self._payload
+        return json.dumps(self._payload).encode()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _FakeAiohttpSession:
+    """
+    Minimal stand-in for aiohttp.ClientSession.
+    
+    get() serves the canned responses in order (the last one repeats) or
+    raises `error`; requested URLs are recorded in requested_urls.
+    """
+    
+    def __init__(self, responses=(), error: Optional[Exception] = None):
+        self._responses = list(responses)
+        self._error = error
+        self.requested_urls: List[str] = []
+    
+    def get(self, url: str, **kwargs: Any) -> _FakeAiohttpResponse:
+        self.requested_urls.append(url)
+        if self._error is not None:
+            raise self._error
+        if len(self._responses) > 1:
+            return self._responses.pop(0)
+        return self._responses[0]
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def fake_aiohttp_response():
+    """
+    Helper to build a canned aiohttp response: fake_aiohttp_response(status, payload).
+    
+    payload is returned by json(); read() returns it JSON-encoded (or as-is
+    if it is already bytes).
+    """
+    return _FakeAiohttpResponse
+
+
+@pytest.fixture
+def fake_aiohttp_session():
+    """Helper to build a fake aiohttp session: fake_aiohttp_session(responses, error=None)."""
+    return _FakeAiohttpSession
+
+
+@pytest.fixture
+def mock_rss(monkeypatch, fake_response):
+    """
+    Helper to stub the Google News RSS round-trip in news_validator.
+    
+    Call with the feed entries to return; returns the session GET mock so
+    tests can inspect call counts.
+    """
+    def _apply(entries: List[Dict[str, Any]]) -> Mock:
+        mock_get = Mock(return_value=fake_response())
+        monkeypatch.setattr("news_validator.feedparser.parse", lambda *_: SimpleNamespace(entries=entries))
+        monkeypatch.setattr("news_validator._SESSION.get", mock_get)
+        return mock_get
+    return _apply
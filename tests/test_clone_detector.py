@@ -9,7 +9,7 @@ Tests cover:
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 
 from clone_detector import (
     check_clone_token,
@@ -60,10 +60,9 @@ def test_calculate_similarity_partial_match():
 # DEXSCREENER SEARCH MOCK TESTS
 # =============================================================================
 
-def test_search_dexscreener_success():
+def test_search_dexscreener_success(fake_response):
     """Test DexScreener search returns results."""
-    mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response = fake_response(json_data={
         "pairs": [
             {
                 "baseToken": {
@@ -73,8 +72,7 @@ def test_search_dexscreener_success():
                 }
             }
         ]
-    }
-    mock_response.raise_for_status = Mock()
+    })
     
     with patch('clone_detector.requests.get', return_value=mock_response):
         result = _search_dexscreener("trump", verbose=False)
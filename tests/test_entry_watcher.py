@@ -11,7 +11,7 @@ Tests cover:
 
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 
 from entry_watcher import EntryWatcher
 import config
@@ -263,15 +263,13 @@ def test_is_expired_false():
 # PRICE FETCH TESTS
 # =============================================================================
 
-def test_fetch_current_price_success(watcher):
+def test_fetch_current_price_success(watcher, fake_response):
     """Test successful price fetch from DexScreener."""
-    mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response = fake_response(json_data={
         "pairs": [
             {"priceUsd": "0.00012345"}
         ]
-    }
-    mock_response.raise_for_status = Mock()
+    })
     
     # requests is imported inside the method, so patch at the source
     with patch('requests.get', return_value=mock_response):
@@ -280,11 +278,9 @@ def test_fetch_current_price_success(watcher):
         assert price == 0.00012345
 
 
-def test_fetch_current_price_no_pairs(watcher):
+def test_fetch_current_price_no_pairs(watcher, fake_response):
     """Test price fetch when no pairs found."""
-    mock_response = Mock()
-    mock_response.json.return_value = {"pairs": []}
-    mock_response.raise_for_status = Mock()
+    mock_response = fake_response(json_data={"pairs": []})
     
     with patch('requests.get', return_value=mock_response):
         price = watcher._fetch_current_price("UNKNOWN_TOKEN")
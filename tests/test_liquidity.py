@@ -8,13 +8,16 @@ Tests cover:
 - analyze_liquidity: Combined liquidity analysis
 """
 
+import aiohttp
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, patch
 from liquidity import (
     fetch_dlmm_pool,
     get_active_bin,
     classify_liquidity_shape,
     analyze_liquidity,
+    analyze_liquidity_batch,
+    fetch_dlmm_pools,
     LiquidityShape,
 )
 
@@ -128,66 +131,77 @@ def mock_dlmm_pool_empty():
     }
 
 
+# =============================================================================
+# FAKE AIOHTTP TRANSPORT
+# =============================================================================
+
+@pytest.fixture
+def fake_client_session(monkeypatch, fake_aiohttp_session):
+    """Install a fake session as aiohttp.ClientSession; returns the list of sessions opened."""
+    opened = []
+
+    def install(*responses, error=None):
+        def factory(*args, **kwargs):
+            session = fake_aiohttp_session(responses, error)
+            opened.append(session)
+            return session
+
+        monkeypatch.setattr(aiohttp, "ClientSession", factory)
+        return opened
+
+    return install
+
+
 # =============================================================================
 # FETCH DLMM POOL TESTS
 # =============================================================================
 
 @pytest.mark.asyncio
-async def test_fetch_dlmm_pool_success(mock_dlmm_pool_spot):
+async def test_fetch_dlmm_pool_success(mock_dlmm_pool_spot, fake_client_session, fake_aiohttp_response):
     """Test successful pool fetch from Meteora API."""
-    with patch("aiohttp.ClientSession") as mock_session:
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=mock_dlmm_pool_spot)
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        
-        mock_session_instance = MagicMock()
-        mock_session_instance.get = MagicMock(return_value=mock_response)
-        mock_session_instance.__aenter__ = AsyncMock(return_value=mock_session_instance)
-        mock_session_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_session.return_value = mock_session_instance
-        
-        result = await fetch_dlmm_pool("PoolAddress123")
-        
-        assert result is not None
-        assert result["address"] == "PoolAddress123"
-        assert "bins" in result
+    fake_client_session(fake_aiohttp_response(200, mock_dlmm_pool_spot))
+    
+    result = await fetch_dlmm_pool("PoolAddress123")
+    
+    assert result is not None
+    assert result["address"] == "PoolAddress123"
+    assert "bins" in result
+    assert result["_bin_index"][100]["bin_id"] == 100
+    assert list(result["bin_arrays"]["ids"]) == list(range(95, 106))
+    assert result["bin_arrays"]["x"][0] == 1000000.0
 
 
 @pytest.mark.asyncio
-async def test_fetch_dlmm_pool_not_found():
+async def test_fetch_dlmm_pool_not_found(fake_client_session, fake_aiohttp_response):
     """Test pool fetch when pool doesn't exist."""
-    with patch("aiohttp.ClientSession") as mock_session:
-        mock_response = AsyncMock()
-        mock_response.status = 404
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        
-        mock_session_instance = MagicMock()
-        mock_session_instance.get = MagicMock(return_value=mock_response)
-        mock_session_instance.__aenter__ = AsyncMock(return_value=mock_session_instance)
-        mock_session_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_session.return_value = mock_session_instance
-        
-        result = await fetch_dlmm_pool("NonExistentPool")
-        
-        assert result is None
+    fake_client_session(fake_aiohttp_response(404))
+    
+    result = await fetch_dlmm_pool("NonExistentPool")
+    
+    assert result is None
 
 
 @pytest.mark.asyncio
-async def test_fetch_dlmm_pool_network_error():
+async def test_fetch_dlmm_pool_network_error(fake_client_session):
     """Test pool fetch with network error (fail-open)."""
-    with patch("aiohttp.ClientSession") as mock_session:
-        mock_session_instance = MagicMock()
-        mock_session_instance.get = MagicMock(side_effect=Exception("Network error"))
-        mock_session_instance.__aenter__ = AsyncMock(return_value=mock_session_instance)
-        mock_session_instance.__aexit__ = AsyncMock(return_value=None)
-        mock_session.return_value = mock_session_instance
-        
-        result = await fetch_dlmm_pool("SomePool")
-        
-        assert result is None  # Fail-open: return None on error
+    fake_client_session(error=Exception("Network error"))
+    
+    result = await fetch_dlmm_pool("SomePool")
+    
+    assert result is None  # Fail-open: return None on error
+
+
+@pytest.mark.asyncio
+async def test_fetch_dlmm_pools_shares_session(mock_dlmm_pool_spot, fake_client_session, fake_aiohttp_response):
+    """Test batch fetch opens one session and keeps input order."""
+    opened = fake_client_session(fake_aiohttp_response(200, mock_dlmm_pool_spot), fake_aiohttp_response(404))
+    
+    results = await fetch_dlmm_pools(["PoolAddress123", "NonExistentPool"])
+    
+    assert len(opened) == 1
+    assert len(opened[0].requested_urls) == 2
+    assert results[0]["address"] == "PoolAddress123"
+    assert results[1] is None
 
 
 # =============================================================================
@@ -235,6 +249,14 @@ def test_get_active_bin_no_matching_bin():
     assert active_bin is None
 
 
+def test_get_active_bin_uses_index(mock_dlmm_pool_spot):
+    """Test active bin lookup through the index attached at fetch time."""
+    active = {"bin_id": 100, "x_amount": "1", "y_amount": "1"}
+    mock_dlmm_pool_spot["_bin_index"] = {100: active}
+    
+    assert get_active_bin(mock_dlmm_pool_spot) is active
+
+
 def test_get_active_bin_none_pool():
     """Test get_active_bin with None input."""
     active_bin = get_active_bin(None)
@@ -381,6 +403,22 @@ async def test_analyze_liquidity_empty_pool(mock_dlmm_pool_empty):
         assert result["active_bin"] is None
 
 
+@pytest.mark.asyncio
+async def test_analyze_liquidity_batch(mock_dlmm_pool_curve, mock_dlmm_pool_bid_ask):
+    """Test batch liquidity analysis keeps input order and skips missing pools."""
+    with patch("liquidity.fetch_dlmm_pools", new_callable=AsyncMock) as mock_fetch:
+        mock_fetch.return_value = [mock_dlmm_pool_curve, None, mock_dlmm_pool_bid_ask]
+        
+        results = await analyze_liquidity_batch(["PoolAddress456", "Missing", "PoolAddress789"])
+        
+        mock_fetch.assert_awaited_once_with(["PoolAddress456", "Missing", "PoolAddress789"])
+        assert len(results) == 3
+        assert results[0]["pool_address"] == "PoolAddress456"
+        assert results[0]["shape"] == LiquidityShape.CURVE
+        assert results[1] is None
+        assert results[2]["shape"] == LiquidityShape.BID_ASK
+
+
 # =============================================================================
 # EDGE CASES AND ROBUSTNESS TESTS
 # =============================================================================
@@ -402,6 +440,30 @@ def test_classify_with_string_amounts():
     assert shape == LiquidityShape.CURVE
 
 
+def test_classify_unsorted_bins():
+    """Test classification orders bins by bin_id before measuring shape."""
+    pool_data = {
+        "active_id": 100,
+        "bins": [
+            {"bin_id": 100, "x_amount": "5000", "y_amount": "5000"},
+            {"bin_id": 105, "x_amount": "100", "y_amount": "100"},
+            {"bin_id": 95, "x_amount": "100", "y_amount": "100"},
+        ],
+    }
+    
+    assert classify_liquidity_shape(pool_data) == LiquidityShape.CURVE
+
+
+def test_classify_zero_liquidity_bins():
+    """Test pools whose bins are all empty classify as SPOT."""
+    pool_data = {
+        "active_id": 100,
+        "bins": [{"bin_id": bin_id, "x_amount": "0", "y_amount": "0"} for bin_id in range(98, 103)],
+    }
+    
+    assert classify_liquidity_shape(pool_data) == LiquidityShape.SPOT
+
+
 def test_classify_with_missing_amounts():
     """Test classification handles missing amounts gracefully."""
     pool_data = {
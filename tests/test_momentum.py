@@ -8,12 +8,17 @@ Tests cover:
 - Staleness detection
 """
 
+from datetime import datetime, timezone
+
 import pytest
 from momentum import (
     calculate_price_velocity,
     classify_pump_phase,
     get_buy_sell_ratio,
     check_staleness,
+    get_token_age_hours,
+    analyze_momentum,
+    MAX_BUY_SELL_RATIO,
 )
 
 
@@ -127,7 +132,7 @@ def test_buy_sell_ratio_sell_pressure():
 
 
 def test_buy_sell_ratio_zero_sells():
-    """Test buy/sell ratio with zero sells (infinite pressure)."""
+    """Test buy/sell ratio with zero sells (capped maximum pressure)."""
     token_data = {
         "txns": {
             "h1": {
@@ -139,7 +144,24 @@ def test_buy_sell_ratio_zero_sells():
     
     ratio = get_buy_sell_ratio(token_data)
     
-    assert ratio == float('inf')
+    assert ratio == MAX_BUY_SELL_RATIO
+
+
+def test_analyze_momentum_capped_ratio_gets_no_bonus():
+    """Test a capped ratio (no sells at all) is not scored as buying pressure."""
+    def token(sells):
+        return {
+            "priceChange": {"h1": 20.0},
+            "txns": {"h1": {"buys": 100, "sells": sells}},
+        }
+    
+    capped = analyze_momentum(token(0))
+    strong = analyze_momentum(token(10))
+    
+    assert capped["buy_sell_ratio"] == MAX_BUY_SELL_RATIO
+    assert "Strong buying pressure" not in capped["signals_summary"]
+    assert "Strong buying pressure" in strong["signals_summary"]
+    assert capped["enhanced_momentum_score"] == strong["enhanced_momentum_score"] - 10
 
 
 def test_buy_sell_ratio_zero_buys_and_sells():
@@ -340,3 +362,30 @@ def test_staleness_missing_age():
     is_stale = check_staleness(token_data)
     
     assert is_stale is False  # Can't determine age, default to not stale
+
+
+def test_token_age_follows_refreshed_created_at():
+    """Test a reused token dict reports the age of its current createdAt."""
+    token_data = {
+        "priceChange": {"h1": 0.05},
+        "createdAt": "2020-01-01T00:00:00Z",
+    }
+    
+    assert get_token_age_hours(token_data) > 24
+    assert check_staleness(token_data) is True
+    
+    # Same dict refreshed with a new listing time
+    token_data["createdAt"] = datetime.now(timezone.utc).isoformat()
+    assert get_token_age_hours(token_data) < 1
+    assert check_staleness(token_data) is False
+
+
+def test_analyze_momentum_uses_passed_age():
+    """Test an explicit token age wins over createdAt for staleness."""
+    token_data = {
+        "priceChange": {"h1": 0.05},
+        "createdAt": "2020-01-01T00:00:00Z",
+    }
+    
+    assert analyze_momentum(token_data, token_age_hours=2.0)["is_stale"] is False
+    assert "_age_hours" not in token_data
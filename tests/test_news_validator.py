@@ -11,13 +11,16 @@ Tests cover:
 
 import pytest
 import time
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
 
 from news_validator import (
     validate_news,
+    validate_news_async,
     clear_cache,
     get_cache_stats,
     _fetch_rss_feed,
+    _parse_rss_bytes,
     _is_cache_valid,
     _get_cached_result,
     _set_cache,
@@ -27,35 +30,29 @@ from news_validator import (
 )
 
 
+# Shared read-only feed entries (more than the 10-article limit)
+_FIFTEEN_ENTRIES = tuple(
+    {"title": f"Article {i}", "link": f"https://example.com/{i}", "published": "", "source": {"title": "Source"}}
+    for i in range(15)
+)
+
+
 # =============================================================================
 # TEST FIXTURES
 # =============================================================================
 
 @pytest.fixture(autouse=True)
 def clear_cache_before_test():
-    """Clear cache before each test and disable rate limiting."""
+    """Clear cache before and after each test (rate limiting is disabled in conftest)."""
     clear_cache()
-    # Patch the rate limiter to not sleep during tests
-    with patch('news_validator.rate_limit', lambda rpm: lambda f: f):
-        yield
-    clear_cache()
-
-
-@pytest.fixture(autouse=True)
-def disable_rate_limiter():
-    """Disable rate limiter for all tests to prevent timeouts."""
-    import rate_limiter
-    original_wait = rate_limiter.RateLimiter.wait_if_needed
-    rate_limiter.RateLimiter.wait_if_needed = lambda self: None
     yield
-    rate_limiter.RateLimiter.wait_if_needed = original_wait
+    clear_cache()
 
 
 @pytest.fixture
 def mock_feed_with_entries():
-    """Mock feedparser result with news entries."""
-    mock_feed = Mock()
-    mock_feed.entries = [
+    """Fake feedparser result with news entries."""
+    return SimpleNamespace(entries=[
         {
             "title": "Trump wins election",
             "link": "https://example.com/1",
@@ -68,16 +65,35 @@ def mock_feed_with_entries():
             "published": "2025-02-03T09:00:00Z",
             "source": {"title": "Reuters"}
         }
-    ]
-    return mock_feed
+    ])
+
+
+@pytest.fixture
+def google_news_rss():
+    """Raw RSS 2.0 document in the Google News schema."""
+    return b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>"Trump election" - Google News</title>
+    <item>
+      <title>Trump wins election - CNN</title>
+      <link>https://news.google.com/rss/articles/1</link>
+      <pubDate>Mon, 03 Feb 2025 10:00:00 GMT</pubDate>
+      <source url="https://www.cnn.com">CNN</source>
+    </item>
+    <item>
+      <title>Election results announced</title>
+      <link>https://news.google.com/rss/articles/2</link>
+      <pubDate>Mon, 03 Feb 2025 09:00:00 GMT</pubDate>
+    </item>
+  </channel>
+</rss>"""
 
 
 @pytest.fixture
 def mock_feed_empty():
-    """Mock feedparser result with no entries."""
-    mock_feed = Mock()
-    mock_feed.entries = []
-    return mock_feed
+    """Fake feedparser result with no entries."""
+    return SimpleNamespace(entries=[])
 
 
 # =============================================================================
@@ -101,21 +117,51 @@ def test_cache_hit():
     assert result["reason"] == "Cached result"
 
 
-def test_cache_miss():
+def test_cache_miss(mock_rss):
     """Test that cache miss triggers API call."""
-    mock_response = Mock()
-    mock_response.content = b"<rss></rss>"
-    mock_response.raise_for_status = Mock()
+    mock_get = mock_rss([])
     
-    with patch('news_validator.requests.get', return_value=mock_response), \
-         patch('news_validator.feedparser.parse') as mock_parse:
-        
-        mock_parse.return_value = Mock(entries=[])
-        
-        result = validate_news("new_query", verbose=False)
-        
-        # Should have made the API call
-        assert result["level"] == LEVEL_WARNING  # No articles found
+    result = validate_news("new_query", verbose=False)
+    
+    # Should have made the API call
+    assert mock_get.call_count == 1
+    assert result["level"] == LEVEL_WARNING  # No articles found
+
+
+def test_cache_key_string_and_tuple_equivalent():
+    """Test legacy "query|narrative" keys map onto tuple keys."""
+    result = {"level": LEVEL_OK, "reason": "test", "has_news": True, "article_count": 1, "articles": []}
+    _set_cache("query1|Election", result)
+    
+    assert _get_cached_result(("query1", "Election")) is result
+    assert _get_cached_result("query1|") is None
+
+
+def test_cache_key_normalized(mock_rss):
+    """Test that case and surrounding whitespace share one cache entry."""
+    mock_get = mock_rss([])
+    
+    validate_news("TRUMP", verbose=False)
+    validate_news("trump", verbose=False)
+    validate_news(" Trump ", verbose=False)
+    
+    assert mock_get.call_count == 1
+    assert get_cache_stats()["total_entries"] == 1
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    """Test that the cache is bounded and evicts the least recently used entry."""
+    monkeypatch.setattr("news_validator.CACHE_MAX_ENTRIES", 2)
+    result = {"level": LEVEL_OK, "reason": "test", "has_news": True, "article_count": 1, "articles": []}
+    _set_cache("query1|", result)
+    _set_cache("query2|", result)
+    
+    _get_cached_result("query1|")  # query1 is now most recently used
+    _set_cache("query3|", result)
+    
+    assert _get_cached_result("query1|") is result
+    assert _get_cached_result("query2|") is None
+    assert get_cache_stats()["total_entries"] == 2
 
 
 def test_cache_stats():
@@ -143,27 +189,67 @@ def test_cache_clear():
 # RSS FEED FETCH TESTS
 # =============================================================================
 
-def test_fetch_rss_feed_success(mock_feed_with_entries):
+def test_fetch_rss_feed_success(mock_rss, mock_feed_with_entries):
     """Test successful RSS feed fetch."""
-    mock_response = Mock()
-    mock_response.content = b"<rss>feed content</rss>"
-    mock_response.raise_for_status = Mock()
+    mock_rss(mock_feed_with_entries.entries)
     
-    with patch('news_validator.requests.get', return_value=mock_response), \
-         patch('news_validator.feedparser.parse', return_value=mock_feed_with_entries):
-        
-        result = _fetch_rss_feed("test query", verbose=False)
-        
-        assert result["success"] is True
-        assert len(result["entries"]) == 2
-        assert result["error"] is None
+    result = _fetch_rss_feed("test query", verbose=False)
+    
+    assert result["success"] is True
+    assert len(result["entries"]) == 2
+    assert result["error"] is None
+
+
+def test_parse_rss_bytes_google_news_schema(google_news_rss):
+    """Test that plain RSS 2.0 is parsed without going through feedparser."""
+    with patch('news_validator.feedparser.parse') as mock_parse:
+        entries = _parse_rss_bytes(google_news_rss)
+
+        mock_parse.assert_not_called()
+        assert entries == (
+            ("Trump wins election - CNN", "https://news.google.com/rss/articles/1",
+             "Mon, 03 Feb 2025 10:00:00 GMT", "CNN"),
+            ("Election results announced", "https://news.google.com/rss/articles/2",
+             "Mon, 03 Feb 2025 09:00:00 GMT", "Unknown"),
+        )
+
+
+def test_parse_rss_bytes_non_rss_falls_back_to_feedparser():
+    """Test that non-RSS documents (e.g. Atom) are handed to feedparser."""
+    atom = b'<feed xmlns="http://www.w3.org/2005/Atom"><entry><title>A</title></entry></feed>'
+    with patch('news_validator.feedparser.parse', return_value=SimpleNamespace(entries=[{"title": "A"}])) as mock_parse:
+        entries = _parse_rss_bytes(atom)
+
+        mock_parse.assert_called_once_with(atom)
+        assert entries == (("A", "", "", "Unknown"),)
+
+
+def test_parse_rss_bytes_reads_every_item():
+    """Test that the streaming parser counts all items, not just the first 10."""
+    items = b"".join(b"<item><title>Article %d</title></item>" % i for i in range(25))
+    content = b"<rss version=\"2.0\"><channel>" + items + b"</channel></rss>"
+
+    entries = _parse_rss_bytes(content)
+
+    assert len(entries) == 25
+    assert entries[-1] == ("Article 24", "", "", "Unknown")
+
+
+def test_feedparser_sanitization_disabled():
+    """Test feedparser's HTML sanitizer and URI resolution stay off once loaded."""
+    import news_validator
+    
+    feedparser = news_validator.feedparser
+    
+    assert feedparser.SANITIZE_HTML == 0
+    assert feedparser.RESOLVE_RELATIVE_URIS == 0
 
 
 def test_fetch_rss_feed_timeout():
     """Test RSS feed fetch timeout handling."""
     import requests
     
-    with patch('news_validator.requests.get', side_effect=requests.exceptions.Timeout()):
+    with patch('news_validator._SESSION.get', side_effect=requests.exceptions.Timeout()):
         result = _fetch_rss_feed("test query", verbose=False)
         
         assert result["success"] is False
@@ -174,74 +260,69 @@ def test_fetch_rss_feed_request_error():
     """Test RSS feed fetch error handling."""
     import requests
     
-    with patch('news_validator.requests.get', side_effect=requests.exceptions.RequestException("Network error")):
+    with patch('news_validator._SESSION.get', side_effect=requests.exceptions.RequestException("Network error")):
         result = _fetch_rss_feed("test query", verbose=False)
         
         assert result["success"] is False
         assert "Network error" in result["error"]
 
 
+def test_session_retries_server_errors():
+    """Test the pooled session retries transient 5xx responses."""
+    from news_validator import _SESSION
+    
+    retries = _SESSION.get_adapter("https://news.google.com").max_retries
+    
+    assert retries.total == 2
+    assert 503 in retries.status_forcelist
+
+
 # =============================================================================
 # VALIDATE NEWS TESTS
 # =============================================================================
 
-def test_validate_news_with_articles(mock_feed_with_entries):
+def test_validate_news_with_articles(mock_rss, mock_feed_with_entries):
     """Test news validation when articles are found."""
-    mock_response = Mock()
-    mock_response.content = b"<rss>feed</rss>"
-    mock_response.raise_for_status = Mock()
+    mock_rss(mock_feed_with_entries.entries)
     
-    with patch('news_validator.requests.get', return_value=mock_response), \
-         patch('news_validator.feedparser.parse', return_value=mock_feed_with_entries):
-        
-        result = validate_news("Trump election", verbose=False)
-        
-        assert result["level"] == LEVEL_OK
-        assert result["has_news"] is True
-        assert result["article_count"] == 2
-        assert len(result["articles"]) == 2
+    result = validate_news("Trump election", verbose=False)
+    
+    assert result["level"] == LEVEL_OK
+    assert result["has_news"] is True
+    assert result["article_count"] == 2
+    assert len(result["articles"]) == 2
 
 
-def test_validate_news_no_articles(mock_feed_empty):
+def test_validate_news_no_articles(mock_rss, mock_feed_empty):
     """Test news validation when no articles are found."""
-    mock_response = Mock()
-    mock_response.content = b"<rss>empty feed</rss>"
-    mock_response.raise_for_status = Mock()
+    mock_rss(mock_feed_empty.entries)
     
-    with patch('news_validator.requests.get', return_value=mock_response), \
-         patch('news_validator.feedparser.parse', return_value=mock_feed_empty):
-        
-        result = validate_news("XYZ123FakeToken999", verbose=False)
-        
-        assert result["level"] == LEVEL_WARNING
-        assert result["has_news"] is False
-        assert result["article_count"] == 0
+    result = validate_news("XYZ123FakeToken999", verbose=False)
+    
+    assert result["level"] == LEVEL_WARNING
+    assert result["has_news"] is False
+    assert result["article_count"] == 0
 
 
-def test_validate_news_with_matched_narrative(mock_feed_with_entries):
+def test_validate_news_with_matched_narrative(mock_rss, mock_feed_with_entries):
     """Test news validation with matched narrative priority."""
-    mock_response = Mock()
-    mock_response.content = b"<rss>feed</rss>"
-    mock_response.raise_for_status = Mock()
+    mock_rss(mock_feed_with_entries.entries)
     
-    with patch('news_validator.requests.get', return_value=mock_response) as mock_get, \
-         patch('news_validator.feedparser.parse', return_value=mock_feed_with_entries):
-        
-        result = validate_news(
-            query="TRUMP",
-            token_name="Trump Victory Token",
-            matched_narrative="US Presidential Election",
-            verbose=False
-        )
-        
-        assert result["level"] == LEVEL_OK
+    result = validate_news(
+        query="TRUMP",
+        token_name="Trump Victory Token",
+        matched_narrative="US Presidential Election",
+        verbose=False
+    )
+    
+    assert result["level"] == LEVEL_OK
 
 
 def test_validate_news_api_failure():
     """Test news validation when API fails."""
     import requests
     
-    with patch('news_validator.requests.get', side_effect=requests.exceptions.RequestException("API Error")):
+    with patch('news_validator._SESSION.get', side_effect=requests.exceptions.RequestException("API Error")):
         result = validate_news("test query", verbose=False)
         
         assert result["level"] == LEVEL_UNKNOWN
@@ -249,67 +330,60 @@ def test_validate_news_api_failure():
         assert "Failed to fetch" in result["reason"]
 
 
-def test_validate_news_caches_result(mock_feed_with_entries):
+def test_validate_news_caches_result(mock_rss, mock_feed_with_entries):
     """Test that validate_news caches the result."""
-    mock_response = Mock()
-    mock_response.content = b"<rss>feed</rss>"
-    mock_response.raise_for_status = Mock()
+    mock_get = mock_rss(mock_feed_with_entries.entries)
     
-    with patch('news_validator.requests.get', return_value=mock_response) as mock_get, \
-         patch('news_validator.feedparser.parse', return_value=mock_feed_with_entries):
-        
-        # First call should hit the API
-        result1 = validate_news("cache_test_query", verbose=False)
-        
-        # Second call should use cache
-        result2 = validate_news("cache_test_query", verbose=False)
-        
-        # API should only be called once
-        assert mock_get.call_count == 1
-        
-        # Results should be identical
-        assert result1 == result2
+    # First call should hit the API
+    result1 = validate_news("cache_test_query", verbose=False)
+    
+    # Second call should use cache
+    result2 = validate_news("cache_test_query", verbose=False)
+    
+    # API should only be called once
+    assert mock_get.call_count == 1
+    
+    # Results should be identical
+    assert result1 == result2
 
 
-def test_validate_news_article_extraction(mock_feed_with_entries):
+def test_validate_news_article_extraction(mock_rss, mock_feed_with_entries):
     """Test that article metadata is correctly extracted."""
-    mock_response = Mock()
-    mock_response.content = b"<rss>feed</rss>"
-    mock_response.raise_for_status = Mock()
+    mock_rss(mock_feed_with_entries.entries)
     
-    with patch('news_validator.requests.get', return_value=mock_response), \
-         patch('news_validator.feedparser.parse', return_value=mock_feed_with_entries):
-        
-        result = validate_news("test query", verbose=False)
-        
-        assert len(result["articles"]) == 2
-        
-        # Check first article structure
-        article = result["articles"][0]
-        assert "title" in article
-        assert "link" in article
-        assert "published" in article
-        assert "source" in article
+    result = validate_news("test query", verbose=False)
+    
+    assert len(result["articles"]) == 2
+    
+    # Check first article structure
+    article = result["articles"][0]
+    assert "title" in article
+    assert "link" in article
+    assert "published" in article
+    assert "source" in article
 
 
-def test_validate_news_limits_articles():
+def test_validate_news_limits_articles(mock_rss):
     """Test that articles are limited to 10."""
-    mock_feed = Mock()
-    mock_feed.entries = [
-        {"title": f"Article {i}", "link": f"https://example.com/{i}", "published": "", "source": {"title": "Source"}}
-        for i in range(15)  # More than 10 articles
-    ]
-    
-    mock_response = Mock()
-    mock_response.content = b"<rss>feed</rss>"
-    mock_response.raise_for_status = Mock()
-    
-    with patch('news_validator.requests.get', return_value=mock_response), \
-         patch('news_validator.feedparser.parse', return_value=mock_feed):
-        
-        result = validate_news("many articles", verbose=False)
-        
-        # Should limit to 10 articles
-        assert len(result["articles"]) <= 10
-        # But article_count reflects actual count
-        assert result["article_count"] == 15
+    mock_rss(_FIFTEEN_ENTRIES)
+    
+    result = validate_news("many articles", verbose=False)
+    
+    # Should limit to 10 articles
+    assert len(result["articles"]) <= 10
+    # But article_count reflects actual count
+    assert result["article_count"] == 15
+
+
+@pytest.mark.asyncio
+async def test_validate_news_async(mock_rss, mock_feed_with_entries):
+    """Test the awaitable wrapper returns the same result and shares the cache."""
+    mock_get = mock_rss(mock_feed_with_entries.entries)
+    
+    result = await validate_news_async("async query", verbose=False)
+    cached = validate_news("async query", verbose=False)
+    
+    assert result["level"] == LEVEL_OK
+    assert result["article_count"] == 2
+    assert cached == result
+    assert mock_get.call_count == 1
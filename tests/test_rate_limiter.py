@@ -0,0 +1,31 @@
+"""
+Unit tests for rate_limiter.py module.
+
+Tests cover:
+- Slot reservation spacing across concurrent threads
+"""
+
+import threading
+
+from rate_limiter import RateLimiter
+
+
+def test_reserve_spaces_concurrent_threads():
+    """Test threads calling at once each get their own slot, one interval apart."""
+    limiter = RateLimiter(600)  # 0.1s interval
+    barrier = threading.Barrier(8)
+    waits = []
+
+    def reserve():
+        barrier.wait()
+        waits.append(limiter._reserve())
+
+    threads = [threading.Thread(target=reserve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    waits.sort()
+    assert waits[0] == 0
+    assert all(b - a > 0.09 for a, b in zip(waits, waits[1:]))
@@ -8,12 +8,19 @@ Tests cover:
 - Edge cases and boundaries
 """
 
+import math
+
 import pytest
 from scoring import (
     calculate_composite_score,
     should_alert,
     format_score_output,
     format_score_telegram_message,
+    calculate_composite_scores_batch,
+    should_alert_batch,
+    _composite_core,
+    _composite_core_py,
+    _score_to_stars,
 )
 
 
@@ -150,6 +157,58 @@ def test_composite_score_all_zeros():
     assert score_data["composite_score"] < 30
 
 
+def test_composite_score_mid_phase():
+    """Test MID phase scores neutral timing and unknown phases score as LATE."""
+    shield_result = {"safety_score": 80}
+    momentum_result = {"enhanced_momentum_score": 60}
+    brain_result = {"relevance_score": 70, "confidence": 80}
+    
+    mid = calculate_composite_score(shield_result, momentum_result, brain_result, "MID")
+    unknown = calculate_composite_score(shield_result, momentum_result, brain_result, "???")
+    
+    assert mid["timing_score"] == 50
+    assert unknown["timing_score"] == 20
+
+
+@pytest.mark.parametrize("args", [
+    (85.0, 80.0, 0, math.nan, 35.0, 1.8),
+    (65.0, 60.0, 2, math.nan, -5.0, math.nan),
+    (120.0, -10.0, 1, 72.5, 0.0, 0.5),
+    (0.0, 0.0, 2, math.nan, 60.0, 0.0),
+])
+def test_composite_core_matches_python(args):
+    """Test the (possibly JIT-compiled) core matches the Python implementation."""
+    full_args = args + (50.0, 0.35, 0.25, 0.20, 0.20)
+    
+    assert _composite_core(*full_args) == pytest.approx(_composite_core_py(*full_args))
+
+
+def test_composite_scores_batch_matches_scalar():
+    """Test batch scoring agrees with calculate_composite_score row by row."""
+    cases = [
+        ({"safety_score": 85}, {"price_velocity": 35, "buy_sell_ratio": 1.8}, {"relevance_score": 80}, "EARLY"),
+        ({"safety_score": 65}, {"price_velocity": -5, "buy_sell_ratio": None}, {"relevance_score": 60}, "LATE"),
+        ({"safety_score": 75}, {"price_velocity": 55, "buy_sell_ratio": 0.8,
+                                "enhanced_momentum_score": 42}, {"relevance_score": 70}, "MID"),
+        ({"safety_score": 0}, {"price_velocity": 0, "buy_sell_ratio": 0}, {"relevance_score": 0}, "LATE"),
+    ]
+    
+    batch = calculate_composite_scores_batch(
+        safety=[c[0]["safety_score"] for c in cases],
+        price_velocity=[c[1]["price_velocity"] for c in cases],
+        buy_sell_ratio=[math.nan if c[1]["buy_sell_ratio"] is None else c[1]["buy_sell_ratio"] for c in cases],
+        relevance=[c[2]["relevance_score"] for c in cases],
+        phase_codes=[{"EARLY": 0, "MID": 1, "LATE": 2}[c[3]] for c in cases],
+        momentum=[c[1].get("enhanced_momentum_score", math.nan) for c in cases],
+    )
+    
+    assert batch.shape == (4, 5)
+    for row, (shield, momentum, brain, phase) in zip(batch, cases):
+        scalar = calculate_composite_score(shield, momentum, brain, phase)
+        assert row[0] == pytest.approx(scalar["composite_score"], abs=0.05)
+        assert row[3] == pytest.approx(scalar["momentum_score"], abs=0.05)
+
+
 # =============================================================================
 # ALERT THRESHOLD TESTS
 # =============================================================================
@@ -259,6 +318,25 @@ def test_should_alert_boundary_individual_pass():
     assert should_alert(score_data) is True
 
 
+def test_should_alert_batch_matches_scalar():
+    """Test batch alert mask agrees with should_alert row by row."""
+    rows = [
+        (85, {"safety": 75, "timing": 80, "momentum": 70, "relevance": 85}),
+        (70, {"safety": 75, "timing": 80, "momentum": 70, "relevance": 85}),
+        (70.1, {"safety": 75, "timing": 80, "momentum": 70, "relevance": 85}),
+        (71, {"safety": 75, "timing": 80, "momentum": 40, "relevance": 75}),
+        (71, {"safety": 75, "timing": 80, "momentum": 40.1, "relevance": 75}),
+    ]
+    composites = [composite for composite, _ in rows]
+    individuals = [list(ind.values()) for _, ind in rows]
+    
+    mask = should_alert_batch(composites, individuals)
+    
+    assert mask.tolist() == [
+        should_alert({"composite_score": c, "individual_scores": ind}) for c, ind in rows
+    ]
+
+
 # =============================================================================
 # SCORE FORMATTING TESTS
 # =============================================================================
@@ -331,6 +409,21 @@ def test_format_score_telegram_message_no_alert():
     assert "Below alert threshold" in message or "❌" in message
 
 
+@pytest.mark.parametrize("score,stars", [
+    (-5, 0),
+    (0, 0),
+    (19.9, 0),
+    (20, 1),
+    (59.9, 2),
+    (85, 4),
+    (100, 5),
+    (120, 5),
+])
+def test_score_to_stars(score, stars):
+    """Test star lookup is one star per 20 points, clamped to 0-5."""
+    assert _score_to_stars(score) == "⭐" * stars
+
+
 def test_format_score_output_zero_scores():
     """Test score output formatting with zero scores."""
     score_data = {
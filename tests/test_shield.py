@@ -8,13 +8,17 @@ Tests cover:
 - Comprehensive security check
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 from shield import (
+    _get_holders_from_rpc,
     check_holder_concentration,
     check_honeypot,
     check_bundled_transactions,
     comprehensive_security_check,
+    HoneypotCheck,
     LEVEL_DANGER,
     LEVEL_WARNING,
     LEVEL_OK,
@@ -22,46 +26,65 @@ from shield import (
 )
 
 
+# =============================================================================
+# SHARED HOLDER PAYLOADS
+# =============================================================================
+# Plain dicts shared read-only across tests instead of being rebuilt per test.
+
+# Top 10 = 40M, rest = 60M -> 40% (safe distribution)
+_HOLDER_LIST_SAFE = [
+    {"amount": "10000000"},  # 10%
+    {"amount": "8000000"},   # 8%
+    {"amount": "5000000"},   # 5%
+    {"amount": "4000000"},   # 4%
+    {"amount": "3000000"},   # 3%
+    {"amount": "3000000"},   # 3%
+    {"amount": "2000000"},   # 2%
+    {"amount": "2000000"},   # 2%
+    {"amount": "2000000"},   # 2%
+    {"amount": "1000000"},   # 1%
+    {"amount": "60000000"},  # Rest = 60M
+]
+
+# Top 10 = 86M, rest = 14M -> 86% (concentrated)
+_HOLDER_LIST_DANGER = [
+    {"amount": "60000000"},  # 60%
+    {"amount": "10000000"},  # 10%
+    {"amount": "5000000"},   # 5%
+    {"amount": "3000000"},   # 3%
+    {"amount": "2000000"},   # 2%
+    {"amount": "2000000"},   # 2%
+    {"amount": "1000000"},   # 1%
+    {"amount": "1000000"},   # 1%
+    {"amount": "1000000"},   # 1%
+    {"amount": "1000000"},   # 1%
+    {"amount": "14000000"},  # Remaining 14%
+]
+
+# Top 10 = 45%, slightly concentrated but not >50%
+_HOLDER_LIST_MIXED = [
+    {"amount": "15000000"},  # 15%
+    {"amount": "10000000"},  # 10%
+    {"amount": "5000000"},   # 5%
+    {"amount": "3000000"},   # 3%
+    {"amount": "3000000"},   # 3%
+    {"amount": "2000000"},   # 2%
+    {"amount": "2000000"},   # 2%
+    {"amount": "2000000"},   # 2%
+    {"amount": "2000000"},   # 2%
+    {"amount": "1000000"},   # 1%
+    {"amount": "55000000"},  # Rest
+]
+
+
 # =============================================================================
 # HOLDER CONCENTRATION TESTS
 # =============================================================================
 
 def test_holder_concentration_safe(high_quality_token):
     """Test holder concentration check with safe distribution."""
-    # Mock RPC to return safe distribution
-    # Total amounts must add up such that top 10 is <50%
     with patch('shield._get_holders_from_rpc') as mock_rpc:
-        mock_rpc.return_value = [
-            {"amount": "20000000"},  # 20%
-            {"amount": "10000000"},  # 10%
-            {"amount": "10000000"},  # 10%
-            {"amount": "5000000"},   # 5%
-            {"amount": "5000000"},   # 5%
-            {"amount": "5000000"},   # 5%
-            {"amount": "5000000"},   # 5%
-            {"amount": "5000000"},   # 5%
-            {"amount": "5000000"},   # 5%
-            {"amount": "5000000"},   # 5%
-            {"amount": "30000000"},  # Remaining 30% distributed
-            # Top 10: 75M / 125M = 60%, need to adjust
-        ]
-        
-        # Actually, let's make top 10 be 40%
-        mock_rpc.return_value = [
-            {"amount": "10000000"},  # 10%
-            {"amount": "8000000"},   # 8%
-            {"amount": "5000000"},   # 5%
-            {"amount": "4000000"},   # 4%
-            {"amount": "3000000"},   # 3%
-            {"amount": "3000000"},   # 3%
-            {"amount": "2000000"},   # 2%
-            {"amount": "2000000"},   # 2%
-            {"amount": "2000000"},   # 2%
-            {"amount": "1000000"},   # 1%
-            # Top 10 = 40M
-            {"amount": "60000000"},  # Rest = 60M
-            # Total = 100M, Top 10 = 40%
-        ]
+        mock_rpc.return_value = _HOLDER_LIST_SAFE
         
         result = check_holder_concentration("test_mint", verbose=False)
         
@@ -73,19 +96,7 @@ def test_holder_concentration_danger(low_quality_token):
     """Test holder concentration check with dangerous distribution."""
     # Mock RPC to return concentrated distribution (85% top 10)
     with patch('shield._get_holders_from_rpc') as mock_rpc:
-        mock_rpc.return_value = [
-            {"amount": "60000000"},  # 60%
-            {"amount": "10000000"},  # 10%
-            {"amount": "5000000"},   # 5%
-            {"amount": "3000000"},   # 3%
-            {"amount": "2000000"},   # 2%
-            {"amount": "2000000"},   # 2%
-            {"amount": "1000000"},   # 1%
-            {"amount": "1000000"},   # 1%
-            {"amount": "1000000"},   # 1%
-            {"amount": "1000000"},   # 1%
-            {"amount": "14000000"},  # Remaining 14%
-        ]
+        mock_rpc.return_value = _HOLDER_LIST_DANGER
         
         result = check_holder_concentration("test_mint", verbose=False)
         
@@ -93,6 +104,27 @@ def test_holder_concentration_danger(low_quality_token):
         assert result["top10_percent"] > 50  # Above danger threshold
 
 
+def test_holder_concentration_full_rpc_page():
+    """Test a full 20-account RPC page, including a blank amount."""
+    holders = [{"amount": "5000000"}] * 10 + [{"amount": ""}] + [{"amount": "5000000"}] * 9
+    with patch('shield._get_holders_from_rpc') as mock_rpc:
+        mock_rpc.return_value = holders
+        
+        result = check_holder_concentration("test_mint", verbose=False)
+        
+        assert result["source"] == "rpc"
+        assert result["top10_percent"] == pytest.approx(100 * 10 / 19, abs=0.01)
+
+
+def test_get_holders_from_rpc_decodes_raw_body(mock_solana_rpc_holders, fake_response):
+    """Test the RPC holder fetch decodes the raw response bytes."""
+    body = json.dumps(mock_solana_rpc_holders).encode()
+    with patch('shield.requests.post', return_value=fake_response(content=body)):
+        holders = _get_holders_from_rpc("test_mint", verbose=False)
+    
+    assert holders == mock_solana_rpc_holders["result"]["value"]
+
+
 def test_holder_concentration_unknown():
     """Test holder concentration when data unavailable."""
     with patch('shield._get_holders_from_rpc') as mock_rpc, \
@@ -129,6 +161,38 @@ def test_honeypot_detection_danger(low_quality_token):
     assert "HONEYPOT" in result["reason"]
 
 
+def test_honeypot_result_is_dict_compatible(low_quality_token):
+    """Test result records support attribute, key and .get access."""
+    result = check_honeypot(token_data=low_quality_token, verbose=False)
+    
+    assert isinstance(result, HoneypotCheck)
+    assert result.level == result["level"] == result.get("level") == LEVEL_DANGER
+    assert result.get("missing", "default") == "default"
+    assert set(result.keys()) == {"level", "h1_buys", "h1_sells", "reason"}
+    with pytest.raises(KeyError):
+        result["missing"]
+
+
+def test_honeypot_result_supports_dict_operations(low_quality_token):
+    """Test membership, items(), values(), dict() and == behave like the old dict."""
+    result = check_honeypot(token_data=low_quality_token, verbose=False)
+    as_dict = {
+        "level": result.level,
+        "h1_buys": result.h1_buys,
+        "h1_sells": result.h1_sells,
+        "reason": result.reason,
+    }
+    
+    assert "level" in result
+    assert LEVEL_DANGER not in result
+    assert dict(result) == as_dict
+    assert dict(result.items()) == as_dict
+    assert list(result.values()) == list(as_dict.values())
+    assert result == as_dict
+    assert result != dict(as_dict, level=LEVEL_UNKNOWN)
+    assert result == HoneypotCheck(*as_dict.values())
+
+
 def test_honeypot_detection_no_activity():
     """Test honeypot detection with no trading activity."""
     token_data = {
@@ -191,10 +255,9 @@ def test_bundled_tx_danger(low_quality_token):
 
 def test_bundled_tx_warning_very_new():
     """Test bundled transaction check with very new but active token."""
+    now_ms = 1_700_000_000_000
     token_data = {
-        "pairCreatedAt": int((pytest.importorskip('datetime').datetime.now(
-            pytest.importorskip('datetime').timezone.utc
-        ).timestamp() - 1800) * 1000),  # 30 min
+        "pairCreatedAt": now_ms - 30 * 60 * 1000,  # 30 min
         "txns": {
             "h1": {
                 "buys": 50,  # Above threshold but token very new
@@ -203,9 +266,10 @@ def test_bundled_tx_warning_very_new():
         }
     }
     
-    result = check_bundled_transactions(token_data=token_data, verbose=False)
+    result = check_bundled_transactions(token_data=token_data, verbose=False, now_ms=now_ms)
     
     assert result["level"] == LEVEL_WARNING
+    assert result["token_age_hours"] == 0.5
     assert result["token_age_hours"] < 1.0
 
 
@@ -221,20 +285,7 @@ def test_comprehensive_check_safe_token(high_quality_token, mock_rugcheck_safe):
         
         # Mock all checks to pass
         mock_security.return_value = (True, "Risk level: good")
-        # Top 10 = 40%, rest = 60% (safe distribution)
-        mock_holders.return_value = [
-            {"amount": "10000000"},  # 10%
-            {"amount": "8000000"},   # 8%
-            {"amount": "5000000"},   # 5%
-            {"amount": "4000000"},   # 4%
-            {"amount": "3000000"},   # 3%
-            {"amount": "3000000"},   # 3%
-            {"amount": "2000000"},   # 2%
-            {"amount": "2000000"},   # 2%
-            {"amount": "2000000"},   # 2%
-            {"amount": "1000000"},   # 1% -> Total 40%
-            {"amount": "60000000"},  # Rest
-        ]
+        mock_holders.return_value = _HOLDER_LIST_SAFE
         mock_dex.return_value = high_quality_token
         
         result = comprehensive_security_check(
@@ -283,20 +334,7 @@ def test_comprehensive_check_mixed_signals(high_quality_token):
         
         # Pass basic check but return warning
         mock_security.return_value = (True, "Risk level: ok")
-        # Top 10 = 45%, slightly concentrated but not >50%
-        mock_holders.return_value = [
-            {"amount": "15000000"},  # 15%
-            {"amount": "10000000"},  # 10%
-            {"amount": "5000000"},   # 5%
-            {"amount": "3000000"},   # 3%
-            {"amount": "3000000"},   # 3%
-            {"amount": "2000000"},   # 2%
-            {"amount": "2000000"},   # 2%
-            {"amount": "2000000"},   # 2%
-            {"amount": "2000000"},   # 2%
-            {"amount": "1000000"},   # 1% -> Total 45%
-            {"amount": "55000000"},  # Rest
-        ]
+        mock_holders.return_value = _HOLDER_LIST_MIXED
         mock_dex.return_value = high_quality_token
         
         result = comprehensive_security_check(
@@ -310,6 +348,123 @@ def test_comprehensive_check_mixed_signals(high_quality_token):
         assert result["safety_score"] >= 50
 
 
+def test_comprehensive_check_fast_fail_skips_network(low_quality_token):
+    """Test fast_fail stops after an in-memory DANGER before any network check."""
+    with patch('shield.check_security') as mock_security, \
+         patch('shield._get_holders_from_rpc') as mock_holders, \
+         patch('shield._get_token_data_from_dexscreener') as mock_dex:
+        
+        result = comprehensive_security_check(
+            "test_mint",
+            token_data=low_quality_token,
+            verbose=False,
+            fast_fail=True
+        )
+        
+        mock_security.assert_not_called()
+        mock_holders.assert_not_called()
+        mock_dex.assert_not_called()
+        assert result["is_safe"] is False
+        assert result["overall_level"] == LEVEL_DANGER
+        assert result["honeypot"]["level"] == LEVEL_DANGER
+        assert result["holder_concentration"]["level"] == LEVEL_UNKNOWN
+        assert result["goplus_security"]["level"] == LEVEL_UNKNOWN
+
+
+def test_comprehensive_check_fast_fail_keeps_result_shapes(low_quality_token):
+    """Test checks skipped by fast_fail still expose their usual fields."""
+    with patch('shield.check_security'), \
+         patch('shield._get_holders_from_rpc'), \
+         patch('shield._get_token_data_from_dexscreener'):
+        
+        result = comprehensive_security_check(
+            "test_mint",
+            token_data=low_quality_token,
+            verbose=False,
+            fast_fail=True
+        )
+        
+        assert result["social_presence"]["has_twitter"] is False
+        assert result["cabal_topology"]["is_cabal"] is False
+        assert result["holder_concentration"]["top10_percent"] is None
+        assert result["clone_detection"]["is_clone"] is False
+        assert result["news_validation"]["article_count"] == 0
+        assert result["goplus_security"]["checks"] == {}
+        assert result["rugcheck"]["is_safe"] is True
+
+
+def test_comprehensive_check_fast_fail_cancels_pending_fetches(high_quality_token, monkeypatch):
+    """Test a fast-fail exit cancels prefetches that have not run yet."""
+    import shield
+    from concurrent.futures import Future
+    
+    class _DeferredPool:
+        """Runs check_security immediately and leaves every other fetch pending."""
+        def __init__(self):
+            self.futures = {}
+        
+        def submit(self, fn, *args, **kwargs):
+            future = Future()
+            if fn is shield.check_security:
+                future.set_result(fn(*args, **kwargs))
+            self.futures[fn] = future
+            return future
+    
+    pool = _DeferredPool()
+    monkeypatch.setattr("shield._SECURITY_POOL", pool)
+    with patch('shield.check_security', return_value=(False, "Risk level: danger")), \
+         patch('shield._get_holders_from_rpc') as mock_holders:
+        
+        result = comprehensive_security_check(
+            "test_mint",
+            token_data=high_quality_token,
+            verbose=False,
+            fast_fail=True
+        )
+        
+        assert result["overall_level"] == LEVEL_DANGER
+        assert pool.futures[mock_holders].cancelled()
+        mock_holders.assert_not_called()
+
+
+def test_comprehensive_check_fetches_holders_once(high_quality_token, mock_rugcheck_safe):
+    """Test the prefetched RPC holder list is reused by the concentration check."""
+    with patch('shield.check_security') as mock_security, \
+         patch('shield._get_holders_from_rpc') as mock_holders, \
+         patch('shield._get_token_data_from_dexscreener') as mock_dex:
+        
+        mock_security.return_value = (True, "Risk level: good")
+        mock_holders.return_value = _HOLDER_LIST_SAFE
+        mock_dex.return_value = high_quality_token
+        
+        result = comprehensive_security_check("test_mint", verbose=False)
+        
+        assert mock_holders.call_count == 1
+        assert mock_dex.call_count == 1
+        assert result["holder_concentration"]["source"] == "rpc"
+
+
+def test_comprehensive_check_slow_fetch_fails_open(high_quality_token, monkeypatch):
+    """Test a fetch that exceeds the timeout falls back instead of blocking."""
+    import time
+    
+    def slow_security(*args, **kwargs):
+        time.sleep(0.5)
+        return (False, "Risk level: danger")
+    
+    monkeypatch.setattr("shield.SECURITY_IO_TIMEOUT_SECONDS", 0.05)
+    with patch('shield.check_security', side_effect=slow_security), \
+         patch('shield._get_holders_from_rpc', return_value=_HOLDER_LIST_SAFE):
+        
+        result = comprehensive_security_check(
+            "test_mint",
+            token_data=high_quality_token,
+            verbose=False
+        )
+        
+        assert result["rugcheck"] == {"is_safe": True, "reason": "Security check timed out"}
+
+
 def test_comprehensive_check_api_failures():
     """Test comprehensive security check handles API failures gracefully."""
     with patch('shield.check_security') as mock_security, \
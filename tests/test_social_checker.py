@@ -12,6 +12,12 @@ from unittest.mock import Mock, patch
 
 from social_checker import (
     check_social_presence,
+    SocialCheckResult,
+    count_social_flags,
+    TWITTER,
+    TELEGRAM,
+    DISCORD,
+    WEBSITE,
     LEVEL_OK,
     LEVEL_WARNING,
     LEVEL_UNKNOWN,
@@ -234,6 +240,90 @@ def test_check_social_presence_malformed_social_entry():
     assert result["has_twitter"] is True
 
 
+def test_check_social_presence_result_is_dict_compatible():
+    """Test the result record supports attribute, key, .get, membership and dict() access."""
+    token_data = {"info": {"socials": [{"type": "discord", "url": "https://discord.gg/example"}]}}
+    
+    result = check_social_presence(token_data, verbose=False)
+    
+    assert isinstance(result, SocialCheckResult)
+    assert result.has_discord is result["has_discord"] is result.get("has_discord") is True
+    assert result.social_count == 1
+    assert "social_count" in result
+    assert "has_twitter" in result
+    assert dict(result)["has_twitter"] is False
+    assert dict(result.items())["social_count"] == 1
+
+
+def test_check_social_presence_packs_flags():
+    """Test presence is packed into the flags bitmask."""
+    token_data = {
+        "info": {
+            "socials": [
+                {"type": "x", "url": "https://x.com/example"},
+                {"type": "website", "url": "https://example.com"},
+            ]
+        }
+    }
+    
+    result = check_social_presence(token_data, verbose=False)
+    
+    assert result.flags == TWITTER | WEBSITE
+    assert result["flags"] == TWITTER | WEBSITE
+    assert not result.flags & (TELEGRAM | DISCORD)
+
+
+def test_count_social_flags():
+    """Test per-platform counts across a batch of results."""
+    results = [
+        SocialCheckResult(LEVEL_OK, "", TWITTER | TELEGRAM),
+        SocialCheckResult(LEVEL_OK, "", TWITTER),
+        SocialCheckResult(LEVEL_WARNING, "", 0),
+    ]
+    
+    assert count_social_flags(results) == {"twitter": 2, "telegram": 1, "discord": 0, "website": 0}
+    assert count_social_flags([]) == {"twitter": 0, "telegram": 0, "discord": 0, "website": 0}
+
+
+def test_check_social_presence_missing_type_skipped():
+    """Test entries without a type are skipped instead of failing the check."""
+    token_data = {
+        "info": {
+            "socials": [
+                {"type": None, "url": "https://example.com/none"},
+                {"url": "https://example.com/missing"},
+                {"type": "telegram", "url": "https://t.me/example"},
+            ]
+        }
+    }
+    
+    result = check_social_presence(token_data, verbose=False)
+    
+    assert result["level"] == LEVEL_OK
+    assert result["social_count"] == 1
+    assert result["has_telegram"] is True
+
+
+def test_check_social_presence_malformed_entries_skipped():
+    """Test non-dict entries and non-string types are skipped, not reported as errors."""
+    token_data = {
+        "info": {
+            "socials": [
+                "not a dict",
+                123,
+                {"type": 123, "url": "https://example.com/number"},
+                {"type": "discord"},
+                {"type": "twitter", "url": "https://twitter.com/example"},
+            ]
+        }
+    }
+    
+    result = check_social_presence(token_data, verbose=False)
+    
+    assert result["level"] == LEVEL_OK
+    assert result["flags"] == TWITTER
+
+
 def test_check_social_presence_unknown_social_type():
     """Test social check ignores unknown social types."""
     token_data = {
@@ -254,6 +344,23 @@ def test_check_social_presence_unknown_social_type():
     assert result["has_twitter"] is True
 
 
+def test_check_social_presence_mixed_case_types():
+    """Test unusual casings still match through the .lower() fallback."""
+    token_data = {
+        "info": {
+            "socials": [
+                {"type": "X", "url": "https://x.com/example"},
+                {"type": "TeLeGrAm", "url": "https://t.me/example"},
+                {"type": "YouTube", "url": "https://youtube.com/example"},
+            ]
+        }
+    }
+    
+    result = check_social_presence(token_data, verbose=False)
+    
+    assert result["flags"] == TWITTER | TELEGRAM
+
+
 def test_check_social_presence_case_insensitive_types():
     """Test social check handles uppercase type names."""
     token_data = {
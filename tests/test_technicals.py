@@ -4,8 +4,11 @@ Tests for Technical Indicators Module (technicals.py).
 Tests RSI, EMA, MACD calculations and GeckoTerminal OHLCV fetching.
 """
 
+import aiohttp
+import numpy as np
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 from typing import List, Dict, Any
 
 
@@ -13,13 +16,48 @@ from typing import List, Dict, Any
 # TEST FIXTURES
 # =============================================================================
 
+def _ohlcv_fixture(ohlcv: List[Dict[str, Any]]) -> SimpleNamespace:
+    """Bundle candles with their closes as a float64 array (built once)."""
+    return SimpleNamespace(
+        ohlcv=ohlcv,
+        closes=np.array([candle["close"] for candle in ohlcv], dtype=np.float64),
+    )
+
+
 @pytest.fixture
-def sample_ohlcv_data() -> List[Dict[str, Any]]:
+def fake_session(monkeypatch, fake_aiohttp_session):
+    """Install a fake session (canned responses in order) as technicals' shared session."""
+    def install(*responses, error=None):
+        session = fake_aiohttp_session(responses, error)
+
+        async def _get_session():
+            return session
+
+        monkeypatch.setattr("technicals._get_session", _get_session)
+        return session
+
+    return install
+
+
+@pytest.fixture(autouse=True)
+def clear_signals_cache_before_test():
+    """Clear cached technical signals before and after each test."""
+    from technicals import clear_signals_cache
+
+    clear_signals_cache()
+    yield
+    clear_signals_cache()
+
+
+@pytest.fixture(scope="module")
+def sample_ohlcv_data() -> SimpleNamespace:
     """
     Sample OHLCV data for indicator calculations.
     
     40 candles with varying prices for testing RSI, EMA, MACD.
     (Need at least 35 for MACD: slow_period 26 + signal_period 9)
+    
+    Built once per module; tests only read it (.ohlcv candles, .closes array).
     """
     # Create realistic price data with ups and downs
     prices = [
@@ -43,11 +81,11 @@ def sample_ohlcv_data() -> List[Dict[str, Any]]:
             "close": close,
             "volume": 10000 + (i * 100)
         })
-    return ohlcv
+    return _ohlcv_fixture(ohlcv)
 
 
-@pytest.fixture
-def trending_up_ohlcv() -> List[Dict[str, Any]]:
+@pytest.fixture(scope="module")
+def trending_up_ohlcv() -> SimpleNamespace:
     """OHLCV data with clear uptrend for bullish signals."""
     prices = [100.0 + i * 2.0 for i in range(50)]  # Steady uptrend, 50 candles
     ohlcv = []
@@ -60,11 +98,11 @@ def trending_up_ohlcv() -> List[Dict[str, Any]]:
             "close": close,
             "volume": 10000
         })
-    return ohlcv
+    return _ohlcv_fixture(ohlcv)
 
 
-@pytest.fixture
-def trending_down_ohlcv() -> List[Dict[str, Any]]:
+@pytest.fixture(scope="module")
+def trending_down_ohlcv() -> SimpleNamespace:
     """OHLCV data with clear downtrend for bearish signals."""
     prices = [200.0 - i * 3.0 for i in range(50)]  # Steady downtrend, 50 candles
     ohlcv = []
@@ -77,7 +115,7 @@ def trending_down_ohlcv() -> List[Dict[str, Any]]:
             "close": close,
             "volume": 10000
         })
-    return ohlcv
+    return _ohlcv_fixture(ohlcv)
 
 
 @pytest.fixture
@@ -122,7 +160,7 @@ class TestCalculateEMA:
         """Test basic EMA calculation returns valid value."""
         from technicals import calculate_ema
         
-        closes = [candle["close"] for candle in sample_ohlcv_data]
+        closes = sample_ohlcv_data.closes
         ema = calculate_ema(closes, period=9)
         
         assert ema is not None
@@ -133,7 +171,7 @@ class TestCalculateEMA:
         """Test shorter EMA reacts faster (closer to recent prices)."""
         from technicals import calculate_ema
         
-        closes = [candle["close"] for candle in sample_ohlcv_data]
+        closes = sample_ohlcv_data.closes
         ema_short = calculate_ema(closes, period=5)
         ema_long = calculate_ema(closes, period=20)
         
@@ -157,6 +195,30 @@ class TestCalculateEMA:
         ema = calculate_ema([], period=9)
         assert ema is None
 
+    def test_indicators_short_input_skips_conversion(self):
+        """Test short or missing input returns None before building an array."""
+        from technicals import calculate_ema, calculate_rsi, calculate_macd
+        
+        with patch("technicals.np.asarray") as mock_asarray:
+            assert calculate_ema(None, period=9) is None
+            assert calculate_ema([100.0] * 5, period=9) is None
+            assert calculate_rsi([100.0] * 14, period=14) is None
+            assert calculate_macd([100.0] * 34) is None
+        
+        mock_asarray.assert_not_called()
+
+    def test_ema_matches_recurrence(self, sample_ohlcv_data):
+        """Test the vectorized EMA matches the SMA-seeded recurrence."""
+        from technicals import calculate_ema
+
+        closes = sample_ohlcv_data.closes
+        multiplier = 2 / (9 + 1)
+        expected = sum(closes[:9]) / 9
+        for close in closes[9:]:
+            expected = (close * multiplier) + (expected * (1 - multiplier))
+
+        assert calculate_ema(closes, period=9) == pytest.approx(expected, rel=1e-12)
+
 
 # =============================================================================
 # UNIT TESTS: calculate_rsi
@@ -169,7 +231,7 @@ class TestCalculateRSI:
         """Test RSI is always between 0 and 100."""
         from technicals import calculate_rsi
         
-        closes = [candle["close"] for candle in sample_ohlcv_data]
+        closes = sample_ohlcv_data.closes
         rsi = calculate_rsi(closes, period=14)
         
         assert rsi is not None
@@ -179,7 +241,7 @@ class TestCalculateRSI:
         """Test RSI > 50 for uptrending data."""
         from technicals import calculate_rsi
         
-        closes = [candle["close"] for candle in trending_up_ohlcv]
+        closes = trending_up_ohlcv.closes
         rsi = calculate_rsi(closes, period=14)
         
         assert rsi is not None
@@ -189,12 +251,26 @@ class TestCalculateRSI:
         """Test RSI < 50 for downtrending data."""
         from technicals import calculate_rsi
         
-        closes = [candle["close"] for candle in trending_down_ohlcv]
+        closes = trending_down_ohlcv.closes
         rsi = calculate_rsi(closes, period=14)
         
         assert rsi is not None
         assert rsi < 50  # Strong downtrend should have RSI < 50
 
+    def test_rsi_repeated_window_is_cached(self, sample_ohlcv_data, monkeypatch):
+        """Test an unchanged window is served from the indicator cache (NumPy kernels)."""
+        import technicals
+
+        monkeypatch.setattr("technicals._KERNELS_COMPILED", False)
+        closes = sample_ohlcv_data.closes
+        with patch("technicals._rsi_core", wraps=technicals._rsi_core) as mock_core:
+            first = technicals.calculate_rsi(closes, period=14)
+            second = technicals.calculate_rsi(list(closes), period=14)
+            technicals.calculate_rsi(closes, period=7)
+
+        assert first == second
+        assert mock_core.call_count == 2
+
     def test_rsi_insufficient_data(self):
         """Test RSI returns None when insufficient data."""
         from technicals import calculate_rsi
@@ -223,7 +299,7 @@ class TestCalculateMACD:
         """Test MACD returns tuple of (macd_line, signal_line, histogram)."""
         from technicals import calculate_macd
         
-        closes = [candle["close"] for candle in sample_ohlcv_data]
+        closes = sample_ohlcv_data.closes
         result = calculate_macd(closes)
         
         assert result is not None
@@ -239,7 +315,7 @@ class TestCalculateMACD:
         """Test histogram equals MACD line minus signal line."""
         from technicals import calculate_macd
         
-        closes = [candle["close"] for candle in sample_ohlcv_data]
+        closes = sample_ohlcv_data.closes
         macd_line, signal_line, histogram = calculate_macd(closes)
         
         # Allow small floating point tolerance
@@ -249,12 +325,21 @@ class TestCalculateMACD:
         """Test MACD line > signal line in strong uptrend (bullish)."""
         from technicals import calculate_macd
         
-        closes = [candle["close"] for candle in trending_up_ohlcv]
+        closes = trending_up_ohlcv.closes
         macd_line, signal_line, histogram = calculate_macd(closes)
         
         # In strong uptrend, histogram should be positive
         assert histogram > 0
 
+    def test_macd_line_matches_ema_difference(self, sample_ohlcv_data):
+        """Test the fused MACD line equals EMA(fast) - EMA(slow)."""
+        from technicals import calculate_ema, calculate_macd
+
+        closes = sample_ohlcv_data.closes
+        macd_line, _, _ = calculate_macd(closes)
+
+        assert macd_line == pytest.approx(calculate_ema(closes, 12) - calculate_ema(closes, 26), rel=1e-9)
+
     def test_macd_insufficient_data(self):
         """Test MACD returns None when insufficient data."""
         from technicals import calculate_macd
@@ -272,6 +357,27 @@ class TestCalculateMACD:
         assert result is None
 
 
+class TestIndicatorKernels:
+    """Tests that the (possibly JIT-compiled) kernels match the NumPy forms."""
+
+    def test_kernels_match_numpy(self, sample_ohlcv_data):
+        """Test EMA/RSI/MACD kernels agree with the NumPy closed forms."""
+        from technicals import (
+            _ema_core, _ema_core_loop, _ema_core_np,
+            _rsi_core, _rsi_core_loop, _rsi_core_np,
+            _macd_core, _macd_core_loop, _macd_core_np,
+        )
+
+        closes = sample_ohlcv_data.closes
+
+        for core in (_ema_core, _ema_core_loop):
+            assert core(closes, 9) == pytest.approx(_ema_core_np(closes, 9), rel=1e-12)
+        for core in (_rsi_core, _rsi_core_loop):
+            assert core(closes, 14) == pytest.approx(_rsi_core_np(closes, 14), rel=1e-12)
+        for core in (_macd_core, _macd_core_loop):
+            assert core(closes, 12, 26, 9) == pytest.approx(_macd_core_np(closes, 12, 26, 9), rel=1e-9)
+
+
 # =============================================================================
 # UNIT TESTS: fetch_ohlcv
 # =============================================================================
@@ -280,74 +386,96 @@ class TestFetchOHLCV:
     """Tests for GeckoTerminal OHLCV fetching."""
 
     @pytest.mark.asyncio
-    async def test_fetch_ohlcv_success(self, mock_geckoterminal_response):
+    async def test_fetch_ohlcv_success(self, mock_geckoterminal_response, fake_session, fake_aiohttp_response):
         """Test successful OHLCV fetch from GeckoTerminal."""
-        from technicals import fetch_ohlcv
+        from technicals import OHLCV, fetch_ohlcv
         
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_response = AsyncMock()
-            mock_response.status = 200
-            mock_response.json = AsyncMock(return_value=mock_geckoterminal_response)
-            mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_response.__aexit__ = AsyncMock(return_value=None)
-            
-            mock_ctx = MagicMock()
-            mock_ctx.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_ctx.__aexit__ = AsyncMock(return_value=None)
-            
-            mock_session_instance = MagicMock()
-            mock_session_instance.get = MagicMock(return_value=mock_ctx)
-            mock_session_instance.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_session.return_value = mock_session_instance
-            
-            result = await fetch_ohlcv("test_pool_address")
-            
-            assert result is not None
-            assert isinstance(result, list)
-            assert len(result) > 0
-            assert "close" in result[0]
+        session = fake_session(fake_aiohttp_response(200, mock_geckoterminal_response))
+        
+        result = await fetch_ohlcv("test_pool_address")
+        
+        assert len(session.requested_urls) == 1
+        assert "test_pool_address" in session.requested_urls[0]
+        assert result is not None
+        assert isinstance(result, OHLCV)
+        assert len(result) > 0
+        assert "close" in result[0]
+        assert result[0]["close"] == 100.5
+        assert result.close.dtype == np.float64
+
+    def test_ohlcv_from_rows_sorts_and_parses(self):
+        """Test rows are parsed column-wise and sorted oldest first."""
+        from technicals import OHLCV
+
+        ohlcv = OHLCV.from_rows([
+            [1700000060, "101.0", "102.0", "100.0", "101.5", "11000"],
+            [1700000000, "100.0", "101.0", "99.0", "100.5", "10000"],
+        ])
+
+        assert ohlcv.timestamp.tolist() == [1700000000, 1700000060]
+        assert ohlcv.close.tolist() == [100.5, 101.5]
+        assert ohlcv.close.flags.c_contiguous
+        assert ohlcv[-1] == {
+            "timestamp": 1700000060, "open": 101.0, "high": 102.0,
+            "low": 100.0, "close": 101.5, "volume": 11000.0,
+        }
 
     @pytest.mark.asyncio
-    async def test_fetch_ohlcv_api_error(self):
+    async def test_fetch_ohlcv_api_error(self, fake_session, fake_aiohttp_response):
         """Test OHLCV fetch handles API errors gracefully."""
         from technicals import fetch_ohlcv
         
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_response = AsyncMock()
-            mock_response.status = 500
-            mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_response.__aexit__ = AsyncMock(return_value=None)
-            
-            mock_ctx = MagicMock()
-            mock_ctx.__aenter__ = AsyncMock(return_value=mock_response)
-            mock_ctx.__aexit__ = AsyncMock(return_value=None)
-            
-            mock_session_instance = MagicMock()
-            mock_session_instance.get = MagicMock(return_value=mock_ctx)
-            mock_session_instance.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_session.return_value = mock_session_instance
-            
-            result = await fetch_ohlcv("test_pool_address")
-            
-            assert result is None
+        fake_session(fake_aiohttp_response(500))
+        
+        result = await fetch_ohlcv("test_pool_address")
+        
+        assert result is None
 
     @pytest.mark.asyncio
-    async def test_fetch_ohlcv_network_error(self):
+    async def test_fetch_ohlcv_network_error(self, fake_session):
         """Test OHLCV fetch handles network errors gracefully."""
         from technicals import fetch_ohlcv
         
-        with patch("aiohttp.ClientSession") as mock_session:
-            mock_session_instance = MagicMock()
-            mock_session_instance.get = MagicMock(side_effect=Exception("Network error"))
-            mock_session_instance.__aenter__ = AsyncMock(return_value=mock_session_instance)
-            mock_session_instance.__aexit__ = AsyncMock(return_value=None)
-            mock_session.return_value = mock_session_instance
-            
-            result = await fetch_ohlcv("test_pool_address")
-            
-            assert result is None
+        fake_session(error=aiohttp.ClientError("Network error"))
+        
+        result = await fetch_ohlcv("test_pool_address")
+        
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_session_is_shared(self):
+        """Test fetches reuse one session until it is closed."""
+        from technicals import _get_session, close_session
+
+        try:
+            session = await _get_session()
+            assert await _get_session() is session
+
+            await close_session()
+            assert session.closed
+            assert await _get_session() is not session
+        finally:
+            await close_session()
+
+    def test_get_session_closes_previous_loops_session(self):
+        """Test a session from an earlier event loop is closed, not leaked, when replaced."""
+        import asyncio
+        import gc
+        import warnings
+        from technicals import _get_session, close_session
+
+        first = asyncio.run(_get_session())
+        second = asyncio.run(_get_session())
+        asyncio.run(close_session())
+
+        assert second is not first
+        assert first.closed
+        assert second.closed
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            del first, second
+            gc.collect()
+        assert not [w for w in caught if "Unclosed" in str(w.message)]
 
 
 # =============================================================================
@@ -363,7 +491,7 @@ class TestGetTechnicalSignals:
         from technicals import get_technical_signals
         
         with patch("technicals.fetch_ohlcv", new_callable=AsyncMock) as mock_fetch:
-            mock_fetch.return_value = trending_up_ohlcv
+            mock_fetch.return_value = trending_up_ohlcv.ohlcv
             
             signals = await get_technical_signals("test_pool_address")
             
@@ -383,13 +511,13 @@ class TestGetTechnicalSignals:
         
         # Test bullish trend
         with patch("technicals.fetch_ohlcv", new_callable=AsyncMock) as mock_fetch:
-            mock_fetch.return_value = trending_up_ohlcv
+            mock_fetch.return_value = trending_up_ohlcv.ohlcv
             signals = await get_technical_signals("test_pool_address")
             assert signals["trend"] == "bullish"
         
         # Test bearish trend
         with patch("technicals.fetch_ohlcv", new_callable=AsyncMock) as mock_fetch:
-            mock_fetch.return_value = trending_down_ohlcv
+            mock_fetch.return_value = trending_down_ohlcv.ohlcv
             signals = await get_technical_signals("test_pool_address")
             assert signals["trend"] == "bearish"
 
@@ -425,6 +553,234 @@ class TestGetTechnicalSignals:
             assert signals is None or signals.get("rsi") is None
 
 
+    @pytest.mark.asyncio
+    async def test_get_technical_signals_reuses_unchanged_window(self, trending_up_ohlcv):
+        """Test indicators are only recomputed when a new candle arrives."""
+        import technicals
+        from technicals import get_technical_signals
+
+        with patch("technicals.fetch_ohlcv", new_callable=AsyncMock) as mock_fetch, \
+                patch.object(technicals._default, "snapshot", wraps=technicals._default.snapshot) as mock_snapshot, \
+                patch.object(technicals._default, "seed", wraps=technicals._default.seed) as mock_seed:
+            mock_fetch.return_value = trending_up_ohlcv.ohlcv
+            first = await get_technical_signals("test_pool_address")
+            second = await get_technical_signals("test_pool_address")
+
+            assert second is first
+            assert mock_snapshot.call_count == 1
+
+            candles = trending_up_ohlcv.ohlcv
+            mock_fetch.return_value = candles[1:] + [
+                dict(candles[-1], timestamp=candles[-1]["timestamp"] + 60, close=250.0)
+            ]
+            third = await get_technical_signals("test_pool_address")
+
+            assert third is not first
+            assert mock_snapshot.call_count == 2
+            # The new candle was folded into the existing state, not reseeded
+            assert mock_seed.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_technical_signals_incremental_matches_full_history(self):
+        """Test incremental updates equal a full recompute over every candle seen."""
+        from technicals import get_technical_signals, _default
+
+        closes = 100.0 + 5.0 * np.sin(np.arange(60) / 3.0) + np.arange(60) * 0.2
+        candles = [
+            {"timestamp": 1700000000 + i * 60, "open": c, "high": c, "low": c, "close": c, "volume": 1000}
+            for i, c in enumerate(closes.tolist())
+        ]
+        with patch("technicals.fetch_ohlcv", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = candles[:40]
+            await get_technical_signals("test_pool_address")
+            mock_fetch.return_value = candles[15:60]
+            signals = await get_technical_signals("test_pool_address")
+
+        expected = _default.compute(closes)
+        for key in ("rsi", "ema_short", "ema_long", "macd", "signal", "histogram"):
+            assert signals[key] == pytest.approx(expected[key], rel=1e-9)
+
+    @pytest.mark.asyncio
+    async def test_get_technical_signals_gap_reseeds(self, sample_ohlcv_data):
+        """Test a window that no longer contains the state's candle reseeds it."""
+        import technicals
+        from technicals import get_technical_signals
+
+        candles = sample_ohlcv_data.ohlcv
+        with patch("technicals.fetch_ohlcv", new_callable=AsyncMock) as mock_fetch, \
+                patch.object(technicals._default, "seed", wraps=technicals._default.seed) as mock_seed:
+            mock_fetch.return_value = candles
+            await get_technical_signals("test_pool_address")
+            mock_fetch.return_value = [
+                dict(candle, timestamp=candle["timestamp"] + 3600) for candle in candles
+            ]
+            signals = await get_technical_signals("test_pool_address")
+
+        assert mock_seed.call_count == 2
+        expected = technicals._default.compute(sample_ohlcv_data.closes)
+        assert signals["rsi"] == pytest.approx(expected["rsi"], rel=1e-9)
+
+    @pytest.mark.asyncio
+    async def test_get_technical_signals_concurrent_callers_share_fetch(self, trending_up_ohlcv):
+        """Test concurrent callers for one pool share a single OHLCV fetch."""
+        import asyncio
+        from technicals import get_technical_signals
+
+        async def slow_fetch(pool_address):
+            await asyncio.sleep(0.01)
+            return trending_up_ohlcv.ohlcv
+
+        with patch("technicals.fetch_ohlcv", side_effect=slow_fetch) as mock_fetch:
+            results = await asyncio.gather(
+                *(get_technical_signals("test_pool_address") for _ in range(5))
+            )
+
+            assert mock_fetch.call_count == 1
+            assert all(result is results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_get_technical_signals_waiters_get_this_rounds_failure(self, trending_up_ohlcv):
+        """Test callers sharing a failed fetch get None, not a previous round's signals."""
+        import asyncio
+        import technicals
+        from technicals import get_technical_signals
+
+        async def failing_fetch(pool_address):
+            await asyncio.sleep(0.01)
+            return None
+
+        with patch("technicals.fetch_ohlcv", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = trending_up_ohlcv.ohlcv
+            assert await get_technical_signals("test_pool_address") is not None
+
+            mock_fetch.side_effect = failing_fetch
+            results = await asyncio.gather(
+                *(get_technical_signals("test_pool_address") for _ in range(3))
+            )
+
+        assert results == [None, None, None]
+        assert mock_fetch.call_count == 2
+        assert technicals._signals_inflight == {}
+
+
+    @pytest.mark.asyncio
+    async def test_get_technical_signals_many_bounds_concurrency(self, trending_up_ohlcv):
+        """Test many pools are fetched concurrently, bounded, in input order."""
+        import asyncio
+        from technicals import get_technical_signals_many
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_fetch(pool_address):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if pool_address == "bad_pool":
+                raise RuntimeError("boom")
+            return trending_up_ohlcv.ohlcv
+
+        pools = [f"pool_{i}" for i in range(6)] + ["bad_pool"]
+        with patch("technicals.fetch_ohlcv", side_effect=fake_fetch):
+            results = await get_technical_signals_many(pools, max_concurrency=3)
+
+        assert peak == 3
+        assert results[-1] is None
+        assert all(result["trend"] == "bullish" for result in results[:-1])
+
+    @pytest.mark.asyncio
+    async def test_get_technical_signals_many_keeps_loop_running(
+        self, real_rate_limiter, fake_session, fake_aiohttp_response, monkeypatch
+    ):
+        """Test rate-limited fetches wait with asyncio.sleep instead of blocking the loop."""
+        import asyncio
+        import time
+        import rate_limiter
+        from technicals import get_technical_signals_many
+
+        # 50ms between GeckoTerminal calls: 6 pools need at least 5 intervals
+        monkeypatch.setattr(rate_limiter, "_geckoterminal_limiter", rate_limiter.RateLimiter(1200))
+        fake_session(fake_aiohttp_response(500))
+
+        ticks = []
+        done = False
+
+        async def ticker():
+            while not done:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.005)
+
+        ticker_task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        results = await get_technical_signals_many([f"pool_{i}" for i in range(6)], max_concurrency=6)
+        elapsed = time.perf_counter() - start
+        done = True
+        await ticker_task
+
+        assert results == [None] * 6
+        assert elapsed >= 0.2
+        # A blocking sleep would freeze the ticker for the whole batch
+        assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.1
+
+
+class TestTechnicalsCalculator:
+    """Tests for the fixed-period indicator calculator."""
+
+    def test_compute_matches_indicator_functions(self, sample_ohlcv_data):
+        """Test compute() agrees with the individual calculate_* functions."""
+        from technicals import TechnicalsCalculator, calculate_ema, calculate_macd, calculate_rsi
+
+        closes = sample_ohlcv_data.closes
+        signals = TechnicalsCalculator(ema_short_period=5, ema_long_period=20).compute(closes)
+
+        assert signals["rsi"] == calculate_rsi(closes, 14)
+        assert signals["ema_short"] == calculate_ema(closes, 5)
+        assert signals["ema_long"] == calculate_ema(closes, 20)
+        assert (signals["macd"], signals["signal"], signals["histogram"]) == calculate_macd(closes)
+
+    def test_compute_insufficient_data(self, sample_ohlcv_data):
+        """Test compute() returns None below the longest indicator window."""
+        from technicals import TechnicalsCalculator
+
+        calculator = TechnicalsCalculator()
+
+        assert calculator.min_candles == 35
+        assert calculator.compute(sample_ohlcv_data.closes[:34]) is None
+
+
+class TestCalculateSignalsBatch:
+    """Tests for batch technical signals across pools."""
+
+    def test_batch_matches_per_pool(self, sample_ohlcv_data, trending_up_ohlcv, trending_down_ohlcv):
+        """Test batch signals agree with the per-pool indicator path."""
+        from technicals import OHLCV, _calculate_signals, calculate_signals_batch
+
+        datasets = [trending_up_ohlcv.ohlcv, sample_ohlcv_data.ohlcv, trending_down_ohlcv.ohlcv, sample_ohlcv_data.ohlcv[:10]]
+        batch = calculate_signals_batch([OHLCV.from_candles(data).close for data in datasets])
+
+        assert batch[3] is None
+        for data, result in zip(datasets[:3], batch):
+            expected = _calculate_signals("test_pool_address", OHLCV.from_candles(data))
+            assert result["trend"] == expected["trend"]
+            for key in ("rsi", "ema_short", "ema_long", "macd", "signal", "histogram"):
+                assert result[key] == pytest.approx(expected[key], rel=1e-9, abs=1e-12)
+
+    def test_batch_none_entry_gets_none_slot(self, sample_ohlcv_data):
+        """Test a missing series yields None without failing the rest of the batch."""
+        from technicals import OHLCV, _calculate_signals, calculate_signals_batch
+
+        closes = OHLCV.from_candles(sample_ohlcv_data.ohlcv).close
+        batch = calculate_signals_batch([None, closes, []])
+
+        assert batch[0] is None
+        assert batch[2] is None
+        expected = _calculate_signals("test_pool_address", OHLCV.from_candles(sample_ohlcv_data.ohlcv))
+        assert batch[1]["rsi"] == pytest.approx(expected["rsi"], rel=1e-9, abs=1e-12)
+
+
 # =============================================================================
 # EDGE CASE TESTS
 # =============================================================================